@@ -1,6 +1,24 @@
 """분석기"""
 
-from stock_analyzer.analyzers.ai_analyzer import AIAnalyzer
-from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stock_analyzer.analyzers.ai_analyzer import AIAnalyzer
+    from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
 
 __all__ = ["StockAnalyzer", "AIAnalyzer"]
+
+# 이름 → 모듈 (openai, TA-Lib 등 무거운 의존성은 실제 사용 시점에 import)
+_LAZY_IMPORTS = {
+    "StockAnalyzer": "stock_analyzer.analyzers.stock_analyzer",
+    "AIAnalyzer": "stock_analyzer.analyzers.ai_analyzer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """지연 import (PEP 562)"""
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,210 @@
 """OpenAI 기반 AI 분석기"""
 
+import asyncio
 import json
-
-from openai import OpenAI
+import re
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from rich.console import Console
 
+from stock_analyzer.analyzers.llm_cache import CompletionCache
+from stock_analyzer.analyzers.llm_pool import AsyncLLMPool
 from stock_analyzer.config import get_settings
 from stock_analyzer.models import AIAnalysis, Disclosure, NewsArticle
 
 console = Console(stderr=True)
 
+# 동시 OpenAI 요청 수 (RPM/TPM 한도는 요청 풀에서 별도 관리)
+MAX_CONCURRENT_REQUESTS = 8
+
+# 시스템 메시지 (요청마다 동일한 문자열을 재사용해 프롬프트 prefix 캐시 적용)
+SYSTEM_MSGS = {
+    "combined": (
+        "당신은 주식 시장 뉴스와 기업 공시를 분석하는 전문 애널리스트입니다. "
+        "JSON 형식으로만 응답하세요."
+    ),
+    "opinion": "당신은 객관적인 주식 시장 애널리스트입니다. 핵심을 5-10문장으로 분석하세요.",
+}
+
+# 프롬프트에 넣는 제목 최대 길이 (입력 토큰 절감)
+MAX_TITLE_CHARS = 120
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 뉴스 상세 분석을 요청할 최소 기사 수 (그보다 적으면 요약으로 충분)
+MIN_ARTICLES_FOR_ANALYSIS = 2
+
+# 통합 분석 최대 출력 토큰 (상세 분석 항목이 없으면 요약/감성만 생성)
+COMBINED_MAX_TOKENS = 1500
+COMBINED_BRIEF_MAX_TOKENS = 500
+
+# 허용 감성 값 (응답 값 검증용, 모듈 로드 시 한 번만 생성)
+_SENTIMENTS = frozenset({"POSITIVE", "NEGATIVE", "NEUTRAL"})
+
+# 감성 분석 응답 스키마 (structured outputs)
+SENTIMENT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "sentiment": {"type": "string", "enum": ["POSITIVE", "NEGATIVE", "NEUTRAL"]},
+        "score": {"type": "number", "minimum": -1, "maximum": 1},
+        "key_issues": {"type": "array", "items": {"type": "string"}, "maxItems": 5},
+    },
+    "required": ["sentiment", "score", "key_issues"],
+    "additionalProperties": False,
+}
+
+# 통합 분석 응답 스키마 (뉴스 요약 / 뉴스 분석 / 공시 분석 + 감성 분석)
+COMBINED_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "news_summary": {"type": "string"},
+        "news_analysis": {"type": "string"},
+        "disclosure_analysis": {"type": "string"},
+        **SENTIMENT_SCHEMA["properties"],
+    },
+    "required": [
+        "news_summary",
+        "news_analysis",
+        "disclosure_analysis",
+        *SENTIMENT_SCHEMA["required"],
+    ],
+    "additionalProperties": False,
+}
+
+_json_decoder = json.JSONDecoder()
+
+# AI 분석 전용 이벤트 루프 (백그라운드 스레드)
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _submit[T](coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """코루틴을 AI 분석 전용 루프에 제출
+
+    asyncio.run()은 호출마다 이벤트 루프를 닫아 AsyncOpenAI 커넥션 풀이
+    재사용되지 않으므로, 데몬 스레드에서 도는 루프 하나를 공유한다.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="ai-analyzer-loop",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop)
+
+
+def _run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """동기 코드에서 코루틴 실행 (완료까지 대기)"""
+    return _submit(coro).result()
+
+
+@lru_cache(maxsize=1)
+def _shared_client(api_key: str) -> AsyncOpenAI:
+    """공용 AsyncOpenAI 클라이언트 (keep-alive 커넥션 재사용)
+
+    재시도는 요청 풀에서 처리하므로 클라이언트 자체 재시도는 끈다.
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _shared_pool(rpm: int, tpm: int, max_concurrency: int) -> AsyncLLMPool:
+    """공용 요청 풀 (RPM/TPM 한도는 계정 단위이므로 프로세스 전체에서 공유)"""
+    return AsyncLLMPool(rpm=rpm, tpm=tpm, max_concurrency=max_concurrency)
+
+
+def _clean_title(title: str, max_chars: int) -> str:
+    """공백 정리 후 길이 제한"""
+    return _WHITESPACE.sub(" ", title).strip()[:max_chars]
+
+
+def _render_articles(
+    articles: list[NewsArticle],
+    max_items: int = 10,
+    max_chars: int = MAX_TITLE_CHARS,
+) -> str:
+    """뉴스 목록을 프롬프트용 텍스트로 변환"""
+    return "\n".join(
+        f"- [{a.source}] {_clean_title(a.title, max_chars)}"
+        for a in articles[:max_items]
+    )
+
+
+def _render_disclosures(
+    disclosures: list[Disclosure],
+    max_items: int = 10,
+    max_chars: int = MAX_TITLE_CHARS,
+) -> str:
+    """공시 목록을 프롬프트용 텍스트로 변환"""
+    return "\n".join(
+        f"- [{d.date}] {_clean_title(d.title, max_chars)} (공시자: {d.filer})"
+        for d in disclosures[:max_items]
+    )
+
+
+def _extract_json_string(partial: str, key: str) -> str | None:
+    """스트리밍 중인 JSON 텍스트에서 완성된 문자열 필드 값 추출 (미완성이면 None)"""
+    match = re.search(rf'"{key}"\s*:\s*', partial)
+    if not match:
+        return None
+    try:
+        value, _ = _json_decoder.raw_decode(partial, match.end())
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _normalize_sentiment(value: Any) -> str:
+    """감성 값 정규화 (허용 값이 아니면 NEUTRAL)"""
+    if isinstance(value, str):
+        value = value.strip().upper()
+        if value in _SENTIMENTS:
+            return value
+    return "NEUTRAL"
+
 
 class AIAnalyzer:
     """OpenAI 기반 AI 분석기"""
 
-    def __init__(self, model: str = "gpt-4o-mini") -> None:
-        settings = get_settings()
-        self._client: OpenAI | None = None
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        self._settings = get_settings()
+        self._client: AsyncOpenAI | None = None
         self._model = model
-
-        if settings.openai_api_key:
-            self._client = OpenAI(api_key=settings.openai_api_key)
+        self._pool: AsyncLLMPool | None = None
+        self._cache: CompletionCache | None = None
+
+        if self._settings.openai_api_key:
+            # 인스턴스가 여러 개여도 커넥션 풀과 요청 한도는 프로세스 전체에서 공유
+            self._client = _shared_client(self._settings.openai_api_key)
+            self._pool = _shared_pool(
+                self._settings.openai_rpm,
+                self._settings.openai_tpm,
+                max_concurrency,
+            )
+            if self._settings.llm_cache_ttl > 0:
+                try:
+                    self._cache = CompletionCache(
+                        self._settings.cache_dir / "llm", ttl=self._settings.llm_cache_ttl
+                    )
+                except Exception as e:
+                    console.print(f"  [yellow]⚠ AI 응답 캐시 비활성화: {e}[/yellow]")
         else:
             console.print("  [yellow]⚠ OPENAI_API_KEY 미설정 - AI 분석 비활성화[/yellow]")
 
@@ -29,6 +213,39 @@ class AIAnalyzer:
         """AI 분석 사용 가능 여부"""
         return self._client is not None
 
+    def _require_client(self) -> AsyncOpenAI:
+        """Batch API용 클라이언트 (API 키 미설정이면 예외)"""
+        if self._client is None:
+            raise RuntimeError("OPENAI_API_KEY 미설정 - Batch API를 사용할 수 없습니다.")
+        return self._client
+
+    async def _complete(
+        self,
+        on_delta: Callable[[str], None] | None = None,
+        **kwargs: Any,
+    ) -> str | None:
+        """chat.completions 요청 (응답 캐시, 요청 풀 속도 제한)
+
+        on_delta가 주어지면 스트리밍 조각을 도착 즉시 전달한다.
+        """
+        if self._pool is None or self._client is None:
+            return None
+
+        request = {"model": self._model, **kwargs}
+        key = CompletionCache.make_key(request)
+        if self._cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if on_delta:
+                    on_delta(cached)
+                return cached
+
+        content = await self._pool.complete(self._client, on_delta=on_delta, **request)
+
+        if self._cache and content:
+            self._cache.set(key, content)
+        return content
+
     def analyze(
         self,
         stock_name: str,
@@ -40,241 +257,319 @@ class AIAnalyzer:
         if not self._client:
             return None
 
-        try:
-            # 뉴스 요약
-            news_summary = self.summarize_news(stock_name, articles)
+        return _run_sync(
+            self.analyze_async(stock_name, articles, disclosures, report_data)
+        )
 
-            # 뉴스 상세 분석
-            news_analysis = self.analyze_news(stock_name, articles)
+    def analyze_background(
+        self,
+        stock_name: str,
+        articles: list[NewsArticle],
+        disclosures: list[Disclosure],
+        report_data: dict,
+    ) -> Future[AIAnalysis | None] | None:
+        """전체 AI 분석을 백그라운드로 시작하고 Future 반환 (클라이언트 없으면 None)"""
+        if not self._client:
+            return None
 
-            # 공시 분석
-            disclosure_analysis = self.analyze_disclosures(stock_name, disclosures)
+        return _submit(
+            self.analyze_async(stock_name, articles, disclosures, report_data)
+        )
 
-            # 감성 분석
-            sentiment, sentiment_score, key_issues = self.analyze_sentiment(
-                stock_name, articles, disclosures
-            )
+    async def analyze_async(
+        self,
+        stock_name: str,
+        articles: list[NewsArticle],
+        disclosures: list[Disclosure],
+        report_data: dict,
+    ) -> AIAnalysis | None:
+        """전체 AI 분석 수행 (비동기)"""
+        if not self._client:
+            return None
 
-            # 종합 의견 생성
-            overall_opinion = self.generate_opinion(
-                stock_name, report_data, news_summary, disclosure_analysis
+        try:
+            # 뉴스 요약 / 뉴스 분석 / 공시 분석 / 감성 분석 단일 요청 (스트리밍)
+            summary_ready: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+            if not articles:
+                summary_ready.set_result("뉴스 요약 없음")
+            buffer: list[str] = []
+
+            def on_delta(delta: str) -> None:
+                if summary_ready.done():
+                    return
+                buffer.append(delta)
+                summary = _extract_json_string("".join(buffer), "news_summary")
+                if summary is not None:
+                    summary_ready.set_result(summary or "뉴스 요약 생성 실패")
+
+            combined_task = asyncio.create_task(
+                self._combined_analysis(stock_name, articles, disclosures, on_delta)
             )
 
-            return AIAnalysis(
-                news_summary=news_summary,
-                news_analysis=news_analysis,
-                disclosure_analysis=disclosure_analysis,
-                sentiment=sentiment,
-                sentiment_score=sentiment_score,
-                key_issues=key_issues,
-                overall_opinion=overall_opinion,
+            # 종합 의견 생성 (뉴스 요약 필드가 완성되는 즉시 시작)
+            waiters: set[asyncio.Future[Any]] = {combined_task, summary_ready}
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            if summary_ready.done():
+                news_summary = summary_ready.result()
+            else:
+                news_summary = (await combined_task)["news_summary"]
+
+            overall_opinion = await self.generate_opinion(
+                stock_name, report_data, news_summary
             )
+            combined = await combined_task
+
+            return AIAnalysis(**combined, overall_opinion=overall_opinion)
 
         except Exception as e:
             console.print(f"  [red]✗ AI 분석 실패: {e}[/red]")
             return None
 
-    def summarize_news(
+    def analyze_batch(
         self,
-        stock_name: str,
-        articles: list[NewsArticle],
-    ) -> str:
-        """뉴스 핵심 요약"""
-        if not self._client or not articles:
-            return "뉴스 요약 없음"
-
-        news_text = "\n".join(
-            [f"- [{a.source}] {a.title}" for a in articles[:10]]
-        )
+        jobs: list[tuple[str, list[NewsArticle], list[Disclosure], dict]],
+    ) -> list[AIAnalysis | None]:
+        """Batch API로 여러 종목 AI 분석 (야간 일괄 리포트용)"""
+        if not self._client:
+            return [None] * len(jobs)
 
-        prompt = f"""다음은 {stock_name} 관련 최근 뉴스 헤드라인입니다.
-이 뉴스들의 핵심 내용을 3-4문장으로 요약해주세요.
-투자자 관점에서 중요한 정보를 중심으로 작성해주세요.
+        return _run_sync(self.analyze_batch_async(jobs))
 
-뉴스 목록:
-{news_text}
+    async def analyze_batch_async(
+        self,
+        jobs: list[tuple[str, list[NewsArticle], list[Disclosure], dict]],
+    ) -> list[AIAnalysis | None]:
+        """Batch API로 여러 종목 AI 분석 (비동기)
 
-요약:"""
+        종합 의견은 뉴스 요약 결과가 필요하므로 두 단계로 배치를 제출한다.
+        """
+        if not self._client or not jobs:
+            return [None] * len(jobs)
 
         try:
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 주식 시장 뉴스를 분석하는 전문 애널리스트입니다. 간결하고 명확하게 요약해주세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.3,
+            # 1단계: 뉴스 요약 / 뉴스 분석 / 공시 분석 / 감성 분석 (종목당 1건)
+            batch_requests = {
+                f"{i}-combined": self._combined_request(stock_name, articles, disclosures)
+                for i, (stock_name, articles, disclosures, _) in enumerate(jobs)
+                if articles or disclosures
+            }
+
+            results: dict[str, str] = {}
+            if batch_requests:
+                results = await self.wait_for_batch(await self.submit_batch(batch_requests))
+
+            combined = []
+            for i, (_, articles, disclosures, _) in enumerate(jobs):
+                try:
+                    combined.append(
+                        self._parse_combined(
+                            results.get(f"{i}-combined"), articles, disclosures
+                        )
+                    )
+                except Exception as e:
+                    console.print(f"  [red]✗ 통합 분석 실패: {e}[/red]")
+                    combined.append(self._parse_combined(None, articles, disclosures))
+
+            # 2단계: 종합 의견
+            opinion_requests = {
+                f"{i}-opinion": self._opinion_request(
+                    stock_name, report_data, combined[i]["news_summary"]
+                )
+                for i, (stock_name, _, _, report_data) in enumerate(jobs)
+            }
+            results.update(
+                await self.wait_for_batch(await self.submit_batch(opinion_requests))
             )
-            return response.choices[0].message.content or "요약 생성 실패"
         except Exception as e:
-            console.print(f"  [red]✗ 뉴스 요약 실패: {e}[/red]")
-            return "뉴스 요약 생성 실패"
+            console.print(f"  [red]✗ AI 배치 분석 실패: {e}[/red]")
+            return [None] * len(jobs)
 
-    def analyze_news(
+        return [
+            AIAnalysis(
+                **combined[i],
+                overall_opinion=results.get(f"{i}-opinion") or "종합 의견 생성 실패",
+            )
+            for i in range(len(jobs))
+        ]
+
+    async def submit_batch(self, batch_requests: dict[str, dict[str, Any]]) -> str:
+        """chat.completions 요청 묶음을 Batch API에 제출하고 batch ID 반환"""
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": self._model, **body},
+                }
+            )
+            for custom_id, body in batch_requests.items()
+        ]
+        client = self._require_client()
+        input_file = await client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        console.print(f"  [green]✓[/green] 배치 제출: {batch.id} ({len(lines)}건)")
+        return batch.id
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 10.0,
+        max_interval: float = 300.0,
+    ) -> dict[str, str]:
+        """배치 완료 대기 후 custom_id별 응답 텍스트 반환 (지수 백오프 폴링)"""
+        client = self._require_client()
+        delay = poll_interval
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"배치 {batch_id} 종료 상태: {batch.status}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_interval)
+
+        results: dict[str, str] = {}
+        if not batch.output_file_id:
+            return results
+
+        output = await client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            if content:
+                results[item["custom_id"]] = content
+        return results
+
+    async def _combined_analysis(
         self,
         stock_name: str,
         articles: list[NewsArticle],
-    ) -> str:
-        """뉴스 상세 분석 - 투자에 미치는 영향"""
-        if not self._client or not articles:
-            return ""
-
-        news_text = "\n".join(
-            [f"- [{a.source}] {a.title}" for a in articles[:10]]
-        )
-
-        prompt = f"""다음은 {stock_name} 관련 최근 뉴스 헤드라인입니다.
-투자 관점에서 핵심 내용을 분석해주세요.
-
-뉴스 목록:
-{news_text}
-
-분석 요청:
-- 사업/실적 관련 핵심 뉴스와 함의
-- 시장/업종 동향의 영향
-- 투자자 주목 포인트
-
-**5-10문장으로 작성하세요. 번호나 기호 없이 자연스러운 문장으로 작성하세요.**"""
+        disclosures: list[Disclosure],
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """뉴스 요약 / 뉴스 분석 / 공시 분석 / 감성 분석을 한 번의 요청으로 수행"""
+        if not self._client or (not articles and not disclosures):
+            return self._parse_combined(None, articles, disclosures)
 
         try:
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 주식 시장 뉴스를 분석하는 전문 애널리스트입니다. 핵심을 5-10문장으로 분석하세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.3,
+            content = await self._complete(
+                on_delta=on_delta,
+                **self._combined_request(stock_name, articles, disclosures),
             )
-            return response.choices[0].message.content or ""
+            return self._parse_combined(content, articles, disclosures)
         except Exception as e:
-            console.print(f"  [red]✗ 뉴스 분석 실패: {e}[/red]")
-            return ""
+            console.print(f"  [red]✗ 통합 분석 실패: {e}[/red]")
+            return self._parse_combined(None, articles, disclosures)
 
-    def analyze_disclosures(
+    def _combined_request(
         self,
         stock_name: str,
+        articles: list[NewsArticle],
         disclosures: list[Disclosure],
-    ) -> str:
-        """DART 공시 분석 - 공시 내용의 의미와 영향"""
-        if not self._client or not disclosures:
-            return ""
-
-        disclosure_text = "\n".join(
-            [f"- [{d.date[:4]}-{d.date[4:6]}-{d.date[6:]}] {d.title} (공시자: {d.filer})"
-             for d in disclosures[:10]]
+    ) -> dict[str, Any]:
+        """통합 분석 요청 파라미터"""
+        news_text = _render_articles(articles) if articles else "없음"
+        disclosure_text = _render_disclosures(disclosures) if disclosures else "없음"
+
+        # 입력이 없거나 적은 항목은 분석을 요청하지 않고 빈 문자열로 받는다
+        with_news_analysis = len(articles) >= MIN_ARTICLES_FOR_ANALYSIS
+        news_summary_item = (
+            "뉴스 핵심 내용을 투자자 관점에서 3-4문장으로 요약"
+            if articles else "빈 문자열"
+        )
+        news_analysis_item = (
+            "사업/실적 관련 핵심 뉴스와 함의, 시장/업종 동향의 영향, "
+            "투자자 주목 포인트를 5-10문장으로 분석"
+            if with_news_analysis else "빈 문자열"
+        )
+        disclosure_analysis_item = (
+            "주요 공시의 핵심 내용과 의미, 재무/경영 관련 시사점, "
+            "투자자 주의 사항을 5-10문장으로 분석"
+            if disclosures else "빈 문자열"
         )
 
-        prompt = f"""다음은 {stock_name}의 최근 DART 공시 목록입니다.
-투자 관점에서 핵심 내용을 분석해주세요.
+        prompt = f"""다음은 {stock_name} 관련 최근 뉴스 헤드라인과 DART 공시 목록입니다.
+
+뉴스 목록:
+{news_text}
 
 공시 목록:
 {disclosure_text}
 
-분석 요청:
-- 주요 공시의 핵심 내용과 의미
-- 재무/경영 관련 시사점
-- 투자자 주의 사항
-
-**5-10문장으로 작성하세요. 번호나 기호 없이 자연스러운 문장으로 작성하세요.**"""
-
-        try:
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 기업 공시 분석 전문가입니다. 핵심을 5-10문장으로 분석하세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.3,
-            )
-            return response.choices[0].message.content or ""
-        except Exception as e:
-            console.print(f"  [red]✗ 공시 분석 실패: {e}[/red]")
-            return ""
-
-    def analyze_sentiment(
-        self,
-        stock_name: str,
+다음 항목을 분석해 JSON으로 응답해주세요:
+- news_summary: {news_summary_item}
+- news_analysis: {news_analysis_item}
+- disclosure_analysis: {disclosure_analysis_item}
+- sentiment: 뉴스와 공시 전반의 감성 ("POSITIVE", "NEGATIVE", "NEUTRAL" 중 하나)
+- score: -1.0에서 1.0 사이의 숫자 (음수는 부정, 양수는 긍정)
+- key_issues: 주요 이슈 목록 (최대 5개)
+
+분석 문장은 번호나 기호 없이 자연스러운 문장으로 작성하세요."""
+
+        return {
+            "messages": [
+                {"role": "system", "content": SYSTEM_MSGS["combined"]},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": (
+                COMBINED_MAX_TOKENS
+                if with_news_analysis or disclosures
+                else COMBINED_BRIEF_MAX_TOKENS
+            ),
+            "temperature": 0.3,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "combined_analysis",
+                    "schema": COMBINED_SCHEMA,
+                    "strict": True,
+                },
+            },
+        }
+
+    @staticmethod
+    def _parse_combined(
+        content: str | None,
         articles: list[NewsArticle],
-        disclosures: list[Disclosure] | None = None,
-    ) -> tuple[str, float, list[str]]:
-        """감성 분석 (뉴스 + 공시)"""
-        if not self._client or (not articles and not disclosures):
-            return "NEUTRAL", 0.0, []
-
-        news_text = "\n".join(
-            [f"- [뉴스] {a.title}" for a in articles[:10]]
-        ) if articles else ""
-
-        disclosure_text = "\n".join(
-            [f"- [공시] {d.title}" for d in (disclosures or [])[:5]]
-        ) if disclosures else ""
-
-        combined_text = f"{news_text}\n{disclosure_text}".strip()
-
-        prompt = f"""다음은 {stock_name} 관련 최근 뉴스 및 DART 공시 목록입니다.
-전반적인 감성과 주요 이슈를 분석해주세요.
-
-목록:
-{combined_text}
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "sentiment": "POSITIVE" 또는 "NEGATIVE" 또는 "NEUTRAL",
-    "score": -1.0에서 1.0 사이의 숫자 (음수는 부정, 양수는 긍정),
-    "key_issues": ["이슈1", "이슈2", "이슈3"] (최대 5개)
-}}
-
-JSON:"""
-
-        try:
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 주식 시장 뉴스를 분석하는 전문 애널리스트입니다. JSON 형식으로만 응답하세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=300,
-                temperature=0.2,
-            )
-
-            content = response.choices[0].message.content or "{}"
-            # JSON 파싱
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-
-            result = json.loads(content.strip())
-
-            sentiment = result.get("sentiment", "NEUTRAL")
-            score = float(result.get("score", 0.0))
-            key_issues = result.get("key_issues", [])
-
-            return sentiment, score, key_issues
-
-        except Exception as e:
-            console.print(f"  [red]✗ 감성 분석 실패: {e}[/red]")
-            return "NEUTRAL", 0.0, []
+        disclosures: list[Disclosure],
+    ) -> dict[str, Any]:
+        """통합 분석 응답을 AIAnalysis 필드로 변환 (응답 없으면 기본값)"""
+        result = orjson.loads(content) if content else {}
 
-    def generate_opinion(
+        if not articles:
+            news_summary = "뉴스 요약 없음"
+        else:
+            news_summary = result.get("news_summary") or "뉴스 요약 생성 실패"
+
+        return {
+            "news_summary": news_summary,
+            "news_analysis": (
+                (result.get("news_analysis") or "")
+                if len(articles) >= MIN_ARTICLES_FOR_ANALYSIS
+                else ""
+            ),
+            "disclosure_analysis": (
+                (result.get("disclosure_analysis") or "") if disclosures else ""
+            ),
+            "sentiment": _normalize_sentiment(result.get("sentiment")),
+            "sentiment_score": max(-1.0, min(1.0, float(result.get("score", 0.0)))),
+            "key_issues": result.get("key_issues", []),
+        }
+
+    async def generate_opinion(
         self,
         stock_name: str,
         report_data: dict,
@@ -285,17 +580,37 @@ JSON:"""
         if not self._client:
             return "AI 분석 불가"
 
-        # 리포트 데이터에서 핵심 정보 추출
-        latest_price = report_data.get("latest_price", {})
+        try:
+            content = await self._complete(
+                **self._opinion_request(stock_name, report_data, news_summary)
+            )
+            return content or "종합 의견 생성 실패"
+        except Exception as e:
+            console.print(f"  [red]✗ 종합 의견 생성 실패: {e}[/red]")
+            return "종합 의견 생성 실패"
+
+    def _opinion_request(
+        self,
+        stock_name: str,
+        report_data: dict,
+        news_summary: str,
+    ) -> dict[str, Any]:
+        """종합 의견 요청 파라미터"""
+        # 리포트 데이터에서 핵심 정보 추출 (PriceData / Signal 객체)
+        latest_price = report_data.get("latest_price")
         signals = report_data.get("signals", [])
 
         signals_text = ", ".join(
-            [f"{s.get('indicator', '')}: {s.get('signal', '')}" for s in signals]
+            [f"{s.indicator}: {s.signal.value}" for s in signals]
         ) if signals else "시그널 없음"
+        if latest_price:
+            price_text = f"{latest_price.close}원 ({latest_price.change_rate}%)"
+        else:
+            price_text = "N/A"
 
         prompt = f"""다음은 {stock_name}의 핵심 분석 데이터입니다.
 
-- 현재가: {latest_price.get('close', 'N/A')}원 ({latest_price.get('change_rate', 'N/A')}%)
+- 현재가: {price_text}
 - 기술적 시그널: {signals_text}
 - 뉴스 요약: {news_summary[:300] if news_summary else 'N/A'}
 
@@ -303,20 +618,11 @@ JSON:"""
 
 **5-10문장으로 작성하세요. 마지막에 "투자 결정은 개인의 판단"임을 언급하세요.**"""
 
-        try:
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 객관적인 주식 시장 애널리스트입니다. 핵심을 5-10문장으로 분석하세요.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=500,
-                temperature=0.4,
-            )
-            return response.choices[0].message.content or "종합 의견 생성 실패"
-        except Exception as e:
-            console.print(f"  [red]✗ 종합 의견 생성 실패: {e}[/red]")
-            return "종합 의견 생성 실패"
+        return {
+            "messages": [
+                {"role": "system", "content": SYSTEM_MSGS["opinion"]},
+                {"role": "user", "content": prompt},
+            ],
+            "max_tokens": 500,
+            "temperature": 0.4,
+        }
@@ -0,0 +1,65 @@
+"""AI 응답 캐시 (메모리 LRU + 디스크)"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+from diskcache import Cache
+
+# 메모리 캐시 최대 항목 수
+MEMORY_CACHE_SIZE = 256
+
+
+class CompletionCache:
+    """프롬프트 → 응답 텍스트 캐시
+
+    요청 파라미터(model, messages, temperature, max_tokens 등)의 SHA-256 해시를 키로
+    프로세스 내 LRU와 diskcache(SQLite) 저장소에 응답을 보관한다.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: int,
+        maxsize: int = MEMORY_CACHE_SIZE,
+    ) -> None:
+        self._disk = Cache(str(directory))
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._ttl = ttl
+        self._maxsize = maxsize
+
+    @staticmethod
+    def make_key(request: dict[str, Any]) -> str:
+        """요청 파라미터로 캐시 키 생성"""
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """캐시 조회 (메모리 → 디스크 순)"""
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._memory.move_to_end(key)
+                return value
+            del self._memory[key]
+
+        value, expires_at = self._disk.get(key, expire_time=True)
+        if value is not None:
+            self._remember(key, value, expires_at)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """캐시 저장"""
+        self._disk.set(key, value, expire=self._ttl)
+        self._remember(key, value, time.time() + self._ttl)
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        """메모리 LRU에 저장 (초과 시 가장 오래된 항목 제거)"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
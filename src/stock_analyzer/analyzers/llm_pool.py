@@ -0,0 +1,152 @@
+"""OpenAI 요청 풀 (RPM/TPM 속도 제한 + 일시적 오류 재시도)"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from rich.console import Console
+
+console = Console(stderr=True)
+
+# 속도 제한 집계 구간 (초)
+RATE_WINDOW = 60.0
+
+# 요청 타임아웃 (초)
+REQUEST_TIMEOUT = 30.0
+
+# 재시도 설정 (429, 타임아웃, 5xx, 연결 오류)
+MAX_RETRIES = 5
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, InternalServerError, APIConnectionError)
+
+
+def estimate_tokens(request: dict[str, Any]) -> int:
+    """요청 토큰 수 추정 (입력 글자 수 + 최대 출력 토큰)
+
+    한국어는 글자당 1토큰 안팎이므로 글자 수를 그대로 보수적 추정치로 쓴다.
+    """
+    prompt_chars = sum(len(m.get("content") or "") for m in request.get("messages", []))
+    return prompt_chars + request.get("max_tokens", 0)
+
+
+class AsyncLLMPool:
+    """여러 종목의 AI 요청을 공유 한도 안에서 동시에 처리하는 풀"""
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        max_concurrency: int,
+    ) -> None:
+        self._rpm = rpm
+        self._tpm = tpm
+        self._max_concurrency = max_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+
+    async def complete(
+        self,
+        client: AsyncOpenAI,
+        on_delta: Callable[[str], None] | None = None,
+        **kwargs: Any,
+    ) -> str | None:
+        """chat.completions 요청 (한도 대기, 일시적 오류 시 지수 백오프 재시도)
+
+        on_delta가 주어지면 스트리밍으로 받아 조각이 도착할 때마다 전달한다.
+        이미 조각을 전달한 스트리밍 요청은 중복 전달을 막기 위해 재시도하지 않는다.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        tokens = estimate_tokens(kwargs)
+        backoff = INITIAL_BACKOFF
+        streamed = False
+        # 클로저에서 쓸 콜백 (on_delta가 없으면 스트리밍하지 않으므로 호출되지 않음)
+        emit: Callable[[str], None] = on_delta or (lambda _delta: None)
+
+        def forward(delta: str) -> None:
+            nonlocal streamed
+            streamed = True
+            emit(delta)
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._acquire(tokens)
+            try:
+                async with self._semaphore:
+                    if on_delta is None:
+                        response = await client.chat.completions.create(**kwargs)
+                        return response.choices[0].message.content
+                    return await self._stream(client, forward, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == MAX_RETRIES or streamed:
+                    raise
+                # 지터를 섞은 지수 백오프 (동시 재시도 몰림 방지)
+                delay = random.uniform(backoff / 2, backoff)
+                console.print(
+                    f"  [yellow]⚠ OpenAI 일시적 오류 ({type(e).__name__})"
+                    f" - {delay:.1f}초 후 재시도[/yellow]"
+                )
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, MAX_BACKOFF)
+        return None
+
+    @staticmethod
+    async def _stream(
+        client: AsyncOpenAI,
+        on_delta: Callable[[str], None],
+        **kwargs: Any,
+    ) -> str:
+        """스트리밍 응답을 조각 단위로 전달하며 전체 텍스트 반환"""
+        stream = await client.chat.completions.create(stream=True, **kwargs)
+        parts: list[str] = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                on_delta(delta)
+        return "".join(parts)
+
+    async def _acquire(self, tokens: int) -> None:
+        """RPM/TPM 여유가 생길 때까지 대기 후 사용량 기록"""
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+
+            has_request = len(self._requests) < self._rpm
+            # 단일 요청이 TPM보다 커도 빈 구간에서는 보낼 수 있게 허용
+            has_tokens = not self._tokens or self._token_total + tokens <= self._tpm
+            if has_request and has_tokens:
+                self._requests.append(now)
+                self._tokens.append((now, tokens))
+                self._token_total += tokens
+                return
+
+            # 가장 오래된 기록이 구간 밖으로 나갈 때까지 대기
+            oldest = min(
+                self._requests[0] if self._requests else now,
+                self._tokens[0][0] if self._tokens else now,
+            )
+            await asyncio.sleep(max(oldest + RATE_WINDOW - now, 0.01))
+
+    def _expire(self, now: float) -> None:
+        """집계 구간이 지난 기록 제거"""
+        while self._requests and self._requests[0] <= now - RATE_WINDOW:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= now - RATE_WINDOW:
+            self._token_total -= self._tokens.popleft()[1]
@@ -1,21 +1,30 @@
 """종합 주식 분석기"""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
 
 from rich.console import Console
+from rich.text import Text
 
-from stock_analyzer.analyzers.ai_analyzer import AIAnalyzer
 from stock_analyzer.collectors.dart import DartCollector
 from stock_analyzer.collectors.news import NewsCollector
 from stock_analyzer.collectors.stock_price import StockNotFoundError, StockPriceCollector
 from stock_analyzer.indicators.technical import TechnicalIndicatorCalculator
-from stock_analyzer.models import Disclosure, StockReport
+from stock_analyzer.models import AIAnalysis, StockReport
+
+if TYPE_CHECKING:
+    from stock_analyzer.analyzers.ai_analyzer import AIAnalyzer
 
 console = Console()
 
 # 기술적 지표 계산에 필요한 최소 데이터 일수 (MACD 26 + signal 9 + 여유분)
 MIN_DAYS_FOR_INDICATORS = 60
 
+# 여러 종목 동시 분석 시 최대 종목 수
+MAX_CONCURRENT_STOCKS = 4
+
 
 class StockAnalyzer:
     """종합 주식 분석기"""
@@ -25,7 +34,12 @@ class StockAnalyzer:
         self.dart_collector = DartCollector()
         self.news_collector = NewsCollector()
         self.indicator_calculator = TechnicalIndicatorCalculator()
-        self.ai_analyzer = AIAnalyzer() if use_ai else None
+        self.ai_analyzer: AIAnalyzer | None = None
+        if use_ai:
+            # openai 등 AI 의존성은 AI 사용 시에만 import
+            from stock_analyzer.analyzers import ai_analyzer
+
+            self.ai_analyzer = ai_analyzer.AIAnalyzer()
 
     def analyze(
         self,
@@ -39,11 +53,35 @@ class StockAnalyzer:
         stock_info = self.price_collector.get_stock_info(code)
         console.print(f"  ✓ {stock_info.name} ({stock_info.code}) - {stock_info.market}")
 
-        # 2. 주가 데이터 조회 (지표 계산을 위해 더 많은 데이터 수집)
-        console.print(f"[bold blue]주가 데이터 조회 중...[/bold blue]")
+        # 2. 주가 / 재무제표 / 공시 / 뉴스 동시 수집 (네트워크 대기 중첩)
+        console.print(f"[bold blue]데이터 수집 중 (주가, 재무제표, 공시, 뉴스)...[/bold blue]")
         # 기술적 지표 계산에 필요한 추가 기간 확보
         extended_start = start - timedelta(days=MIN_DAYS_FOR_INDICATORS)
-        all_price_data = self.price_collector.get_ohlcv(code, extended_start, end)
+        current_year = date.today().year
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            price_future = executor.submit(
+                self.price_collector.get_ohlcv, code, extended_start, end
+            )
+            news_future = executor.submit(
+                self.news_collector.search_news, stock_info.name, months=6
+            )
+            financials_future = None
+            disclosures_future = None
+            if self.dart_collector.is_available:
+                financials_future = executor.submit(
+                    self.dart_collector.get_financial_statements,
+                    code,
+                    years=[current_year, current_year - 1],
+                )
+                disclosures_future = executor.submit(
+                    self.dart_collector.get_recent_disclosures, code, count=5
+                )
+
+            all_price_data = price_future.result()
+            all_news = news_future.result()
+            financials = financials_future.result() if financials_future else []
+            disclosures = disclosures_future.result() if disclosures_future else []
 
         if not all_price_data:
             raise ValueError(f"주가 데이터를 찾을 수 없습니다: {code}")
@@ -52,80 +90,51 @@ class StockAnalyzer:
         price_data = [p for p in all_price_data if p.date >= start]
         console.print(f"  ✓ {len(price_data)}일 데이터 수집 (지표용 {len(all_price_data)}일)")
 
-        # 3. 기술적 지표 계산 (전체 데이터로 계산)
-        console.print(f"[bold blue]기술적 지표 계산 중...[/bold blue]")
-        all_indicators = self.indicator_calculator.calculate_all(all_price_data)
-        # 요청 기간의 지표만 필터링
-        indicators = [ind for ind in all_indicators if ind.date >= start]
-        signals = self.indicator_calculator.generate_signals(all_indicators)
-        console.print(f"  ✓ RSI, TRIX, MACD 계산 완료")
-        if signals:
-            for sig in signals:
-                console.print(f"  → {sig.indicator}: {sig.signal.value} ({sig.reason})")
-
-        # 4. 재무제표 조회
-        console.print(f"[bold blue]재무제표 조회 중...[/bold blue]")
-        financials = []
+        # 재무제표 / 최근 공시
         if self.dart_collector.is_available:
-            current_year = date.today().year
-            financials = self.dart_collector.get_financial_statements(
-                code,
-                years=[current_year, current_year - 1],
-            )
             console.print(f"  ✓ {len(financials)}개 연도 재무제표 수집")
-        else:
-            console.print(f"  [yellow]⚠ DART API 키가 설정되지 않음[/yellow]")
-
-        # 4-1. 최근 공시 조회
-        console.print(f"[bold blue]최근 공시 조회 중...[/bold blue]")
-        disclosures: list[Disclosure] = []
-        if self.dart_collector.is_available:
-            raw_disclosures = self.dart_collector.get_recent_disclosures(code, count=5)
-            for d in raw_disclosures:
-                rcept_no = d.get("rcept_no", "")
-                disclosures.append(
-                    Disclosure(
-                        title=d.get("report_nm", ""),
-                        date=d.get("rcept_dt", ""),
-                        link=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}",
-                        filer=d.get("flr_nm", ""),
-                    )
-                )
             console.print(f"  ✓ {len(disclosures)}건 공시 수집")
         else:
             console.print(f"  [yellow]⚠ DART API 키가 설정되지 않음[/yellow]")
 
-        # 5. 뉴스 수집
-        console.print(f"[bold blue]뉴스 수집 중...[/bold blue]")
-        all_news = self.news_collector.search_news(stock_info.name, months=6)
+        # 뉴스 (중복 제거)
         news = self.news_collector.deduplicate_news(all_news, max_results=10)
         console.print(f"  ✓ {len(news)}건 뉴스 수집 (중복 제거)")
 
-        # 6. AI 분석
-        ai_analysis = None
+        # 3. 기술적 지표 계산 (전체 데이터로 계산)
+        console.print(f"[bold blue]기술적 지표 계산 중...[/bold blue]")
+        # 요청 기간의 지표만 생성
+        indicators = self.indicator_calculator.calculate_all(all_price_data, start=start)
+        signals = self.indicator_calculator.generate_signals(
+            self.indicator_calculator.calculate_last_two(all_price_data)
+        )
+        console.print(f"  ✓ RSI, TRIX, MACD 계산 완료")
+        if signals:
+            for sig in signals:
+                console.print(f"  → {sig.indicator}: {sig.signal.value} ({sig.reason})")
+
+        # 4. AI 분석 (백그라운드 시작, 리포트 출력 시점에 결과 대기)
+        ai_future = None
         if self.ai_analyzer and self.ai_analyzer.is_available:
-            console.print(f"[bold blue]AI 분석 중...[/bold blue]")
+            console.print(f"[bold blue]AI 분석 시작...[/bold blue]")
             report_data = {
-                "latest_price": price_data[-1].model_dump() if price_data else {},
-                "signals": [s.model_dump() for s in signals],
-                "financials": [f.model_dump() for f in financials],
+                "latest_price": price_data[-1] if price_data else None,
+                "signals": signals,
             }
-            ai_analysis = self.ai_analyzer.analyze(
+            ai_future = self.ai_analyzer.analyze_background(
                 stock_info.name,
                 news,
                 disclosures,
                 report_data,
             )
-            if ai_analysis:
-                console.print(f"  ✓ 뉴스 및 공시 분석 완료")
-                console.print(f"  → 감성: {ai_analysis.sentiment} ({ai_analysis.sentiment_score:+.2f})")
-            else:
-                console.print(f"  [yellow]⚠ AI 분석 실패[/yellow]")
+            if ai_future:
+                ai_future.add_done_callback(partial(self._print_ai_result, stock_info.name))
         else:
             console.print(f"  [yellow]⚠ OpenAI API 키가 설정되지 않음[/yellow]")
 
-        # 7. 리포트 생성
-        report = StockReport(
+        # 5. 리포트 생성
+        # 각 항목은 이미 모델 인스턴스이므로 리포트 조립 시 재검증 생략
+        report = StockReport.model_construct(
             stock_info=stock_info,
             price_data=price_data,
             indicators=indicators,
@@ -133,12 +142,61 @@ class StockAnalyzer:
             financials=financials,
             news=news,
             disclosures=disclosures,
-            ai_analysis=ai_analysis,
             generated_at=datetime.now(),
             period_start=start,
             period_end=end,
         )
+        if ai_future:
+            report.set_ai_future(ai_future)
 
         console.print(f"[bold green]✓ 분석 완료[/bold green]")
 
         return report
+
+    @staticmethod
+    def _print_ai_result(stock_name: str, future: Future[AIAnalysis | None]) -> None:
+        """백그라운드 AI 분석 완료 시 결과 출력"""
+        try:
+            ai_analysis = future.result()
+        except Exception:
+            ai_analysis = None
+        if ai_analysis:
+            console.print(f"  ✓ {stock_name} 뉴스 및 공시 분석 완료")
+            console.print(f"  → 감성: {ai_analysis.sentiment} ({ai_analysis.sentiment_score:+.2f})")
+        else:
+            console.print(f"  [yellow]⚠ {stock_name} AI 분석 실패[/yellow]")
+
+    def analyze_many(
+        self,
+        codes: list[str],
+        start: date,
+        end: date,
+    ) -> list[StockReport | None]:
+        """여러 종목 동시 분석 (실패한 종목은 None)
+
+        종목별 AI 요청은 AIAnalyzer의 요청 풀을 공유하므로 전체 실행 기준으로
+        RPM/TPM 한도 안에서 동시에 처리된다. 여러 종목을 분석할 때는 종목별 진행
+        출력을 모아 두었다가 그 종목의 분석이 끝나면 한 번에 출력한다.
+        """
+
+        def analyze_one(code: str) -> StockReport | None:
+            try:
+                return self.analyze(code, start, end)
+            except StockNotFoundError as e:
+                console.print(f"[red]오류: {e}[/red]")
+            except Exception as e:
+                console.print(f"[red]분석 실패 ({code}): {e}[/red]")
+            return None
+
+        def analyze_buffered(code: str) -> StockReport | None:
+            # capture 버퍼는 스레드별이므로 다른 종목의 출력과 섞이지 않음
+            with console.capture() as capture:
+                report = analyze_one(code)
+            console.print(Text.from_ansi(capture.get()), end="")
+            return report
+
+        if len(codes) <= 1:
+            return [analyze_one(code) for code in codes]
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STOCKS) as executor:
+            return list(executor.map(analyze_buffered, codes))
@@ -1,11 +1,30 @@
 """데이터 수집기"""
 
-from stock_analyzer.collectors.dart import DartCollector
-from stock_analyzer.collectors.news import NewsCollector
-from stock_analyzer.collectors.stock_price import StockPriceCollector
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stock_analyzer.collectors.dart import DartCollector
+    from stock_analyzer.collectors.news import NewsCollector
+    from stock_analyzer.collectors.stock_price import StockPriceCollector
 
 __all__ = [
     "StockPriceCollector",
     "DartCollector",
     "NewsCollector",
 ]
+
+# 이름 → 모듈 (pykrx, OpenDartReader 등 무거운 의존성은 실제 사용 시점에 import)
+_LAZY_IMPORTS = {
+    "StockPriceCollector": "stock_analyzer.collectors.stock_price",
+    "DartCollector": "stock_analyzer.collectors.dart",
+    "NewsCollector": "stock_analyzer.collectors.news",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """지연 import (PEP 562)"""
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
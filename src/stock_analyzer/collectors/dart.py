@@ -1,21 +1,65 @@
 """DART 공시 데이터 수집기"""
 
+import re
 from datetime import date
+from typing import TYPE_CHECKING, Any
 
-import OpenDartReader
+import orjson
+import requests
 
 from stock_analyzer.config import get_settings
-from stock_analyzer.models import FinancialData
+from stock_analyzer.models import Disclosure, FinancialData
+
+if TYPE_CHECKING:
+    import OpenDartReader
+
+# 계정명 → FinancialData 필드 (같은 필드는 먼저 나온 계정 우선)
+ACCOUNT_FIELDS = {
+    "매출액": "revenue",
+    "영업수익": "revenue",
+    "영업이익": "operating_income",
+    "당기순이익": "net_income",
+    "분기순이익": "net_income",
+}
+ACCOUNT_PRIORITY = {name: i for i, name in enumerate(ACCOUNT_FIELDS)}
+
+# 계정명 정규화 시 제거할 패턴 (공백, "(손실)" 같은 괄호 표기)
+ACCOUNT_NOISE = re.compile(r"\s+|\(.*?\)")
+
+# DART 오픈API / 공시 원문 링크
+DART_API_URL = "https://opendart.fss.or.kr/api/"
+DART_VIEWER_URL = "https://dart.fss.or.kr/dsaf001/main.do?rcpNo="
+
+# DART 응답 상태 코드
+DART_STATUS_OK = "000"
+DART_STATUS_NO_DATA = "013"
+
+
+def _parse_amount(value: Any) -> float | None:
+    """금액 문자열("1,234", "-") → float"""
+    try:
+        return float(str(value).replace(",", ""))
+    except ValueError:
+        return None
 
 
 class DartCollector:
     """DART 재무제표 수집기"""
 
     def __init__(self) -> None:
-        settings = get_settings()
+        self._settings = get_settings()
         self._dart: OpenDartReader | None = None
-        if settings.dart_api_key:
-            self._dart = OpenDartReader(settings.dart_api_key)
+        # 실행 중 반복 조회 캐시 (종목코드, 연도) → 재무제표
+        self._corp_code_cache: dict[str, str | None] = {}
+        self._fs_cache: dict[tuple[str, int], FinancialData | None] = {}
+        self._overview_cache: dict[str, dict | None] = {}
+        self._session = requests.Session()
+        if self._settings.dart_api_key:
+            # 기업코드 테이블 로딩이 무거우므로 API 키가 있을 때만 import
+            # 별칭으로 import해 위 속성 주석의 OpenDartReader를 지역 변수로 만들지 않음
+            import OpenDartReader as DartReader
+
+            self._dart = DartReader(self._settings.dart_api_key)
 
     @property
     def is_available(self) -> bool:
@@ -27,13 +71,18 @@ class DartCollector:
         if not self._dart:
             return None
 
+        if stock_code in self._corp_code_cache:
+            return self._corp_code_cache[stock_code]
+
         try:
             # OpenDartReader는 종목코드로 직접 조회 가능
             corp_code = self._dart.find_corp_code(stock_code)
-            return corp_code
         except Exception:
             return None
 
+        self._corp_code_cache[stock_code] = corp_code
+        return corp_code
+
     def get_financial_statements(
         self,
         stock_code: str,
@@ -57,33 +106,69 @@ class DartCollector:
         financials = []
 
         for year in years:
-            try:
-                # 연간 재무제표 조회 (사업보고서)
-                fs = self._dart.finstate(stock_code, year, reprt_code="11011")
+            key = (stock_code, year)
+            if key not in self._fs_cache:
+                try:
+                    self._fs_cache[key] = self._fetch_financial_statement(stock_code, year)
+                except Exception:
+                    continue
 
-                if fs is None or fs.empty:
-                    # 분기보고서로 재시도
-                    fs = self._dart.finstate(stock_code, year)
+            financial = self._fs_cache[key]
+            if financial:
+                financials.append(financial)
 
-                if fs is not None and not fs.empty:
-                    financial = self._parse_financial_statement(fs, year)
-                    if financial:
-                        financials.append(financial)
+        return financials
+
+    def _fetch_financial_statement(
+        self,
+        stock_code: str,
+        year: int,
+    ) -> FinancialData | None:
+        """연도별 재무제표 조회 (사업보고서)"""
+        corp_code = self.get_corp_code(stock_code)
+        if not corp_code:
+            return None
 
-            except Exception:
-                continue
+        rows = self._request_list(
+            "fnlttSinglAcnt.json",
+            corp_code=corp_code,
+            bsns_year=year,
+            reprt_code="11011",
+        )
+        if not rows:
+            return None
 
-        return financials
+        return self._parse_financial_statement(rows, year)
+
+    def _request_list(self, endpoint: str, **params: Any) -> list[dict]:
+        """DART 오픈API JSON 요청 후 list 필드 반환 (데이터 없으면 빈 리스트)"""
+        response = self._session.get(
+            DART_API_URL + endpoint,
+            params={"crtfc_key": self._settings.dart_api_key, **params},
+            timeout=10,
+        )
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+        status = data.get("status")
+        if status == DART_STATUS_NO_DATA:
+            return []
+        if status != DART_STATUS_OK:
+            raise RuntimeError(f"DART API 오류 ({status}): {data.get('message', '')}")
+        return data.get("list", [])
 
     def get_company_overview(self, stock_code: str) -> dict | None:
         """기업 개황 정보"""
         if not self._dart:
             return None
 
+        if stock_code in self._overview_cache:
+            return self._overview_cache[stock_code]
+
         try:
             overview = self._dart.company(stock_code)
             if overview is not None:
-                return {
+                self._overview_cache[stock_code] = {
                     "corp_name": overview.get("corp_name", ""),
                     "corp_name_eng": overview.get("corp_name_eng", ""),
                     "ceo_nm": overview.get("ceo_nm", ""),
@@ -94,6 +179,7 @@ class DartCollector:
                     "ir_url": overview.get("ir_url", ""),
                     "induty_code": overview.get("induty_code", ""),
                 }
+                return self._overview_cache[stock_code]
         except Exception:
             pass
 
@@ -101,34 +187,38 @@ class DartCollector:
 
     def _parse_financial_statement(
         self,
-        fs: "pd.DataFrame",
+        rows: list[dict],
         year: int,
     ) -> FinancialData | None:
-        """재무제표 DataFrame을 FinancialData로 변환"""
+        """재무제표 계정 목록을 FinancialData로 변환"""
         try:
             # 연결재무제표 우선, 없으면 개별재무제표
-            fs_type = fs[fs["fs_div"] == "CFS"]  # 연결
-            if fs_type.empty:
-                fs_type = fs[fs["fs_div"] == "OFS"]  # 개별
-
-            if fs_type.empty:
-                fs_type = fs
-
-            # 당기 데이터 추출
-            def get_value(account_nm: str) -> float | None:
-                row = fs_type[fs_type["account_nm"].str.contains(account_nm, na=False)]
-                if not row.empty:
-                    val = row.iloc[0].get("thstrm_amount")
-                    if val and str(val) not in ["-", "", "nan"]:
-                        try:
-                            return float(str(val).replace(",", ""))
-                        except ValueError:
-                            return None
-                return None
-
-            revenue = get_value("매출액") or get_value("영업수익")
-            operating_income = get_value("영업이익")
-            net_income = get_value("당기순이익") or get_value("분기순이익")
+            selected = (
+                [r for r in rows if r.get("fs_div") == "CFS"]  # 연결
+                or [r for r in rows if r.get("fs_div") == "OFS"]  # 개별
+                or rows
+            )
+
+            # 당기 데이터 추출 (필드별로 우선순위가 가장 높은 계정 값)
+            values: dict[str, tuple[int, float]] = {}
+            for row in selected:
+                account = ACCOUNT_NOISE.sub("", str(row.get("account_nm", "")))
+                field = ACCOUNT_FIELDS.get(account)
+                if field is None:
+                    continue
+                amount = _parse_amount(row.get("thstrm_amount"))
+                if amount is None:
+                    continue
+                priority = ACCOUNT_PRIORITY[account]
+                if field not in values or priority < values[field][0]:
+                    values[field] = (priority, amount)
+
+            def get_value(field: str) -> float | None:
+                return values[field][1] if field in values else None
+
+            revenue = get_value("revenue")
+            operating_income = get_value("operating_income")
+            net_income = get_value("net_income")
 
             return FinancialData(
                 year=year,
@@ -148,29 +238,42 @@ class DartCollector:
         self,
         stock_code: str,
         count: int = 5,
-    ) -> list[dict]:
+    ) -> list[Disclosure]:
         """최근 공시 목록"""
         if not self._dart:
             return []
 
+        corp_code = self.get_corp_code(stock_code)
+        if not corp_code:
+            return []
+
         try:
-            disclosures = self._dart.list(stock_code, kind="A")  # 전체 공시
-
-            if disclosures is None or disclosures.empty:
-                return []
-
-            result = []
-            for _, row in disclosures.head(count).iterrows():
-                result.append(
-                    {
-                        "rcept_no": row.get("rcept_no", ""),
-                        "rcept_dt": row.get("rcept_dt", ""),
-                        "report_nm": row.get("report_nm", ""),
-                        "flr_nm": row.get("flr_nm", ""),
-                    }
-                )
+            # 최신순 정렬이므로 첫 페이지만 필요한 개수만큼 요청
+            rows = self._request_list(
+                "list.json",
+                corp_code=corp_code,
+                bgn_de="19000101",
+                end_de=date.today().strftime("%Y%m%d"),
+                last_reprt_at="Y",
+                pblntf_ty="A",
+                page_no=1,
+                page_count=min(count, 100),
+            )
 
-            return result
+            disclosures = []
+            for row in rows[:count]:
+                rcept_dt = row.get("rcept_dt") or ""
+                if len(rcept_dt) == 8:
+                    rcept_dt = f"{rcept_dt[:4]}-{rcept_dt[4:6]}-{rcept_dt[6:]}"
+                disclosures.append(
+                    Disclosure(
+                        title=row.get("report_nm") or "",
+                        date=rcept_dt,
+                        link=DART_VIEWER_URL + (row.get("rcept_no") or ""),
+                        filer=row.get("flr_nm") or "",
+                    )
+                )
+            return disclosures
 
         except Exception:
             return []
@@ -1,32 +1,99 @@
 """네이버 뉴스 수집기 (검색 API)"""
 
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from html import unescape
 
-import requests
+import orjson
+from rapidfuzz import fuzz, process
 
+from stock_analyzer.collectors.session import shared_session
 from stock_analyzer.config import get_settings
 from stock_analyzer.models import NewsArticle
 
+# 제목 정규화용 정규식 (모듈 로드 시 한 번만 컴파일)
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# URL에서 호스트 추출
+_HOST_RE = re.compile(r"https?://([^/:?#]+)", re.IGNORECASE)
+
+# 주요 언론사 매핑 (www. 제외 도메인)
+_SOURCE_MAP = {
+    "news.naver.com": "네이버뉴스",
+    "chosun.com": "조선일보",
+    "donga.com": "동아일보",
+    "joongang.co.kr": "중앙일보",
+    "hani.co.kr": "한겨레",
+    "khan.co.kr": "경향신문",
+    "mk.co.kr": "매일경제",
+    "hankyung.com": "한국경제",
+    "sedaily.com": "서울경제",
+    "fnnews.com": "파이낸셜뉴스",
+    "edaily.co.kr": "이데일리",
+    "mt.co.kr": "머니투데이",
+    "etnews.com": "전자신문",
+    "zdnet.co.kr": "지디넷코리아",
+    "bloter.net": "블로터",
+    "yonhapnews.co.kr": "연합뉴스",
+    "yna.co.kr": "연합뉴스",
+    "news.sbs.co.kr": "SBS",
+    "news.kbs.co.kr": "KBS",
+    "imnews.imbc.com": "MBC",
+}
+
+# 추가 페이지 동시 조회 수
+MAX_PAGE_WORKERS = 5
+
+
+def _strip_tags(text: str) -> str:
+    """HTML 태그 제거 (짧은 문자열은 정규식보다 str.find 탐색이 빠름)"""
+    parts = []
+    pos = 0
+    while (start := text.find("<", pos)) >= 0:
+        end = text.find(">", start + 1)
+        if end < 0:
+            break
+        parts.append(text[pos:start])
+        pos = end + 1
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _normalize_title(title: str) -> str:
+    """유사도 비교용 제목 정규화 (특수문자 제거 및 소문자 변환)"""
+    return _PUNCT_RE.sub("", title.lower())
+
+
+def _title_shingles(title: str) -> set[str]:
+    """공백을 제외한 글자 bigram 집합 (한 글자 제목은 그대로)"""
+    compact = title.replace(" ", "")
+    if len(compact) < 2:
+        return {compact}
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
 
 class NewsCollector:
     """네이버 뉴스 수집기"""
 
     NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+    NAVER_PAGE_SIZE = 100  # 한 번에 가져올 개수 (최대 100)
+    NAVER_MAX_START = 1000  # 검색 API가 허용하는 최대 시작 위치
 
     def __init__(self) -> None:
         self._settings = get_settings()
-        self._session = requests.Session()
-
-        if self._settings.has_naver:
-            self._session.headers.update(
-                {
-                    "X-Naver-Client-Id": self._settings.naver_client_id,
-                    "X-Naver-Client-Secret": self._settings.naver_client_secret,
-                }
-            )
+        self._session = shared_session()
+
+        # 공용 세션이므로 인증 헤더는 요청마다 전달
+        self._headers: dict[str, str] = {}
+        client_id = self._settings.naver_client_id
+        client_secret = self._settings.naver_client_secret
+        if client_id and client_secret:
+            self._headers = {
+                "X-Naver-Client-Id": client_id,
+                "X-Naver-Client-Secret": client_secret,
+            }
 
     @property
     def is_available(self) -> bool:
@@ -39,59 +106,75 @@ class NewsCollector:
         months: int = 6,
         max_results: int = 30,
     ) -> list[NewsArticle]:
-        """네이버 뉴스 검색 (최근 N개월)"""
+        """네이버 뉴스 검색 (최근 N개월)
+
+        첫 페이지로 충분한 경우가 대부분이므로 1페이지를 먼저 조회하고,
+        더 필요하면 이후 페이지를 MAX_PAGE_WORKERS개씩 병렬로 조회한다.
+        """
         if not self.is_available:
             return []
 
-        articles = []
-        start = 1
-        display = 100  # 한 번에 가져올 개수 (최대 100)
+        articles: list[NewsArticle] = []
 
         # 기간 설정 (최근 N개월)
         cutoff_date = datetime.now() - timedelta(days=months * 30)
 
-        while len(articles) < max_results and start <= 1000:
-            try:
-                params = {
-                    "query": keyword,
-                    "display": display,
-                    "start": start,
-                    "sort": "date",  # 최신순
-                }
-
-                response = self._session.get(
-                    self.NAVER_NEWS_API_URL,
-                    params=params,
-                    timeout=10,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                items = data.get("items", [])
-
-                if not items:
-                    break
-
-                for item in items:
-                    article = self._parse_news_item(item)
-                    if article:
-                        # 기간 필터링
-                        if article.published_at >= cutoff_date:
+        starts = list(range(1, self.NAVER_MAX_START + 1, self.NAVER_PAGE_SIZE))
+        batches = [starts[:1]] + [
+            starts[i:i + MAX_PAGE_WORKERS] for i in range(1, len(starts), MAX_PAGE_WORKERS)
+        ]
+
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            for batch in batches:
+                pages = executor.map(lambda start: self._fetch_page(keyword, start), batch)
+
+                # 페이지 순서대로 처리 (최신순 유지)
+                for items in pages:
+                    if not items:
+                        return articles
+
+                    for item in items:
+                        # 발행일만 먼저 확인
+                        # (최신순이므로 기간 밖 기사가 나오면 이후는 모두 기간 밖)
+                        published_at = self._parse_date(item.get("pubDate", ""))
+                        if published_at < cutoff_date:
+                            return articles
+
+                        article = self._parse_news_item(item, published_at)
+                        if article:
                             articles.append(article)
 
-                        if len(articles) >= max_results:
-                            break
+                            if len(articles) >= max_results:
+                                return articles
 
-                start += display
+                    # 더 이상 결과가 없으면 종료
+                    if len(items) < self.NAVER_PAGE_SIZE:
+                        return articles
 
-                # 더 이상 결과가 없으면 종료
-                if len(items) < display:
-                    break
+        return articles
 
-            except Exception:
-                break
+    def _fetch_page(self, keyword: str, start: int) -> list[dict] | None:
+        """검색 결과 한 페이지 조회 (실패 시 None)"""
+        try:
+            params = {
+                "query": keyword,
+                "display": self.NAVER_PAGE_SIZE,
+                "start": start,
+                "sort": "date",  # 최신순
+            }
 
-        return articles
+            response = self._session.get(
+                self.NAVER_NEWS_API_URL,
+                params=params,
+                headers=self._headers,
+                timeout=10,
+            )
+            response.raise_for_status()
+
+            return orjson.loads(response.content).get("items", [])
+
+        except Exception:
+            return None
 
     def deduplicate_news(
         self,
@@ -103,27 +186,58 @@ class NewsCollector:
         if not articles:
             return []
 
-        unique_articles = []
+        cutoff = similarity_threshold * 100
 
+        # 앞에서부터 이미 선택한 기사와 유사하지 않은 기사만 선택
+        # (선택한 기사의 정규화 제목/길이를 보관해 비교마다 다시 정규화하지 않음)
+        unique_articles: list[NewsArticle] = []
+        unique_titles: list[str] = []
+        unique_lengths: list[int] = []
+        # 글자 bigram → 선택한 기사 위치 (bigram을 공유하는 기사만 비교 후보)
+        shingle_index: dict[str, list[int]] = defaultdict(list)
         for article in articles:
-            is_duplicate = False
-
-            for unique in unique_articles:
-                similarity = self._title_similarity(article.title, unique.title)
-                if similarity >= similarity_threshold:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                unique_articles.append(article)
-
+            title = _normalize_title(article.title)
+            length = len(title)
+            shingles = _title_shingles(title)
+
+            # 길이 차이만으로 기준 미달이 확실한 기사는 비교 생략
+            # (ratio 상한 = 2 × 짧은 제목 길이 / 두 제목 길이 합)
+            positions = {j for shingle in shingles for j in shingle_index.get(shingle, ())}
+            comparable = [
+                j
+                for j in range(len(unique_titles))
+                if 2 * min(length, unique_lengths[j])
+                >= similarity_threshold * (length + unique_lengths[j])
+            ]
+            # bigram을 공유하는 기사부터 비교하고, 없으면 나머지 기사와도 비교
+            # (공통 bigram 없이 글자 순서만 겹쳐도 기준을 넘을 수 있어 전체 비교 결과를 유지)
+            # ratio는 공백을 압축하지 않은 정규화 제목으로 계산
+            candidates = [unique_titles[j] for j in comparable if j in positions]
+            others = [unique_titles[j] for j in comparable if j not in positions]
+            if any(
+                group
+                and process.extractOne(title, group, scorer=fuzz.ratio, score_cutoff=cutoff)
+                for group in (candidates, others)
+            ):
+                continue
+
+            for shingle in shingles:
+                shingle_index[shingle].append(len(unique_articles))
+            unique_articles.append(article)
+            unique_titles.append(title)
+            unique_lengths.append(length)
+            # 필요한 개수를 채우면 나머지 기사는 정규화/비교하지 않음
             if len(unique_articles) >= max_results:
                 break
 
         return unique_articles
 
-    def _parse_news_item(self, item: dict) -> NewsArticle | None:
-        """뉴스 아이템 파싱"""
+    def _parse_news_item(
+        self,
+        item: dict,
+        published_at: datetime | None = None,
+    ) -> NewsArticle | None:
+        """뉴스 아이템 파싱 (published_at: 이미 파싱한 발행일)"""
         try:
             # 제목 (HTML 태그 제거)
             title = self._clean_html(item.get("title", ""))
@@ -137,8 +251,8 @@ class NewsCollector:
             summary = self._clean_html(item.get("description", ""))
 
             # 발행일 파싱
-            pub_date_str = item.get("pubDate", "")
-            published_at = self._parse_date(pub_date_str)
+            if published_at is None:
+                published_at = self._parse_date(item.get("pubDate", ""))
 
             # 언론사 추출 (링크에서)
             source = self._extract_source(link)
@@ -156,13 +270,10 @@ class NewsCollector:
 
     def _clean_html(self, text: str) -> str:
         """HTML 태그 및 엔티티 제거"""
-        # HTML 엔티티 디코딩
-        text = unescape(text)
-        # HTML 태그 제거
-        text = re.sub(r"<[^>]+>", "", text)
+        # HTML 태그 제거 후 엔티티 디코딩 (&lt;속보&gt; 같은 본문 괄호는 유지)
+        text = unescape(_strip_tags(text))
         # 연속 공백 정리
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return " ".join(text.split())
 
     def _parse_date(self, date_str: str) -> datetime:
         """날짜 문자열 파싱 (RFC 2822 형식)"""
@@ -179,48 +290,22 @@ class NewsCollector:
     def _extract_source(self, url: str) -> str:
         """URL에서 언론사 추출"""
         try:
-            from urllib.parse import urlparse
-
-            domain = urlparse(url).netloc
-            # 주요 언론사 매핑
-            source_map = {
-                "news.naver.com": "네이버뉴스",
-                "n.news.naver.com": "네이버뉴스",
-                "www.chosun.com": "조선일보",
-                "www.donga.com": "동아일보",
-                "www.joongang.co.kr": "중앙일보",
-                "www.hani.co.kr": "한겨레",
-                "www.khan.co.kr": "경향신문",
-                "www.mk.co.kr": "매일경제",
-                "www.hankyung.com": "한국경제",
-                "www.sedaily.com": "서울경제",
-                "www.fnnews.com": "파이낸셜뉴스",
-                "www.edaily.co.kr": "이데일리",
-                "www.mt.co.kr": "머니투데이",
-                "www.etnews.com": "전자신문",
-                "www.zdnet.co.kr": "지디넷코리아",
-                "www.bloter.net": "블로터",
-                "www.yonhapnews.co.kr": "연합뉴스",
-                "www.yna.co.kr": "연합뉴스",
-                "news.sbs.co.kr": "SBS",
-                "news.kbs.co.kr": "KBS",
-                "imnews.imbc.com": "MBC",
-            }
-
-            for key, name in source_map.items():
-                if key in domain:
+            match = _HOST_RE.match(url)
+            domain = match.group(1).lower().removeprefix("www.") if match else ""
+
+            # 정확히 일치하는 도메인 → 상위 도메인 순으로 조회 (예: n.news.naver.com)
+            parts = domain.split(".")
+            for i in range(len(parts) - 1):
+                name = _SOURCE_MAP.get(".".join(parts[i:]))
+                if name:
                     return name
 
             # 매핑 없으면 도메인 반환
-            return domain.replace("www.", "").split(".")[0]
+            return parts[0]
 
         except Exception:
             return "Unknown"
 
     def _title_similarity(self, title1: str, title2: str) -> float:
         """두 제목의 유사도 계산"""
-        # 특수문자 제거 및 소문자 변환
-        clean1 = re.sub(r"[^\w\s]", "", title1.lower())
-        clean2 = re.sub(r"[^\w\s]", "", title2.lower())
-
-        return SequenceMatcher(None, clean1, clean2).ratio()
+        return fuzz.ratio(_normalize_title(title1), _normalize_title(title2)) / 100
@@ -0,0 +1,55 @@
+"""수집기 공용 HTTP 세션 (응답 캐시 + 커넥션 풀)"""
+
+from datetime import timedelta
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from rich.console import Console
+
+from stock_analyzer.config import get_settings
+
+console = Console()
+
+# 커넥션 풀 크기 (호스트 수 / 호스트당 keep-alive 연결 수)
+# 여러 종목 동시 분석 + 뉴스 페이지 병렬 조회 시에도 연결을 버리지 않도록 여유 있게 설정
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# 캐시에 저장하지 않을 네이버 API 인증 헤더
+NAVER_AUTH_HEADERS = ("X-Naver-Client-Id", "X-Naver-Client-Secret")
+
+
+def create_session() -> requests.Session:
+    """HTTP 응답 캐시가 적용된 세션 생성 (캐시를 쓸 수 없으면 일반 세션)
+
+    같은 종목을 반복 분석할 때 네이버 요청을 SQLite 캐시에서 바로 응답한다.
+    """
+    settings = get_settings()
+    session = requests.Session()
+
+    if settings.http_cache_ttl > 0:
+        try:
+            from requests_cache import DEFAULT_IGNORED_PARAMS, CachedSession
+
+            settings.cache_dir.mkdir(parents=True, exist_ok=True)
+            session = CachedSession(
+                str(settings.cache_dir / "http"),
+                backend="sqlite",
+                expire_after=timedelta(seconds=settings.http_cache_ttl),
+                # 네이버 API 인증 헤더는 캐시 키와 저장되는 요청에서 제외 (평문 저장 방지)
+                ignored_parameters=[*DEFAULT_IGNORED_PARAMS, *NAVER_AUTH_HEADERS],
+            )
+        except Exception as e:
+            console.print(f"  [yellow]⚠ HTTP 캐시 비활성화: {e}[/yellow]")
+
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션 (수집기 인스턴스가 여러 개여도 keep-alive 연결 재사용)"""
+    return create_session()
@@ -2,15 +2,86 @@
 
 import re
 from datetime import date, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import FinanceDataReader as fdr
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from pykrx import stock as pykrx
-
+from stock_analyzer.collectors.session import shared_session
 from stock_analyzer.models import PriceData, StockInfo
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pykrx, FinanceDataReader, pandas, selectolax는 import 비용이 커서
+# (pykrx는 import 시 KRX 로그인까지 시도) 실제 사용하는 함수 안에서 import
+
+# 네이버 금융 페이지 파싱용 정규식 (모듈 로드 시 한 번만 컴파일)
+_SECTOR_RE = re.compile(r'class="sub_tit"[^>]*>([^<]+)</a>')
+_SECTOR_TEXT_RE = re.compile(r"업종.*?<a[^>]*>([^<]+)</a>", re.DOTALL)
+_BAE_RE = re.compile(r"(\d+\.?\d*)\s*배")
+_WON_RE = re.compile(r"(\d{1,3}(?:,\d{3})*)\s*원")
+_DIV_RE = re.compile(r"배당수익률.*?(\d+\.?\d*)\s*%")
+
+
+def _ymd(d: date) -> str:
+    """KRX 조회용 YYYYMMDD 문자열 (strftime보다 가벼운 정수 포맷)"""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
+def _nonzero_or_none(value: object) -> float | None:
+    """지표 값 변환 (0 또는 결측값은 None)"""
+    number = float(value or 0)
+    return number if number and number == number else None
+
+
+# KRX 조회 결과 캐시 (day 인자가 캐시 키에 포함되므로 날짜가 바뀌면 새로 조회)
+def _today() -> str:
+    """캐시 키용 오늘 날짜"""
+    return date.today().isoformat()
+
+
+@lru_cache(maxsize=16)
+def _market_fundamental(date_str: str, market: str, day: str) -> "pd.DataFrame":
+    """전 종목 기본 지표 (하루 단위 캐시, 반환값은 읽기 전용으로 사용)"""
+    from pykrx import stock as pykrx
+
+    return pykrx.get_market_fundamental(date_str, market=market)
+
+
+@lru_cache(maxsize=4)
+def _stock_listing(market: str, day: str) -> "pd.DataFrame":
+    """FinanceDataReader 종목 목록 (하루 단위 캐시, 반환값은 읽기 전용으로 사용)"""
+    import FinanceDataReader as fdr
+
+    return fdr.StockListing(market)
+
+
+@lru_cache(maxsize=1024)
+def _has_recent_ohlcv(code: str, day: str) -> bool:
+    """최근 30일 OHLCV 존재 여부 (하루 단위 캐시)"""
+    from pykrx import stock as pykrx
+
+    end = date.fromisoformat(day)
+    start = end - timedelta(days=30)
+    df = pykrx.get_market_ohlcv(
+        _ymd(start),
+        _ymd(end),
+        code,
+    )
+    return not df.empty
+
+
+@lru_cache(maxsize=4)
+def _market_tickers(market: str, day: str) -> frozenset[str]:
+    """시장별 전 종목코드 집합 (하루 단위 캐시)"""
+    from pykrx import stock as pykrx
+
+    # date=None이면 pykrx가 가장 가까운 영업일 기준으로 조회 (주말/휴일 빈 목록 방지)
+    tickers = frozenset(pykrx.get_market_ticker_list(None, market=market))
+    if not tickers:
+        # 예외는 lru_cache에 저장되지 않으므로 빈 결과는 다음 호출에서 다시 조회
+        raise LookupError(f"{market} 종목 목록이 비어 있습니다. ({day})")
+    return tickers
+
 
 class StockNotFoundError(Exception):
     """존재하지 않는 종목"""
@@ -23,6 +94,7 @@ class StockPriceCollector:
 
     def __init__(self) -> None:
         self._ticker_cache: dict[str, str] = {}
+        self._session = shared_session()
 
     def get_stock_info(self, code: str) -> StockInfo:
         """종목 기본 정보 조회"""
@@ -62,8 +134,11 @@ class StockPriceCollector:
         end: date,
     ) -> list[PriceData]:
         """OHLCV + 거래대금 + 등락률 조회"""
-        start_str = start.strftime("%Y%m%d")
-        end_str = end.strftime("%Y%m%d")
+        import pandas as pd
+        from pykrx import stock as pykrx
+
+        start_str = _ymd(start)
+        end_str = _ymd(end)
 
         # OHLCV 데이터 조회
         df = pykrx.get_market_ohlcv(start_str, end_str, code)
@@ -74,49 +149,81 @@ class StockPriceCollector:
         # 컬럼명 정리 (인덱스: 날짜, 컬럼: 시가, 고가, 저가, 종가, 거래량, 등락률)
         df = df.reset_index()
 
-        # PriceData 리스트로 변환
-        price_data = []
-        for _, row in df.iterrows():
-            # 거래대금 = 종가 * 거래량 (근사치)
-            close_price = float(row["종가"])
-            volume = int(row["거래량"])
-            trading_value = close_price * volume
-
-            price_data.append(
-                PriceData(
-                    date=row["날짜"].date() if isinstance(row["날짜"], pd.Timestamp) else row["날짜"],
-                    open=float(row["시가"]),
-                    high=float(row["고가"]),
-                    low=float(row["저가"]),
-                    close=close_price,
-                    volume=volume,
-                    trading_value=trading_value,
-                    change_rate=float(row["등락률"]),
-                )
+        # 컬럼 단위로 NumPy 배열 추출 (행마다 Series를 만드는 iterrows 회피)
+        dates = pd.to_datetime(df["날짜"]).dt.date.to_numpy()
+        opens = df["시가"].to_numpy(dtype="float64")
+        highs = df["고가"].to_numpy(dtype="float64")
+        lows = df["저가"].to_numpy(dtype="float64")
+        closes = df["종가"].to_numpy(dtype="float64")
+        volumes = df["거래량"].to_numpy(dtype="int64")
+        change_rates = df["등락률"].to_numpy(dtype="float64")
+
+        # 거래대금 = 종가 * 거래량 (근사치)
+        trading_values = closes * volumes
+
+        # PriceData 리스트로 변환 (배열에서 꺼낸 값은 타입이 확정되어 있어 검증 생략)
+        return [
+            PriceData.model_construct(
+                date=d,
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
+                trading_value=tv,
+                change_rate=cr,
             )
-
-        return price_data
+            for d, o, h, lo, c, v, tv, cr in zip(
+                dates,
+                opens.tolist(),
+                highs.tolist(),
+                lows.tolist(),
+                closes.tolist(),
+                volumes.tolist(),
+                trading_values.tolist(),
+                change_rates.tolist(),
+            )
+        ]
 
     def get_fundamental(self, code: str, target_date: date) -> dict[str, float | None]:
         """PER, PBR 등 기본 지표 조회"""
-        date_str = target_date.strftime("%Y%m%d")
+        return self.get_fundamental_batch([code], target_date)[code]
+
+    def get_fundamental_batch(
+        self,
+        codes: list[str],
+        target_date: date,
+    ) -> dict[str, dict[str, float | None]]:
+        """여러 종목의 PER, PBR 등 기본 지표 일괄 조회
+
+        날짜별 전 종목 지표 표를 한 번만 조회해 모든 종목에 사용한다.
+        """
+        results: dict[str, dict[str, float | None]] = {}
+        remaining = list(dict.fromkeys(codes))
 
-        # 해당 날짜에 데이터가 없을 수 있으므로 최근 5일 내 조회
+        # 해당 날짜에 데이터가 없을 수 있으므로 최근 5일 내 조회 (없는 종목만 이전 날짜로)
         for i in range(5):
-            try_date = (target_date - timedelta(days=i)).strftime("%Y%m%d")
-            df = pykrx.get_market_fundamental(try_date, market="ALL")
-
-            if not df.empty and code in df.index:
-                row = df.loc[code]
-                return {
-                    "per": float(row.get("PER", 0)) or None,
-                    "pbr": float(row.get("PBR", 0)) or None,
-                    "eps": float(row.get("EPS", 0)) or None,
-                    "bps": float(row.get("BPS", 0)) or None,
-                    "div_yield": float(row.get("DIV", 0)) or None,
+            if not remaining:
+                break
+
+            try_date = _ymd(target_date - timedelta(days=i))
+            df = _market_fundamental(try_date, "ALL", _today())
+            if df.empty:
+                continue
+
+            found = df.reindex(remaining).dropna(how="all")
+            for code, row in found.to_dict("index").items():
+                results[code] = {
+                    "per": _nonzero_or_none(row.get("PER")),
+                    "pbr": _nonzero_or_none(row.get("PBR")),
+                    "eps": _nonzero_or_none(row.get("EPS")),
+                    "bps": _nonzero_or_none(row.get("BPS")),
+                    "div_yield": _nonzero_or_none(row.get("DIV")),
                 }
+            remaining = [code for code in remaining if code not in results]
 
-        return {"per": None, "pbr": None, "eps": None, "bps": None, "div_yield": None}
+        empty = {"per": None, "pbr": None, "eps": None, "bps": None, "div_yield": None}
+        return {code: results.get(code, dict(empty)) for code in codes}
 
     def _get_stock_name(self, code: str) -> str | None:
         """종목명 조회"""
@@ -125,6 +232,8 @@ class StockPriceCollector:
 
         # 직접 종목명 조회 시도
         try:
+            from pykrx import stock as pykrx
+
             name = pykrx.get_market_ticker_name(code)
             if name:
                 self._ticker_cache[code] = name
@@ -134,14 +243,7 @@ class StockPriceCollector:
 
         # OHLCV 조회로 종목 존재 여부 확인 (fallback)
         try:
-            end = date.today()
-            start = end - timedelta(days=30)
-            df = pykrx.get_market_ohlcv(
-                start.strftime("%Y%m%d"),
-                end.strftime("%Y%m%d"),
-                code,
-            )
-            if not df.empty:
+            if _has_recent_ohlcv(code, _today()):
                 # 종목이 존재하면 코드를 이름으로 사용
                 self._ticker_cache[code] = code
                 return code
@@ -152,24 +254,14 @@ class StockPriceCollector:
 
     def _get_market(self, code: str) -> str:
         """시장 구분 조회"""
-        # OHLCV 조회로 시장 구분 확인
-        try:
-            end = date.today()
-            start = end - timedelta(days=7)
-            start_str = start.strftime("%Y%m%d")
-            end_str = end.strftime("%Y%m%d")
-
-            # KOSPI 시도
-            df = pykrx.get_market_ohlcv(start_str, end_str, code, market="KOSPI")
-            if not df.empty:
-                return "KOSPI"
-
-            # KOSDAQ 시도
-            df = pykrx.get_market_ohlcv(start_str, end_str, code, market="KOSDAQ")
-            if not df.empty:
-                return "KOSDAQ"
-        except Exception:
-            pass
+        # 시장별 종목코드 집합으로 구분 (시장당 하루 1회 조회)
+        day = _today()
+        for market in ("KOSPI", "KOSDAQ"):
+            try:
+                if code in _market_tickers(market, day):
+                    return market
+            except Exception:
+                continue
 
         return "KOSPI"  # 기본값
 
@@ -187,23 +279,25 @@ class StockPriceCollector:
         try:
             url = f"https://finance.naver.com/item/main.naver?code={code}"
             headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(url, headers=headers, timeout=5)
+            resp = self._session.get(url, headers=headers, timeout=5)
 
             if resp.status_code != 200:
                 return result
 
-            soup = BeautifulSoup(resp.text, "html.parser")
+            from selectolax.lexbor import LexborHTMLParser
+
+            tree = LexborHTMLParser(resp.text)
 
             # 업종 정보 파싱
             sectors = []
             # 패턴 1: 업종 링크
-            matches = re.findall(r'class="sub_tit"[^>]*>([^<]+)</a>', resp.text)
+            matches = _SECTOR_RE.findall(resp.text)
             if matches:
                 sectors.extend([s.strip() for s in matches if s.strip()])
 
             # 패턴 2: 업종 텍스트
             if not sectors:
-                match = re.search(r'업종.*?<a[^>]*>([^<]+)</a>', resp.text, re.DOTALL)
+                match = _SECTOR_TEXT_RE.search(resp.text)
                 if match:
                     sector = match.group(1).strip()
                     if sector:
@@ -212,33 +306,31 @@ class StockPriceCollector:
             result["sectors"] = list(dict.fromkeys(sectors))[:5]
 
             # PER, PBR 테이블 파싱
-            per_table = soup.find("table", {"class": "per_table"})
+            per_table = tree.css_first("table.per_table")
             if per_table:
-                for row in per_table.find_all("tr"):
-                    text = row.get_text()
+                for row in per_table.css("tr"):
+                    text = row.text()
 
-                    # PER 추출 (추정PER 제외)
+                    # PER/EPS 행 (추정PER 제외), PBR/BPS 행
+                    targets = []
                     if "PER" in text and "추정" not in text:
-                        match = re.search(r"(\d+\.?\d*)\s*배", text)
-                        if match:
-                            result["per"] = float(match.group(1))
-                        # EPS 추출
-                        eps_match = re.search(r"(\d{1,3}(?:,\d{3})*)\s*원", text)
-                        if eps_match:
-                            result["eps"] = float(eps_match.group(1).replace(",", ""))
-
-                    # PBR 추출
+                        targets.append(("per", "eps"))
                     if "PBR" in text:
-                        match = re.search(r"(\d+\.?\d*)\s*배", text)
-                        if match:
-                            result["pbr"] = float(match.group(1))
-                        # BPS 추출
-                        bps_match = re.search(r"(\d{1,3}(?:,\d{3})*)\s*원", text)
-                        if bps_match:
-                            result["bps"] = float(bps_match.group(1).replace(",", ""))
+                        targets.append(("pbr", "bps"))
+                    if not targets:
+                        continue
+
+                    # 행마다 배수(배)/금액(원)을 한 번씩만 검색
+                    ratio_match = _BAE_RE.search(text)
+                    amount_match = _WON_RE.search(text)
+                    for ratio_key, amount_key in targets:
+                        if ratio_match:
+                            result[ratio_key] = float(ratio_match.group(1))
+                        if amount_match:
+                            result[amount_key] = float(amount_match.group(1).replace(",", ""))
 
             # 배당수익률 파싱
-            div_match = re.search(r"배당수익률.*?(\d+\.?\d*)\s*%", resp.text)
+            div_match = _DIV_RE.search(resp.text)
             if div_match:
                 result["dividend_yield"] = float(div_match.group(1))
 
@@ -254,14 +346,7 @@ class StockPriceCollector:
 
         # OHLCV 조회로 검증
         try:
-            end = date.today()
-            start = end - timedelta(days=30)
-            df = pykrx.get_market_ohlcv(
-                start.strftime("%Y%m%d"),
-                end.strftime("%Y%m%d"),
-                code,
-            )
-            return not df.empty
+            return _has_recent_ohlcv(code, _today())
         except Exception:
             return False
 
@@ -281,16 +366,23 @@ class StockPriceCollector:
         Returns:
             [{"code": "005930", "name": "삼성전자", "trading_value": 1000000000, "change_rate": 2.5}, ...]
         """
+        return self._get_ranked_stocks(market, limit=top_n)
+
+    def _get_ranked_stocks(self, market: str = "KOSPI", limit: int = 100) -> list[dict]:
+        """거래대금 순으로 정렬한 상위 종목 목록"""
         try:
+            import pandas as pd
+
             # FinanceDataReader로 종목 목록 조회 (최신 거래일 기준)
+            day = _today()
             if market.upper() == "ALL":
-                kospi = fdr.StockListing("KOSPI")
-                kosdaq = fdr.StockListing("KOSDAQ")
+                kospi = _stock_listing("KOSPI", day)
+                kosdaq = _stock_listing("KOSDAQ", day)
                 df = pd.concat([kospi, kosdaq], ignore_index=True)
             elif market.upper() == "KOSDAQ":
-                df = fdr.StockListing("KOSDAQ")
+                df = _stock_listing("KOSDAQ", day)
             else:  # KOSPI
-                df = fdr.StockListing("KOSPI")
+                df = _stock_listing("KOSPI", day)
 
             if df.empty:
                 print("종목 목록 조회 실패")
@@ -301,7 +393,7 @@ class StockPriceCollector:
 
             # 상위 N개 선택
             results = []
-            for _, row in df.head(top_n).iterrows():
+            for _, row in df.head(limit).iterrows():
                 # 등락률 계산 (ChagesRatio가 있으면 사용, 없으면 계산)
                 change_rate = float(row.get("ChagesRatio", 0) or 0)
 
@@ -340,16 +432,19 @@ class StockPriceCollector:
         Returns:
             [{"code": "005930", "name": "삼성전자", "trading_value": 1000000000, "change_rate": 2.5}, ...]
         """
-        # 거래대금 상위 종목 데이터 재활용 (이미 수집된 데이터 사용)
-        all_stocks = self.get_top_stocks_by_trading_value(
-            target_date=target_date,
-            market=market,
-            top_n=100,  # 충분히 많은 종목 가져오기
-        )
+        # 거래대금 상위 종목 데이터 재활용 (충분히 많은 종목 가져오기)
+        all_stocks = self._get_ranked_stocks(market, limit=100)
 
-        if not all_stocks:
-            return []
+        return self._rank_by_change_rate(all_stocks, top_n, ascending, min_trading_value)
 
+    @staticmethod
+    def _rank_by_change_rate(
+        all_stocks: list[dict],
+        top_n: int,
+        ascending: bool,
+        min_trading_value: int,
+    ) -> list[dict]:
+        """거래대금 필터 후 등락률 순으로 정렬"""
         # 거래대금 필터
         filtered = [s for s in all_stocks if s["trading_value"] >= min_trading_value]
 
@@ -376,9 +471,17 @@ class StockPriceCollector:
         if target_date is None:
             target_date = date.today()
 
+        # 종목 목록을 한 번만 조회해 세 가지 순위를 모두 계산
+        ranked = self._get_ranked_stocks("KOSPI", limit=100)
+        min_trading_value = 1_000_000_000
+
         return {
             "date": target_date.isoformat(),
-            "top_trading_value": self.get_top_stocks_by_trading_value(target_date, top_n=top_n),
-            "top_gainers": self.get_top_stocks_by_change_rate(target_date, top_n=top_n, ascending=False),
-            "top_losers": self.get_top_stocks_by_change_rate(target_date, top_n=top_n, ascending=True),
+            "top_trading_value": ranked[:top_n],
+            "top_gainers": self._rank_by_change_rate(
+                ranked, top_n, ascending=False, min_trading_value=min_trading_value
+            ),
+            "top_losers": self._rank_by_change_rate(
+                ranked, top_n, ascending=True, min_trading_value=min_trading_value
+            ),
         }
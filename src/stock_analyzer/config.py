@@ -1,5 +1,6 @@
 """환경 설정 모듈"""
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -13,6 +14,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # DART API (필수)
@@ -20,6 +22,8 @@ class Settings(BaseSettings):
 
     # OpenAI API (선택)
     openai_api_key: str | None = Field(default=None, description="OpenAI API 키")
+    openai_rpm: int = Field(default=500, description="OpenAI 분당 요청 수 한도")
+    openai_tpm: int = Field(default=200_000, description="OpenAI 분당 토큰 수 한도")
 
     # 네이버 검색 API (선택)
     naver_client_id: str | None = Field(default=None, description="네이버 Client ID")
@@ -44,6 +48,20 @@ class Settings(BaseSettings):
         description="OAuth 토큰 저장 디렉토리",
     )
 
+    # AI / HTTP 응답 캐시
+    cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "stock-analyzer",
+        description="캐시 저장 디렉토리",
+    )
+    llm_cache_ttl: int = Field(
+        default=6 * 60 * 60,
+        description="AI 응답 캐시 유지 시간 (초, 0이면 비활성화)",
+    )
+    http_cache_ttl: int = Field(
+        default=6 * 60 * 60,
+        description="네이버 HTTP 응답 캐시 유지 시간 (초, 0이면 비활성화)",
+    )
+
     @property
     def has_openai(self) -> bool:
         """OpenAI API 사용 가능 여부"""
@@ -65,13 +83,7 @@ class Settings(BaseSettings):
         self.token_dir.mkdir(parents=True, exist_ok=True)
 
 
-# 싱글톤 설정 인스턴스
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """설정 인스턴스 반환"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """설정 인스턴스 반환 (최초 1회만 .env 로드)"""
+    return Settings()
@@ -0,0 +1,179 @@
+"""기술적 지표 계산 커널 (numba JIT, 미설치 시 순수 Python으로 실행)"""
+
+import math
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def _identity_njit(*args: Any, **kwargs: Any) -> Any:
+        """numba 미설치 시 함수를 그대로 반환하는 대체 데코레이터"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+    njit = _identity_njit
+
+
+# EMA 상태 슬롯 (state[slot] = [입력 개수, SMA 합계 → EMA 값], alphas[slot] = 평활 계수)
+_MACD_FAST = 0
+_MACD_SLOW = 1
+_MACD_SIGNAL = 2
+_TRIX_EMA1 = 3
+_TRIX_EMA2 = 4
+_TRIX_EMA3 = 5
+
+
+@lru_cache(maxsize=16)
+def ema_alphas(
+    trix_length: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+) -> np.ndarray:
+    """EMA 슬롯별 평활 계수 2 / (기간 + 1) 배열 생성 (기간 조합별 캐시, 읽기 전용)"""
+    alphas = np.empty(6)
+    alphas[_MACD_FAST] = 2.0 / (macd_fast + 1)
+    alphas[_MACD_SLOW] = 2.0 / (macd_slow + 1)
+    alphas[_MACD_SIGNAL] = 2.0 / (macd_signal + 1)
+    alphas[_TRIX_EMA1] = alphas[_TRIX_EMA2] = alphas[_TRIX_EMA3] = 2.0 / (trix_length + 1)
+    alphas.setflags(write=False)
+    return alphas
+
+
+@njit(cache=True)
+def _ema_step(
+    state: np.ndarray,
+    alphas: np.ndarray,
+    slot: int,
+    value: float,
+    length: int,
+) -> float:
+    """EMA 한 단계 갱신 (처음 length개는 SMA로 시드, 시드 전에는 NaN)"""
+    if math.isnan(value):
+        return math.nan
+
+    count = state[slot, 0]
+    if count < length:
+        state[slot, 0] = count + 1
+        state[slot, 1] += value
+        if count + 1 < length:
+            return math.nan
+        state[slot, 1] /= length
+        return float(state[slot, 1])
+
+    state[slot, 1] += alphas[slot] * (value - state[slot, 1])
+    return float(state[slot, 1])
+
+
+@njit(cache=True)
+def compute_all(
+    close: np.ndarray,
+    rsi_length: int,
+    trix_length: int,
+    trix_signal: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+    alphas: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """RSI, TRIX, TRIX 시그널, MACD, MACD 시그널, 히스토그램을 한 번의 순회로 계산
+
+    TA-Lib과 같은 방식(EMA는 SMA 시드, RSI는 Wilder 평활, TRIX 시그널은 단순 이동평균)으로
+    계산하며, 값이 정의되지 않는 앞부분은 NaN으로 채운다.
+    alphas는 슬롯 순서의 EMA 평활 계수로, ema_alphas()로 미리 만들어 전달한다.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    trix = np.full(n, np.nan)
+    trix_sig = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    macd_sig = np.full(n, np.nan)
+    macd_hist = np.full(n, np.nan)
+
+    state = np.zeros((6, 2))
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    prev_ema3 = math.nan
+    window = np.zeros(trix_signal)
+    window_sum = 0.0
+    window_count = 0
+
+    # TA-Lib MACD는 빠른 EMA를 느린 EMA의 첫 값 위치에 맞춰 시드한다
+    fast_start = macd_slow - macd_fast
+    macd_start = macd_slow + macd_signal - 2
+
+    for i in range(n):
+        price = close[i]
+
+        # RSI (Wilder 평활)
+        if i > 0:
+            diff = price - close[i - 1]
+            gain = diff if diff > 0 else 0.0
+            loss = -diff if diff < 0 else 0.0
+            if i <= rsi_length:
+                avg_gain += gain
+                avg_loss += loss
+                if i == rsi_length:
+                    avg_gain /= rsi_length
+                    avg_loss /= rsi_length
+            else:
+                avg_gain = (avg_gain * (rsi_length - 1) + gain) / rsi_length
+                avg_loss = (avg_loss * (rsi_length - 1) + loss) / rsi_length
+            if i >= rsi_length:
+                total = avg_gain + avg_loss
+                rsi[i] = 100.0 * avg_gain / total if total != 0 else 0.0
+
+        # TRIX (삼중 EMA의 1일 변화율) + 시그널 (단순 이동평균)
+        ema1 = _ema_step(state, alphas, _TRIX_EMA1, price, trix_length)
+        ema2 = _ema_step(state, alphas, _TRIX_EMA2, ema1, trix_length)
+        ema3 = _ema_step(state, alphas, _TRIX_EMA3, ema2, trix_length)
+        if not math.isnan(ema3) and not math.isnan(prev_ema3):
+            value = (ema3 / prev_ema3 - 1.0) * 100.0 if prev_ema3 != 0 else 0.0
+            trix[i] = value
+            slot = window_count % trix_signal
+            window_sum += value - window[slot]
+            window[slot] = value
+            window_count += 1
+            if window_count >= trix_signal:
+                trix_sig[i] = window_sum / trix_signal
+        prev_ema3 = ema3
+
+        # MACD
+        slow_ema = _ema_step(state, alphas, _MACD_SLOW, price, macd_slow)
+        fast_ema = (
+            _ema_step(state, alphas, _MACD_FAST, price, macd_fast) if i >= fast_start else math.nan
+        )
+        if not math.isnan(slow_ema) and not math.isnan(fast_ema):
+            line = fast_ema - slow_ema
+            signal_line = _ema_step(state, alphas, _MACD_SIGNAL, line, macd_signal)
+            if i >= macd_start:
+                macd[i] = line
+                macd_sig[i] = signal_line
+                macd_hist[i] = line - signal_line
+
+    return rsi, trix, trix_sig, macd, macd_sig, macd_hist
+
+
+def warmup() -> None:
+    """작은 더미 배열로 커널을 한 번 실행해 JIT 컴파일 비용을 미리 지불
+
+    cache=True로 컴파일 결과가 __pycache__에 저장되므로 이후 실행에서는 캐시 로드만 한다.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    compute_all(np.ones(50), 14, 15, 9, 12, 26, 9, ema_alphas(15, 12, 26, 9))
@@ -1,10 +1,50 @@
 """기술적 지표 계산 모듈"""
 
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
+from stock_analyzer.indicators.kernels import compute_all, ema_alphas
 from stock_analyzer.models import PriceData, Signal, SignalType, TechnicalIndicators
 
+# 지표 계산은 kernels.compute_all로 수행하므로 TA-Lib(네이티브 C 라이브러리)은
+# 개별 지표 계산 함수(calculate_rsi/trix/macd) 안에서만 import
+
+# RSI 시그널 사유 (값 부분만 시그널 발생 시 포맷)
+_RSI_OVERSOLD_ENTER = "RSI {:.1f} - 과매도 구간 진입"
+_RSI_OVERBOUGHT_ENTER = "RSI {:.1f} - 과매수 구간 진입"
+_RSI_OVERSOLD_EXIT = "RSI {:.1f} - 과매도 구간 탈출"
+_RSI_OVERBOUGHT_EXIT = "RSI {:.1f} - 과매수 구간 탈출"
+
+
+@lru_cache(maxsize=64)
+def _cached_columns(
+    close_bytes: bytes,
+    rsi_length: int,
+    trix_length: int,
+    trix_signal: int,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+) -> tuple[np.ndarray, ...]:
+    """종가 배열(바이트)과 기간 설정별 지표 배열 캐시 (같은 데이터의 반복 계산 방지)"""
+    columns = compute_all(
+        np.frombuffer(close_bytes, dtype=np.float64),
+        rsi_length,
+        trix_length,
+        trix_signal,
+        macd_fast,
+        macd_slow,
+        macd_signal,
+        ema_alphas(trix_length, macd_fast, macd_slow, macd_signal),
+    )
+    # 캐시된 배열이 호출자에 의해 바뀌지 않도록 읽기 전용으로 설정
+    for column in columns:
+        column.setflags(write=False)
+    return columns
+
 
 class TechnicalIndicatorCalculator:
     """기술적 지표 계산기"""
@@ -28,39 +68,81 @@ class TechnicalIndicatorCalculator:
     def calculate_all(
         self,
         price_data: list[PriceData],
+        start: date | None = None,
     ) -> list[TechnicalIndicators]:
-        """모든 기술적 지표 계산"""
+        """모든 기술적 지표 계산
+
+        start가 주어지면 지표는 전체 데이터로 계산하되 start 이후 날짜의 지표만 생성한다.
+        """
         if not price_data:
             return []
 
-        # DataFrame으로 변환
-        df = pd.DataFrame([p.model_dump() for p in price_data])
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.set_index("date")
+        columns = self._compute_columns(price_data)
+
+        first = 0
+        if start is not None:
+            first = next(
+                (i for i, p in enumerate(price_data) if p.date >= start),
+                len(price_data),
+            )
+
+        return self._build_indicators(price_data[first:], [c[first:] for c in columns])
 
-        close = df["close"]
+    def calculate_last_two(
+        self,
+        price_data: list[PriceData],
+    ) -> list[TechnicalIndicators]:
+        """시그널 판단에 필요한 마지막 2일의 지표만 계산"""
+        if not price_data:
+            return []
 
-        # RSI 계산
-        rsi = self.calculate_rsi(close)
+        columns = self._compute_columns(price_data)
+        return self._build_indicators(price_data[-2:], [c[-2:] for c in columns])
 
-        # TRIX 계산
-        trix, trix_sig = self.calculate_trix(close)
+    def _compute_columns(
+        self,
+        price_data: list[PriceData],
+    ) -> tuple[np.ndarray, ...]:
+        """RSI, TRIX, TRIX 시그널, MACD, MACD 시그널, 히스토그램 배열 계산"""
+        close = np.fromiter((p.close for p in price_data), np.float64, len(price_data))
+
+        # RSI, TRIX, MACD를 한 번의 순회로 계산 (같은 종가 배열이면 캐시 재사용)
+        return _cached_columns(
+            close.tobytes(),
+            self.rsi_length,
+            self.trix_length,
+            self.trix_signal,
+            self.macd_fast,
+            self.macd_slow,
+            self.macd_signal,
+        )
+
+    def _build_indicators(
+        self,
+        price_data: list[PriceData],
+        columns: list[np.ndarray],
+    ) -> list[TechnicalIndicators]:
+        """지표 배열을 날짜별 TechnicalIndicators 리스트로 변환
 
-        # MACD 계산
-        macd, macd_sig, macd_hist = self.calculate_macd(close)
+        값은 이미 float 또는 None으로 정리되어 있으므로 Pydantic 검증 없이 생성한다.
+        """
+        rsi, trix, trix_sig, macd, macd_sig, macd_hist = (
+            [self._safe_float(v) for v in column.tolist()] for column in columns
+        )
 
-        # TechnicalIndicators 리스트로 변환
         indicators = []
-        for i, date in enumerate(df.index):
+        for p, r, t, ts, m, ms, mh in zip(
+            price_data, rsi, trix, trix_sig, macd, macd_sig, macd_hist, strict=True
+        ):
             indicators.append(
-                TechnicalIndicators(
-                    date=date.date(),
-                    rsi=self._safe_float(rsi.iloc[i]) if i < len(rsi) else None,
-                    trix=self._safe_float(trix.iloc[i]) if i < len(trix) else None,
-                    trix_signal=self._safe_float(trix_sig.iloc[i]) if i < len(trix_sig) else None,
-                    macd=self._safe_float(macd.iloc[i]) if i < len(macd) else None,
-                    macd_signal=self._safe_float(macd_sig.iloc[i]) if i < len(macd_sig) else None,
-                    macd_histogram=self._safe_float(macd_hist.iloc[i]) if i < len(macd_hist) else None,
+                TechnicalIndicators.model_construct(
+                    date=p.date,
+                    rsi=r,
+                    trix=t,
+                    trix_signal=ts,
+                    macd=m,
+                    macd_signal=ms,
+                    macd_histogram=mh,
                 )
             )
 
@@ -72,11 +154,11 @@ class TechnicalIndicatorCalculator:
         length: int | None = None,
     ) -> pd.Series:
         """RSI 계산"""
+        import talib
+
         length = length or self.rsi_length
-        result = ta.rsi(close, length=length)
-        if result is None:
-            return pd.Series([None] * len(close), index=close.index)
-        return result
+        rsi = talib.RSI(self._to_array(close), timeperiod=length)
+        return pd.Series(rsi, index=close.index)
 
     def calculate_trix(
         self,
@@ -85,22 +167,16 @@ class TechnicalIndicatorCalculator:
         signal: int | None = None,
     ) -> tuple[pd.Series, pd.Series]:
         """TRIX + 시그널 계산"""
+        import talib
+
         length = length or self.trix_length
         signal = signal or self.trix_signal
 
-        trix_df = ta.trix(close, length=length, signal=signal)
-
-        if trix_df is None or trix_df.empty:
-            empty = pd.Series([None] * len(close), index=close.index)
-            return empty, empty
-
-        trix_col = f"TRIX_{length}_{signal}"
-        signal_col = f"TRIXs_{length}_{signal}"
+        trix = talib.TRIX(self._to_array(close), timeperiod=length)
+        # 시그널은 TRIX의 단순 이동평균 (기존 pandas-ta 계산과 동일)
+        trix_sig = talib.SMA(trix, timeperiod=signal)
 
-        trix = trix_df[trix_col] if trix_col in trix_df.columns else trix_df.iloc[:, 0]
-        trix_sig = trix_df[signal_col] if signal_col in trix_df.columns else trix_df.iloc[:, 1]
-
-        return trix, trix_sig
+        return pd.Series(trix, index=close.index), pd.Series(trix_sig, index=close.index)
 
     def calculate_macd(
         self,
@@ -110,31 +186,38 @@ class TechnicalIndicatorCalculator:
         signal: int | None = None,
     ) -> tuple[pd.Series, pd.Series, pd.Series]:
         """MACD, 시그널, 히스토그램 계산"""
+        import talib
+
         fast = fast or self.macd_fast
         slow = slow or self.macd_slow
         signal = signal or self.macd_signal
 
-        macd_df = ta.macd(close, fast=fast, slow=slow, signal=signal)
-
-        if macd_df is None or macd_df.empty:
-            empty = pd.Series([None] * len(close), index=close.index)
-            return empty, empty, empty
+        macd, macd_sig, macd_hist = talib.MACD(
+            self._to_array(close),
+            fastperiod=fast,
+            slowperiod=slow,
+            signalperiod=signal,
+        )
 
-        macd_col = f"MACD_{fast}_{slow}_{signal}"
-        signal_col = f"MACDs_{fast}_{slow}_{signal}"
-        hist_col = f"MACDh_{fast}_{slow}_{signal}"
+        return (
+            pd.Series(macd, index=close.index),
+            pd.Series(macd_sig, index=close.index),
+            pd.Series(macd_hist, index=close.index),
+        )
 
-        macd = macd_df[macd_col] if macd_col in macd_df.columns else macd_df.iloc[:, 0]
-        macd_sig = macd_df[signal_col] if signal_col in macd_df.columns else macd_df.iloc[:, 1]
-        macd_hist = macd_df[hist_col] if hist_col in macd_df.columns else macd_df.iloc[:, 2]
-
-        return macd, macd_sig, macd_hist
+    @staticmethod
+    def _to_array(close: pd.Series) -> np.ndarray:
+        """TA-Lib 입력용 연속 float64 배열로 변환"""
+        return np.ascontiguousarray(close.to_numpy(dtype=np.float64))
 
     def generate_signals(
         self,
         indicators: list[TechnicalIndicators],
     ) -> list[Signal]:
-        """매매 시그널 생성"""
+        """매매 시그널 생성
+
+        시그널 값은 계산기 내부에서 검증된 범위로만 만들어지므로 Pydantic 검증을 생략한다.
+        """
         if len(indicators) < 2:
             return []
 
@@ -172,6 +255,66 @@ class TechnicalIndicatorCalculator:
 
         return signals
 
+    def generate_signals_all(
+        self,
+        price_data: list[PriceData],
+    ) -> list[tuple[date, Signal]]:
+        """전체 기간의 날짜별 매매 시그널 생성 (백테스트용)
+
+        구간 진입·교차 조건을 배열 연산으로 한 번에 판별하고, 조건이 성립한 날에만
+        generate_signals와 같은 규칙으로 시그널을 만든다.
+        """
+        if len(price_data) < 2:
+            return []
+
+        rsi, trix, trix_sig, macd, macd_sig, _ = self._compute_columns(price_data)
+        found: list[tuple[int, int, Signal | None]] = []
+
+        # RSI: 과매도/과매수 구간 안이거나 구간을 벗어난 날
+        prev_rsi, cur_rsi = rsi[:-1], rsi[1:]
+        rsi_mask = (
+            (cur_rsi < 30)
+            | (cur_rsi > 70)
+            | ((prev_rsi < 30) & (cur_rsi >= 30))
+            | ((prev_rsi > 70) & (cur_rsi <= 70))
+        )
+        for i in (np.flatnonzero(rsi_mask) + 1).tolist():
+            signal = self._generate_rsi_signal(float(rsi[i]), self._safe_float(rsi[i - 1]))
+            found.append((i, 0, signal))
+
+        # TRIX / MACD: 시그널선 교차 또는 0선 돌파가 일어난 날
+        for order, line, line_signal, generate in (
+            (1, trix, trix_sig, self._generate_trix_signal),
+            (2, macd, macd_sig, self._generate_macd_signal),
+        ):
+            for i in self._cross_candidates(line, line_signal).tolist():
+                signal = generate(
+                    float(line[i]),
+                    float(line_signal[i]),
+                    float(line[i - 1]),
+                    float(line_signal[i - 1]),
+                )
+                found.append((i, order, signal))
+
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [(price_data[i].date, signal) for i, _, signal in found if signal]
+
+    @staticmethod
+    def _cross_candidates(line: np.ndarray, signal: np.ndarray) -> np.ndarray:
+        """시그널선 교차 또는 0선 돌파가 일어난 위치 (전날과 당일 값이 모두 있는 경우만)"""
+        prev_line, cur_line = line[:-1], line[1:]
+        prev_signal, cur_signal = signal[:-1], signal[1:]
+
+        valid = ~(
+            np.isnan(prev_line) | np.isnan(cur_line) | np.isnan(prev_signal) | np.isnan(cur_signal)
+        )
+        golden = (prev_line <= prev_signal) & (cur_line > cur_signal)
+        dead = (prev_line >= prev_signal) & (cur_line < cur_signal)
+        zero_up = (prev_line <= 0) & (cur_line > 0)
+        zero_down = (prev_line >= 0) & (cur_line < 0)
+
+        return np.flatnonzero(valid & (golden | dead | zero_up | zero_down)) + 1
+
     def _generate_rsi_signal(
         self,
         current_rsi: float,
@@ -181,35 +324,35 @@ class TechnicalIndicatorCalculator:
         if current_rsi < 30:
             # 과매도 구간
             strength = min(5, int((30 - current_rsi) / 6) + 1)
-            return Signal(
+            return Signal.model_construct(
                 indicator="RSI",
                 signal=SignalType.BUY,
-                reason=f"RSI {current_rsi:.1f} - 과매도 구간 진입",
+                reason=_RSI_OVERSOLD_ENTER.format(current_rsi),
                 strength=strength,
             )
         elif current_rsi > 70:
             # 과매수 구간
             strength = min(5, int((current_rsi - 70) / 6) + 1)
-            return Signal(
+            return Signal.model_construct(
                 indicator="RSI",
                 signal=SignalType.SELL,
-                reason=f"RSI {current_rsi:.1f} - 과매수 구간 진입",
+                reason=_RSI_OVERBOUGHT_ENTER.format(current_rsi),
                 strength=strength,
             )
         elif prev_rsi is not None:
             # 과매도/과매수 탈출
             if prev_rsi < 30 <= current_rsi:
-                return Signal(
+                return Signal.model_construct(
                     indicator="RSI",
                     signal=SignalType.BUY,
-                    reason=f"RSI {current_rsi:.1f} - 과매도 구간 탈출",
+                    reason=_RSI_OVERSOLD_EXIT.format(current_rsi),
                     strength=2,
                 )
             elif prev_rsi > 70 >= current_rsi:
-                return Signal(
+                return Signal.model_construct(
                     indicator="RSI",
                     signal=SignalType.SELL,
-                    reason=f"RSI {current_rsi:.1f} - 과매수 구간 탈출",
+                    reason=_RSI_OVERBOUGHT_EXIT.format(current_rsi),
                     strength=2,
                 )
 
@@ -229,33 +372,33 @@ class TechnicalIndicatorCalculator:
         # 골든 크로스 (TRIX가 시그널 상향 돌파)
         if prev_trix <= prev_signal and current_trix > current_signal:
             strength = min(5, int(abs(current_trix - current_signal) * 10) + 2)
-            return Signal(
+            return Signal.model_construct(
                 indicator="TRIX",
                 signal=SignalType.BUY,
-                reason=f"TRIX 골든크로스 - 시그널 상향 돌파",
+                reason="TRIX 골든크로스 - 시그널 상향 돌파",
                 strength=strength,
             )
 
         # 데드 크로스 (TRIX가 시그널 하향 돌파)
         if prev_trix >= prev_signal and current_trix < current_signal:
             strength = min(5, int(abs(current_trix - current_signal) * 10) + 2)
-            return Signal(
+            return Signal.model_construct(
                 indicator="TRIX",
                 signal=SignalType.SELL,
-                reason=f"TRIX 데드크로스 - 시그널 하향 돌파",
+                reason="TRIX 데드크로스 - 시그널 하향 돌파",
                 strength=strength,
             )
 
         # 0선 돌파
         if prev_trix <= 0 < current_trix:
-            return Signal(
+            return Signal.model_construct(
                 indicator="TRIX",
                 signal=SignalType.BUY,
                 reason="TRIX 0선 상향 돌파",
                 strength=2,
             )
         elif prev_trix >= 0 > current_trix:
-            return Signal(
+            return Signal.model_construct(
                 indicator="TRIX",
                 signal=SignalType.SELL,
                 reason="TRIX 0선 하향 돌파",
@@ -278,7 +421,7 @@ class TechnicalIndicatorCalculator:
         # 골든 크로스 (MACD가 시그널 상향 돌파)
         if prev_macd <= prev_signal and current_macd > current_signal:
             strength = min(5, int(abs(current_macd - current_signal) / 100) + 2)
-            return Signal(
+            return Signal.model_construct(
                 indicator="MACD",
                 signal=SignalType.BUY,
                 reason="MACD 골든크로스 - 시그널 상향 돌파",
@@ -288,7 +431,7 @@ class TechnicalIndicatorCalculator:
         # 데드 크로스 (MACD가 시그널 하향 돌파)
         if prev_macd >= prev_signal and current_macd < current_signal:
             strength = min(5, int(abs(current_macd - current_signal) / 100) + 2)
-            return Signal(
+            return Signal.model_construct(
                 indicator="MACD",
                 signal=SignalType.SELL,
                 reason="MACD 데드크로스 - 시그널 하향 돌파",
@@ -297,14 +440,14 @@ class TechnicalIndicatorCalculator:
 
         # 0선 돌파
         if prev_macd <= 0 < current_macd:
-            return Signal(
+            return Signal.model_construct(
                 indicator="MACD",
                 signal=SignalType.BUY,
                 reason="MACD 0선 상향 돌파",
                 strength=2,
             )
         elif prev_macd >= 0 > current_macd:
-            return Signal(
+            return Signal.model_construct(
                 indicator="MACD",
                 signal=SignalType.SELL,
                 reason="MACD 0선 하향 돌파",
@@ -316,8 +459,7 @@ class TechnicalIndicatorCalculator:
     @staticmethod
     def _safe_float(value: float | None) -> float | None:
         """NaN을 None으로 변환"""
-        if value is None:
-            return None
-        if pd.isna(value):
+        # NaN은 자기 자신과 같지 않음 (pd.isna 디스패치 생략)
+        if value is None or value != value:
             return None
         return float(value)
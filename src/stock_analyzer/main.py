@@ -1,20 +1,21 @@
 """CLI 진입점"""
 
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from pypdf import PdfWriter
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
 from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
-from stock_analyzer.collectors.stock_price import StockNotFoundError, StockPriceCollector
 from stock_analyzer.config import get_settings
-from stock_analyzer.notifiers.github_uploader import GitHubUploader
-from stock_analyzer.notifiers.kakao import KakaoNotifier
+from stock_analyzer.indicators.kernels import warmup as warmup_indicator_kernels
+from stock_analyzer.models import StockReport
 from stock_analyzer.reports.generator import ReportGenerator
 
 app = typer.Typer(
@@ -25,6 +26,12 @@ app = typer.Typer(
 
 console = Console()
 
+# 리포트 PDF 동시 생성 종목 수
+MAX_REPORT_WORKERS = 8
+
+# 리포트 파일명 끝의 날짜 (예: 005930_1m_20250101.pdf, stock_report_20250101.pdf)
+_REPORT_DATE_RE = re.compile(r"_(\d{8})\.pdf$")
+
 
 def parse_preset(preset: str) -> int:
     """프리셋을 일수로 변환"""
@@ -40,6 +47,10 @@ def parse_preset(preset: str) -> int:
 
 def select_top_stocks(top_n: int = 10, market: str = "ALL") -> list[dict]:
     """거래대금 상위 종목 자동 선정"""
+    from rich.table import Table
+
+    from stock_analyzer.collectors.stock_price import StockPriceCollector
+
     console.print(f"\n[bold blue]거래대금 상위 {top_n}개 종목 조회 중...[/bold blue]")
 
     collector = StockPriceCollector()
@@ -84,35 +95,60 @@ def select_top_stocks(top_n: int = 10, market: str = "ALL") -> list[dict]:
     return stocks
 
 
-def generate_report_for_period(
-    analyzer: StockAnalyzer,
+def generate_report_pdf(
     generator: ReportGenerator,
-    code: str,
-    days: int,
+    report: StockReport,
     output_dir: Path,
 ) -> Path | None:
-    """특정 기간에 대한 리포트 생성"""
-    end = date.today()
-    start = end - timedelta(days=days)
-
+    """분석 결과로 리포트 PDF 생성"""
     try:
-        report = analyzer.analyze(code, start, end)
-        pdf_path = generator.generate_pdf(report, output_dir)
-        return pdf_path
-    except StockNotFoundError as e:
-        console.print(f"[red]오류: {e}[/red]")
-        return None
+        return generator.generate_pdf(report, output_dir)
     except Exception as e:
         console.print(f"[red]리포트 생성 실패: {e}[/red]")
         return None
 
 
+def generate_stock_reports(
+    generator: ReportGenerator,
+    stock: dict,
+    index: int,
+    total: int,
+    reports: list[tuple[int, StockReport | None]],
+    output_dir: Path,
+) -> list[Path]:
+    """한 종목의 기간별 리포트 PDF 생성 (reports: (기간 일수, 리포트) 목록)"""
+    code = stock["code"]
+    name = stock.get("name", code)
+
+    console.print(Panel(
+        f"[bold]({index}/{total}) {name} ({code})[/bold]",
+        style="blue"
+    ))
+
+    pdf_paths: list[Path] = []
+    for days, report in reports:
+        if report is None:
+            continue
+
+        console.print(f"\n[bold cyan]>>> {name} {days}일 리포트 생성[/bold cyan]")
+        pdf_path = generate_report_pdf(generator, report, output_dir)
+
+        if pdf_path:
+            pdf_paths.append(pdf_path)
+            console.print(f"[green]✓ 리포트 생성 완료: {pdf_path}[/green]")
+
+    return pdf_paths
+
+
 def merge_pdfs(pdf_paths: list[Path], output_path: Path, delete_originals: bool = False) -> Path:
     """여러 PDF를 하나로 합치기"""
+    from pypdf import PdfReader, PdfWriter
+
     writer = PdfWriter()
 
+    # 개요(북마크)·이름 있는 대상 재구성 없이 페이지만 이어 붙임
     for pdf_path in pdf_paths:
-        writer.append(str(pdf_path))
+        writer.append_pages_from_reader(PdfReader(pdf_path))
 
     with open(output_path, "wb") as output_file:
         writer.write(output_file)
@@ -130,30 +166,45 @@ def merge_pdfs(pdf_paths: list[Path], output_path: Path, delete_originals: bool
 
 def cleanup_old_reports(output_dir: Path, max_reports: int = 10) -> None:
     """오래된 리포트 삭제 (최신 N개만 유지)"""
-    pdf_files = list(output_dir.glob("*.pdf"))
+    # 디렉토리를 한 번만 읽고 DirEntry의 캐시된 정보 사용
+    with os.scandir(output_dir) as entries:
+        pdf_entries = [e for e in entries if e.name.endswith(".pdf") and e.is_file()]
 
-    if len(pdf_files) <= max_reports:
+    if len(pdf_entries) <= max_reports:
         return
 
-    # 수정 시간 기준 정렬 (오래된 것 먼저)
-    pdf_files.sort(key=lambda f: f.stat().st_mtime)
+    # 파일명의 날짜 기준 정렬 (오래된 것 먼저)
+    pdf_entries.sort(key=_report_sort_key)
 
     # 삭제할 파일 수
-    files_to_delete = pdf_files[: len(pdf_files) - max_reports]
+    entries_to_delete = pdf_entries[: len(pdf_entries) - max_reports]
 
-    for pdf_path in files_to_delete:
+    for entry in entries_to_delete:
         try:
-            pdf_path.unlink()
-            console.print(f"[dim]🗑 오래된 리포트 삭제: {pdf_path.name}[/dim]")
+            os.unlink(entry.path)
+            console.print(f"[dim]🗑 오래된 리포트 삭제: {entry.name}[/dim]")
         except Exception:
             pass
 
 
+def _report_sort_key(entry: os.DirEntry[str]) -> tuple[str, str]:
+    """리포트 정렬 키 (파일명 날짜, 날짜가 없으면 수정 시간 날짜)"""
+    match = _REPORT_DATE_RE.search(entry.name)
+    if match:
+        report_date = match.group(1)
+    else:
+        report_date = date.fromtimestamp(entry.stat().st_mtime).strftime("%Y%m%d")
+    return report_date, entry.name
+
+
 def send_kakao_notification(
     pdf_paths: list[Path],
     stock_name: str,
 ) -> bool:
     """카카오톡으로 리포트 알림 전송 (GitHub 링크 포함)"""
+    from stock_analyzer.notifiers.github_uploader import GitHubUploader
+    from stock_analyzer.notifiers.kakao import KakaoNotifier
+
     # 카카오 알림기
     notifier = KakaoNotifier()
     if not notifier.is_available:
@@ -285,6 +336,9 @@ def main(
     """
     settings = get_settings()
 
+    # 지표 커널 JIT 컴파일을 종목 선정·데이터 수집과 겹쳐 미리 진행
+    threading.Thread(target=warmup_indicator_kernels, daemon=True).start()
+
     # 출력 디렉토리 설정
     output_dir = output or settings.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -320,31 +374,32 @@ def main(
         periods = [30]
 
     all_pdf_paths: list[Path] = []
+    codes_to_analyze = [stock["code"] for stock in stock_list]
+    today = date.today()
+
+    # 기간별로 전체 종목 동시 분석 (AI 요청은 공용 풀에서 속도 제한)
+    reports_by_period: dict[int, list[StockReport | None]] = {}
+    for days in periods:
+        console.print(
+            f"\n[bold cyan]>>> {days}일 분석 ({len(codes_to_analyze)}개 종목)[/bold cyan]"
+        )
+        reports_by_period[days] = analyzer.analyze_many(
+            codes_to_analyze, today - timedelta(days=days), today
+        )
+
+    # 종목별 리포트 동시 생성 (AI 결과 대기·차트 생성이 겹치도록, 순서는 종목 순 유지)
+    def generate_one(item: tuple[int, dict]) -> list[Path]:
+        i, stock = item
+        reports = [(days, reports_by_period[days][i - 1]) for days in periods]
+        return generate_stock_reports(
+            generator, stock, i, len(stock_list), reports, output_dir
+        )
 
-    # 각 종목에 대해 리포트 생성
-    for i, stock in enumerate(stock_list, 1):
-        code = stock["code"]
-        name = stock.get("name", code)
-
-        console.print(Panel(
-            f"[bold]({i}/{len(stock_list)}) {name} ({code})[/bold]",
-            style="blue"
-        ))
-
-        for days in periods:
-            console.print(f"\n[bold cyan]>>> {days}일 리포트 생성[/bold cyan]")
-
-            pdf_path = generate_report_for_period(
-                analyzer,
-                generator,
-                code,
-                days,
-                output_dir,
-            )
-
-            if pdf_path:
-                all_pdf_paths.append(pdf_path)
-                console.print(f"[green]✓ 리포트 생성 완료: {pdf_path}[/green]")
+    with ThreadPoolExecutor(
+        max_workers=min(len(stock_list), MAX_REPORT_WORKERS)
+    ) as executor:
+        for pdf_paths in executor.map(generate_one, enumerate(stock_list, 1)):
+            all_pdf_paths.extend(pdf_paths)
 
     # PDF 병합 (2개 이상일 경우 자동 병합)
     merged_pdf: Path | None = None
@@ -1,9 +1,15 @@
-"""Pydantic 데이터 모델"""
+"""Pydantic 데이터 모델
 
+내부에서 계산·변환한 값(pykrx 가격, 기술적 지표, 시그널, 리포트 조립)은 이미 타입이 맞으므로
+model_construct로 검증 없이 생성한다. 외부에서 수집한 텍스트(뉴스, 공시, 종목 정보)와
+AI 응답은 일반 생성자로 검증한다.
+"""
+
+from concurrent.futures import Future
 from datetime import date, datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class StockInfo(BaseModel):
@@ -80,7 +86,7 @@ class Disclosure(BaseModel):
     """DART 공시"""
 
     title: str = Field(..., description="공시 제목")
-    date: str = Field(..., description="공시일 (YYYYMMDD)")
+    date: str = Field(..., description="공시일 (YYYY-MM-DD)")
     link: str = Field(..., description="공시 링크")
     filer: str = Field(..., description="공시자")
 
@@ -122,6 +128,23 @@ class StockReport(BaseModel):
     period_start: date
     period_end: date
 
+    # 백그라운드에서 진행 중인 AI 분석 (완료 시 ai_analysis에 반영)
+    _ai_future: Future[AIAnalysis | None] | None = PrivateAttr(default=None)
+
+    def set_ai_future(self, future: Future[AIAnalysis | None]) -> None:
+        """진행 중인 AI 분석 연결"""
+        self._ai_future = future
+
+    def resolve_ai_analysis(self) -> AIAnalysis | None:
+        """진행 중인 AI 분석이 있으면 완료까지 대기 후 결과 반영"""
+        if self._ai_future is not None:
+            try:
+                self.ai_analysis = self._ai_future.result()
+            except Exception:
+                self.ai_analysis = None
+            self._ai_future = None
+        return self.ai_analysis
+
     @property
     def latest_price(self) -> PriceData | None:
         """가장 최근 가격 데이터"""
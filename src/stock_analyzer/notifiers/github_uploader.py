@@ -1,12 +1,61 @@
 """GitHub Repository 파일 업로더 (현재 레포 사용)"""
 
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 import shutil
 
 from stock_analyzer.config import get_settings
 
+# 리포트 동시 복사 파일 수
+MAX_COPY_WORKERS = 8
+
+# 리포트 파일명의 날짜 (예: stock_report_20250115.pdf)
+_REPORT_DATE_RE = re.compile(r"_(\d{8})\.pdf$")
+
+
+@lru_cache(maxsize=4)
+def _github_repo_slug(repo_root: Path) -> str | None:
+    """origin remote URL에서 GitHub repo 정보(user/repo) 추출 (저장소별 캐시)"""
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+
+    url = result.stdout.strip()
+    # https://github.com/user/repo.git 또는 git@github.com:user/repo.git
+    if "github.com" not in url:
+        return None
+    if url.startswith("https://"):
+        # https://github.com/user/repo.git
+        return url.replace("https://github.com/", "").replace(".git", "")
+    if url.startswith("git@"):
+        # git@github.com:user/repo.git
+        return url.replace("git@github.com:", "").replace(".git", "")
+    return None
+
+
+def _report_sort_key(entry: os.DirEntry[str]) -> tuple[str, str]:
+    """리포트 정렬 키 (파일명 날짜, 날짜가 없으면 수정 시간 날짜)"""
+    match = _REPORT_DATE_RE.search(entry.name)
+    if match:
+        report_date = match.group(1)
+    else:
+        report_date = date.fromtimestamp(entry.stat().st_mtime).strftime("%Y%m%d")
+    return report_date, entry.name
+
 
 class GitHubUploader:
     """현재 Repository의 reports/ 폴더에 파일 업로드 (최신 N개 유지)"""
@@ -15,33 +64,31 @@ class GitHubUploader:
         self._settings = get_settings()
         self._max_reports = max_reports
         self._repo_root = self._find_repo_root()
-        self._setup_git_config()
 
     def _find_repo_root(self) -> Path | None:
-        """Git 레포지토리 루트 찾기"""
+        """Git 레포지토리 루트 찾기 (git 프로세스 없이 상위 디렉토리의 .git 탐색)"""
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return Path(result.stdout.strip())
-        except Exception:
-            pass
+            cwd = Path.cwd().resolve()
+        except OSError:
+            return None
+        for directory in (cwd, *cwd.parents):
+            # 일반 저장소는 .git 디렉토리, worktree/서브모듈은 .git 파일
+            if (directory / ".git").exists():
+                return directory
         return None
 
-    def _setup_git_config(self) -> None:
-        """Git config 설정 (GitHub Actions 환경 지원)"""
-        if not self._repo_root:
-            return
+    def _git_identity_args(self) -> list[str]:
+        """커밋 작성자 설정 인자 (GitHub Actions 환경 지원)
 
-        # GitHub Actions 환경인지 확인
+        저장소 config를 바꾸는 별도 git 프로세스 대신 commit 명령에 -c 옵션으로 전달한다.
+        """
         if os.environ.get("GITHUB_ACTIONS") == "true":
             # GitHub Actions bot으로 설정
-            self._run_git("config", "user.name", "github-actions[bot]")
-            self._run_git("config", "user.email", "github-actions[bot]@users.noreply.github.com")
+            return [
+                "-c", "user.name=github-actions[bot]",
+                "-c", "user.email=github-actions[bot]@users.noreply.github.com",
+            ]
+        return []
 
     @property
     def is_available(self) -> bool:
@@ -57,8 +104,16 @@ class GitHubUploader:
 
     def _run_git(self, *args: str) -> tuple[bool, str]:
         """Git 명령 실행"""
+        returncode, output = self._run_git_raw(*args)
+        return returncode == 0, output
+
+    def _run_git_raw(self, *args: str) -> tuple[int | None, str]:
+        """Git 명령 실행 후 종료 코드 그대로 반환 (실행 실패 시 None)
+
+        `diff --quiet`처럼 종료 코드 자체가 결과인 명령에 사용한다.
+        """
         if not self._repo_root:
-            return False, "Repository를 찾을 수 없습니다."
+            return None, "Repository를 찾을 수 없습니다."
 
         try:
             result = subprocess.run(
@@ -69,30 +124,18 @@ class GitHubUploader:
                 timeout=60,
             )
             if result.returncode != 0:
-                return False, result.stderr
-            return True, result.stdout
+                return result.returncode, result.stderr
+            return 0, result.stdout
         except subprocess.TimeoutExpired:
-            return False, "Git 명령 타임아웃"
+            return None, "Git 명령 타임아웃"
         except Exception as e:
-            return False, str(e)
+            return None, str(e)
 
     def _get_remote_url(self) -> str | None:
-        """Remote URL에서 repo 정보 추출"""
-        success, output = self._run_git("remote", "get-url", "origin")
-        if success:
-            url = output.strip()
-            # https://github.com/user/repo.git 또는 git@github.com:user/repo.git
-            if "github.com" in url:
-                if url.startswith("https://"):
-                    # https://github.com/user/repo.git
-                    repo = url.replace("https://github.com/", "").replace(".git", "")
-                elif url.startswith("git@"):
-                    # git@github.com:user/repo.git
-                    repo = url.replace("git@github.com:", "").replace(".git", "")
-                else:
-                    return None
-                return repo
-        return None
+        """Remote URL에서 repo 정보 추출 (user/repo)"""
+        if not self._repo_root:
+            return None
+        return _github_repo_slug(self._repo_root)
 
     def _cleanup_old_reports(self) -> int:
         """오래된 리포트 삭제 (최신 N개만 유지)
@@ -103,19 +146,23 @@ class GitHubUploader:
         if not self.reports_dir or not self.reports_dir.exists():
             return 0
 
-        # PDF 파일 목록 (수정 시간 기준 정렬)
-        pdf_files = sorted(
-            self.reports_dir.glob("*.pdf"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True,  # 최신 순
-        )
-
         # 최신 N개 제외하고 삭제
-        files_to_delete = pdf_files[self._max_reports:]
-        for f in files_to_delete:
-            f.unlink()
+        entries_to_delete = self._scan_reports()[self._max_reports:]
+        for entry in entries_to_delete:
+            os.unlink(entry.path)
 
-        return len(files_to_delete)
+        return len(entries_to_delete)
+
+    def _scan_reports(self) -> list[os.DirEntry[str]]:
+        """reports/ 폴더의 PDF 목록 (파일명 날짜 기준 최신 순)
+
+        파일명에 날짜(YYYYMMDD)가 있으면 문자열 비교만으로 정렬하고,
+        날짜가 없는 파일만 stat으로 수정 시간을 읽는다.
+        """
+        with os.scandir(self.reports_dir) as entries:
+            pdf_entries = [e for e in entries if e.name.endswith(".pdf") and e.is_file()]
+        pdf_entries.sort(key=_report_sort_key, reverse=True)
+        return pdf_entries
 
     def upload_reports(
         self,
@@ -142,13 +189,21 @@ class GitHubUploader:
         # 1. reports 폴더 생성
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
-        # 2. 새 파일 복사
+        # 2. 새 파일 복사 (copyfile은 Linux에서 sendfile로 커널 내 복사, 권한 복사 생략)
         print(f"📄 리포트 복사 중... ({len(pdf_paths)}개)")
-        for pdf_path in pdf_paths:
-            if pdf_path.exists():
-                dest = self.reports_dir / pdf_path.name
-                shutil.copy(pdf_path, dest)
-                print(f"   → {pdf_path.name}")
+        reports_dir = self.reports_dir
+
+        def copy_one(pdf_path: Path) -> str | None:
+            if not pdf_path.exists():
+                return None
+            shutil.copyfile(pdf_path, reports_dir / pdf_path.name)
+            return pdf_path.name
+
+        # 디스크 I/O 동안 GIL이 풀리므로 여러 파일을 동시에 복사
+        with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(pdf_paths))) as executor:
+            copied = [name for name in executor.map(copy_one, pdf_paths) if name]
+        if copied:
+            print(f"   → {', '.join(copied)}")
 
         # 3. 오래된 리포트 삭제
         deleted_count = self._cleanup_old_reports()
@@ -161,18 +216,21 @@ class GitHubUploader:
             print("❌ Git add 실패")
             return False, []
 
-        # 5. 변경사항 확인 (untracked 파일 포함)
-        success, status = self._run_git("status", "--porcelain", "-uall", "reports/")
-        if not status.strip():
+        # 5. 변경사항 확인 (add 이후이므로 staged 변경만 보면 됨, 0: 없음 / 1: 있음)
+        returncode, error = self._run_git_raw("diff", "--cached", "--quiet", "--", "reports/")
+        if returncode == 0:
             print("ℹ️  변경사항 없음")
             return True, self._get_file_links(pdf_paths)
+        if returncode != 1:
+            print(f"❌ 변경사항 확인 실패: {error}")
+            return False, []
 
         # 6. Commit
         if not commit_message:
             file_names = ", ".join(p.stem for p in pdf_paths)
             commit_message = f"📊 리포트 업데이트: {file_names}"
 
-        success, error = self._run_git("commit", "-m", commit_message)
+        success, error = self._run_git(*self._git_identity_args(), "commit", "-m", commit_message)
         if not success:
             print(f"❌ Commit 실패: {error}")
             return False, []
@@ -222,8 +280,4 @@ class GitHubUploader:
         if not self.reports_dir or not self.reports_dir.exists():
             return []
 
-        return sorted(
-            self.reports_dir.glob("*.pdf"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True,
-        )
+        return [Path(entry.path) for entry in self._scan_reports()]
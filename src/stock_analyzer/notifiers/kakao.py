@@ -1,15 +1,58 @@
 """카카오톡 나에게 보내기"""
 
-import json
 import webbrowser
+from functools import cached_property
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse
 
+import orjson
 import requests
 
 from stock_analyzer.config import get_settings
 
+# 피드 메시지 기본 이미지와 링크
+_FEED_IMAGE_URL = "https://via.placeholder.com/800x400/2962FF/FFFFFF?text=Stock+Report"
+_DEFAULT_LINK_URL = "https://github.com"
+
+# OAuth 콜백 응답 본문
+_AUTH_SUCCESS_HTML = (
+    b"<html><body><h1>Authentication successful!</h1>"
+    b"<p>You can close this window.</p></body></html>"
+)
+_AUTH_FAILED_HTML = b"<html><body><h1>Authentication failed</h1></body></html>"
+
+
+class _CallbackServer(HTTPServer):
+    """OAuth 콜백을 한 번 받아 인증 코드를 보관하는 서버"""
+
+    auth_code: str | None = None
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    """OAuth 리다이렉트 요청에서 인증 코드 추출 (모듈 수준에 한 번만 정의)"""
+
+    server: _CallbackServer
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+
+        if "code" in query:
+            self.server.auth_code = query["code"][0]
+            self.send_response(200)
+            self.send_header("Content-type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(_AUTH_SUCCESS_HTML)
+        else:
+            self.send_response(400)
+            self.send_header("Content-type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(_AUTH_FAILED_HTML)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # 로그 출력 억제
+
 
 class KakaoNotifier:
     """카카오톡 알림 발송기"""
@@ -22,6 +65,8 @@ class KakaoNotifier:
         self._settings = get_settings()
         self._access_token: str | None = None
         self._refresh_token: str | None = None
+        # 토큰 발급/갱신과 메시지 전송이 keep-alive 연결을 재사용하도록 세션 유지
+        self._session = requests.Session()
 
     @property
     def is_available(self) -> bool:
@@ -51,66 +96,40 @@ class KakaoNotifier:
 
         return self._exchange_code_for_token(auth_code)
 
-    def _get_auth_code(self) -> str | None:
-        """인증 코드 획득"""
-        # 인증 URL 생성
+    @cached_property
+    def _auth_url(self) -> str:
+        """인증 URL (설정값으로 한 번만 생성)"""
         params = {
             "client_id": self._settings.kakao_rest_api_key,
             "redirect_uri": self._settings.kakao_redirect_uri,
             "response_type": "code",
             "scope": "talk_message",
         }
-        auth_url = f"{self.AUTH_URL}?{urlencode(params)}"
-
-        # 콜백 서버 설정
-        auth_code = [None]  # 클로저에서 수정 가능하도록 리스트 사용
-
-        class CallbackHandler(BaseHTTPRequestHandler):
-            def do_GET(self):
-                parsed = urlparse(self.path)
-                query = parse_qs(parsed.query)
-
-                if "code" in query:
-                    auth_code[0] = query["code"][0]
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/html; charset=utf-8")
-                    self.end_headers()
-                    self.wfile.write(
-                        b"<html><body><h1>Authentication successful!</h1>"
-                        b"<p>You can close this window.</p></body></html>"
-                    )
-                else:
-                    self.send_response(400)
-                    self.send_header("Content-type", "text/html; charset=utf-8")
-                    self.end_headers()
-                    self.wfile.write(
-                        b"<html><body><h1>Authentication failed</h1></body></html>"
-                    )
-
-            def log_message(self, format, *args):
-                pass  # 로그 출력 억제
+        return f"{self.AUTH_URL}?{urlencode(params)}"
 
+    def _get_auth_code(self) -> str | None:
+        """인증 코드 획득"""
         # 리다이렉트 URI에서 포트 추출
         parsed_uri = urlparse(self._settings.kakao_redirect_uri)
         port = parsed_uri.port or 8080
 
         # 콜백 서버 시작
-        server = HTTPServer(("localhost", port), CallbackHandler)
+        server = _CallbackServer(("localhost", port), _CallbackHandler)
         server.timeout = 120  # 2분 타임아웃
 
         print(f"브라우저에서 카카오 로그인을 진행하세요...")
-        webbrowser.open(auth_url)
+        webbrowser.open(self._auth_url)
 
         # 콜백 대기
         server.handle_request()
         server.server_close()
 
-        return auth_code[0]
+        return server.auth_code
 
     def _exchange_code_for_token(self, auth_code: str) -> bool:
         """인증 코드를 토큰으로 교환"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.TOKEN_URL,
                 data={
                     "grant_type": "authorization_code",
@@ -139,7 +158,7 @@ class KakaoNotifier:
             return False
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.TOKEN_URL,
                 data={
                     "grant_type": "refresh_token",
@@ -169,11 +188,10 @@ class KakaoNotifier:
             return False
 
         try:
-            with open(self._token_path) as f:
-                data = json.load(f)
-                self._access_token = data.get("access_token")
-                self._refresh_token = data.get("refresh_token")
-                return bool(self._access_token)
+            data = orjson.loads(self._token_path.read_bytes())
+            self._access_token = data.get("access_token")
+            self._refresh_token = data.get("refresh_token")
+            return bool(self._access_token)
         except Exception:
             return False
 
@@ -181,14 +199,14 @@ class KakaoNotifier:
         """토큰 저장"""
         self._settings.token_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self._token_path, "w") as f:
-            json.dump(
+        self._token_path.write_bytes(
+            orjson.dumps(
                 {
                     "access_token": self._access_token,
                     "refresh_token": self._refresh_token,
-                },
-                f,
+                }
             )
+        )
 
     def send_to_me(
         self,
@@ -208,10 +226,10 @@ class KakaoNotifier:
                 "content": {
                     "title": title,
                     "description": description,
-                    "image_url": "https://via.placeholder.com/800x400/2962FF/FFFFFF?text=Stock+Report",
+                    "image_url": _FEED_IMAGE_URL,
                     "link": {
-                        "web_url": link_url or "https://github.com",
-                        "mobile_web_url": link_url or "https://github.com",
+                        "web_url": link_url or _DEFAULT_LINK_URL,
+                        "mobile_web_url": link_url or _DEFAULT_LINK_URL,
                     },
                 },
             }
@@ -228,14 +246,14 @@ class KakaoNotifier:
                     },
                 ]
 
-            response = requests.post(
+            response = self._session.post(
                 self.SEND_ME_URL,
                 headers={
                     "Authorization": f"Bearer {self._access_token}",
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
                 data={
-                    "template_object": json.dumps(template_object),
+                    "template_object": orjson.dumps(template_object).decode(),
                 },
                 timeout=10,
             )
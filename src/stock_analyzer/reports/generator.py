@@ -1,21 +1,32 @@
 """PDF 리포트 생성기"""
 
 import base64
+import bisect
 import platform
+import threading
+from collections.abc import Sequence
 from datetime import date
+from functools import cache, lru_cache
 from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
-from jinja2 import Environment, FileSystemLoader
+import numpy as np
+from jinja2 import Environment, FileSystemLoader, Template
+from matplotlib import font_manager
+from matplotlib.figure import Figure
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
 
 from stock_analyzer.models import PriceData, StockReport, TechnicalIndicators
 
 # 백엔드 설정 (GUI 없이 사용)
 matplotlib.use("Agg")
 
+# 설치된 폰트 이름 (fontManager 목록은 프로세스당 한 번만 훑음)
+_AVAILABLE_FONTS = frozenset(f.name for f in font_manager.fontManager.ttflist)
+
 # 한글 폰트 설정 (플랫폼별 자동 감지)
 def _setup_korean_font() -> None:
     """플랫폼에 맞는 한글 폰트 설정"""
@@ -28,33 +39,74 @@ def _setup_korean_font() -> None:
     else:  # Linux (Ubuntu)
         font_candidates = ["NanumGothic", "Noto Sans CJK KR", "DejaVu Sans"]
 
-    # 사용 가능한 폰트 찾기
-    from matplotlib import font_manager
-    available_fonts = {f.name for f in font_manager.fontManager.ttflist}
-
+    # 사용 가능한 폰트 찾기 (pyplot 없이 rcParams 직접 설정)
     for font in font_candidates:
-        if font in available_fonts:
-            plt.rcParams["font.family"] = font
+        if font in _AVAILABLE_FONTS:
+            matplotlib.rcParams["font.family"] = font
             break
     else:
         # 폰트를 찾지 못한 경우 기본 sans-serif 사용
-        plt.rcParams["font.family"] = "sans-serif"
+        matplotlib.rcParams["font.family"] = "sans-serif"
 
-    plt.rcParams["axes.unicode_minus"] = False
+    matplotlib.rcParams["axes.unicode_minus"] = False
 
 _setup_korean_font()
 
+# WeasyPrint 렌더링은 스레드 안전하지 않으므로 PDF 쓰기만 직렬화
+_PDF_LOCK = threading.Lock()
+
+# 템플릿은 패키지에 포함되어 실행 중 바뀌지 않으므로 파일 변경 확인(auto_reload) 생략
+_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    autoescape=True,
+    auto_reload=False,
+)
+
+
+@cache
+def _get_template(name: str) -> Template:
+    """컴파일된 템플릿 반환 (프로세스당 한 번만 파싱)"""
+    return _ENV.get_template(name)
+
+
+@lru_cache(maxsize=1)
+def _get_font_config() -> FontConfiguration:
+    """WeasyPrint 폰트 설정 (fontconfig 폰트 목록 로드를 프로세스당 한 번만 수행)"""
+    return FontConfiguration()
+
+
+# 파일명 기간 구분 (일수 상한 → 접미사, 상한을 넘으면 1y)
+_PERIOD_BOUNDS = (7, 31, 93, 186)
+_PERIOD_NAMES = ("1w", "1m", "3m", "6m", "1y")
+
+# 차트에 쓰는 열을 한 번의 순회로 꺼내는 getter (행 목록 → 열 튜플)
+_PRICE_COLUMNS = attrgetter("date", "close", "volume")
+_INDICATOR_COLUMNS = attrgetter(
+    "date", "rsi", "trix", "trix_signal", "macd", "macd_signal", "macd_histogram"
+)
+
+
+def _to_float_array(values: Sequence[float | None]) -> np.ndarray:
+    """None을 NaN으로 바꾼 float64 배열 (변환은 NumPy가 C에서 처리, NaN 구간은 그리지 않음)"""
+    return np.array(values, dtype=np.float64)
+
+
+def _render_png(fig: Figure) -> memoryview:
+    """Figure를 PNG로 렌더링 (getbuffer()로 내부 버퍼를 복사 없이 반환)"""
+    buffer = BytesIO()
+    # 여백은 tight_layout으로 잡았으므로 bbox_inches="tight"의 추가 렌더링 생략
+    fig.savefig(buffer, format="png", dpi=100, facecolor="white")
+    return buffer.getbuffer()
+
+
+def _to_data_uri(png: bytes | memoryview) -> str:
+    """PNG 바이트를 HTML에 넣을 data URI로 변환"""
+    return f"data:image/png;base64,{base64.b64encode(png).decode('ascii')}"
+
 
 class ReportGenerator:
     """PDF 리포트 생성기"""
 
-    def __init__(self) -> None:
-        template_dir = Path(__file__).parent / "templates"
-        self._env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True,
-        )
-
     def generate_pdf(
         self,
         report: StockReport,
@@ -65,38 +117,33 @@ class ReportGenerator:
 
         # 파일명 생성
         period_days = (report.period_end - report.period_start).days
-        if period_days <= 7:
-            period_suffix = "1w"
-        elif period_days <= 31:
-            period_suffix = "1m"
-        elif period_days <= 93:
-            period_suffix = "3m"
-        elif period_days <= 186:
-            period_suffix = "6m"
-        else:
-            period_suffix = "1y"
+        period_suffix = _PERIOD_NAMES[bisect.bisect_left(_PERIOD_BOUNDS, period_days)]
 
         filename = f"{report.stock_info.code}_{period_suffix}_{report.period_end.strftime('%Y%m%d')}.pdf"
         output_path = output_dir / filename
 
-        # 차트 생성
+        # 차트 생성 (템플릿은 가격 차트만 사용하므로 지표 차트는 그리지 않음)
         price_chart = self._create_price_chart(report.price_data)
-        indicator_chart = self._create_indicator_chart(report.indicators)
+
+        # 차트 생성과 겹쳐 진행된 AI 분석 결과 대기
+        report.resolve_ai_analysis()
 
         # 템플릿 렌더링
-        template = self._env.get_template("report.html")
+        template = _get_template("report.html")
         html_content = template.render(
             report=report,
             price_chart=price_chart,
-            indicator_chart=indicator_chart,
             format_number=self._format_number,
             format_percent=self._format_percent,
             format_date=self._format_date,
             truncate_text=self._truncate_text,
         )
 
-        # PDF 생성
-        HTML(string=html_content).write_pdf(str(output_path))
+        # PDF 생성 (폰트 설정은 리포트 간 공유, 생성과 사용 모두 잠금 안에서 수행)
+        # 메모리에서 렌더링한 뒤 잠금 밖에서 한 번에 기록
+        with _PDF_LOCK:
+            pdf_bytes = HTML(string=html_content).write_pdf(font_config=_get_font_config())
+        output_path.write_bytes(pdf_bytes)
 
         return output_path
 
@@ -105,12 +152,12 @@ class ReportGenerator:
         if not price_data:
             return ""
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6), height_ratios=[3, 1])
+        # pyplot 전역 상태를 쓰지 않아 여러 스레드에서 동시에 그릴 수 있음
+        fig = Figure(figsize=(10, 6))
+        ax1, ax2 = fig.subplots(2, 1, height_ratios=[3, 1])
         fig.patch.set_facecolor("white")
 
-        dates = [p.date for p in price_data]
-        closes = [p.close for p in price_data]
-        volumes = [p.volume for p in price_data]
+        dates, closes, volumes = zip(*map(_PRICE_COLUMNS, price_data))
 
         # 가격 차트
         ax1.plot(dates, closes, color="#2962FF", linewidth=1.5)
@@ -120,46 +167,42 @@ class ReportGenerator:
         ax1.set_title("주가 추이", fontsize=12, fontweight="bold")
 
         # 거래량 차트
-        colors = ["#26A69A" if i == 0 or closes[i] >= closes[i - 1] else "#EF5350" for i in range(len(closes))]
+        # 전일 대비 상승(보합 포함)은 초록, 하락은 빨강 (첫날은 상승으로 표시)
+        closes_arr = np.asarray(closes, dtype=np.float64)
+        up = np.empty(len(closes_arr), dtype=bool)
+        up[0] = True
+        np.greater_equal(closes_arr[1:], closes_arr[:-1], out=up[1:])
+        colors = np.where(up, "#26A69A", "#EF5350")
         ax2.bar(dates, volumes, color=colors, alpha=0.7)
         ax2.set_ylabel("거래량", fontsize=10)
         ax2.grid(True, alpha=0.3)
 
         # x축 날짜 포맷
         fig.autofmt_xdate()
-        plt.tight_layout()
-
-        # Base64 인코딩
-        buffer = BytesIO()
-        plt.savefig(buffer, format="png", dpi=100, bbox_inches="tight", facecolor="white")
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close(fig)
+        fig.tight_layout()
 
-        return f"data:image/png;base64,{image_base64}"
+        return _to_data_uri(_render_png(fig))
 
     def _create_indicator_chart(self, indicators: list[TechnicalIndicators]) -> str:
         """기술적 지표 차트 생성 (Base64 인코딩)"""
         if not indicators:
             return ""
 
-        fig, axes = plt.subplots(3, 1, figsize=(10, 8))
+        fig = Figure(figsize=(10, 8))
+        axes = fig.subplots(3, 1)
         fig.patch.set_facecolor("white")
 
-        dates = [ind.date for ind in indicators]
-
-        # None을 NaN으로 변환하는 헬퍼 함수
-        def safe_values(values: list) -> list:
-            import numpy as np
-            return [v if v is not None else np.nan for v in values]
+        dates, rsi, trix, trix_signal, macd, macd_signal, macd_hist = zip(
+            *map(_INDICATOR_COLUMNS, indicators)
+        )
 
         # RSI 차트
-        rsi_values = safe_values([ind.rsi for ind in indicators])
+        rsi_values = _to_float_array(rsi)
         ax_rsi = axes[0]
         ax_rsi.plot(dates, rsi_values, color="#7C4DFF", linewidth=1.5, label="RSI")
         ax_rsi.axhline(y=70, color="#EF5350", linestyle="--", alpha=0.7, label="과매수 (70)")
         ax_rsi.axhline(y=30, color="#26A69A", linestyle="--", alpha=0.7, label="과매도 (30)")
-        ax_rsi.fill_between(dates, 30, 70, alpha=0.1, color="gray")
+        ax_rsi.axhspan(30, 70, alpha=0.1, color="gray")
         ax_rsi.set_ylabel("RSI", fontsize=10)
         ax_rsi.set_ylim(0, 100)
         ax_rsi.legend(loc="upper left", fontsize=8)
@@ -167,8 +210,8 @@ class ReportGenerator:
         ax_rsi.set_title("RSI (14)", fontsize=11, fontweight="bold")
 
         # TRIX 차트
-        trix_values = safe_values([ind.trix for ind in indicators])
-        trix_signal_values = safe_values([ind.trix_signal for ind in indicators])
+        trix_values = _to_float_array(trix)
+        trix_signal_values = _to_float_array(trix_signal)
         ax_trix = axes[1]
         ax_trix.plot(dates, trix_values, color="#2962FF", linewidth=1.5, label="TRIX")
         ax_trix.plot(dates, trix_signal_values, color="#FF6D00", linewidth=1.5, label="Signal")
@@ -179,15 +222,14 @@ class ReportGenerator:
         ax_trix.set_title("TRIX (15, 9)", fontsize=11, fontweight="bold")
 
         # MACD 차트
-        macd_values = safe_values([ind.macd for ind in indicators])
-        macd_signal_values = safe_values([ind.macd_signal for ind in indicators])
-        macd_hist_values = safe_values([ind.macd_histogram for ind in indicators])
+        macd_values = _to_float_array(macd)
+        macd_signal_values = _to_float_array(macd_signal)
+        macd_hist_values = _to_float_array(macd_hist)
         ax_macd = axes[2]
 
         # 히스토그램 (NaN을 0으로 처리하여 bar 차트 그리기)
-        import numpy as np
-        hist_for_bar = [0 if np.isnan(h) else h for h in macd_hist_values]
-        colors = ["#26A69A" if h >= 0 else "#EF5350" for h in hist_for_bar]
+        hist_for_bar = np.nan_to_num(macd_hist_values, nan=0.0)
+        colors = np.where(hist_for_bar >= 0, "#26A69A", "#EF5350")
         ax_macd.bar(dates, hist_for_bar, color=colors, alpha=0.5, label="Histogram")
         ax_macd.plot(dates, macd_values, color="#2962FF", linewidth=1.5, label="MACD")
         ax_macd.plot(dates, macd_signal_values, color="#FF6D00", linewidth=1.5, label="Signal")
@@ -199,16 +241,9 @@ class ReportGenerator:
 
         # x축 날짜 포맷
         fig.autofmt_xdate()
-        plt.tight_layout()
-
-        # Base64 인코딩
-        buffer = BytesIO()
-        plt.savefig(buffer, format="png", dpi=100, bbox_inches="tight", facecolor="white")
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close(fig)
+        fig.tight_layout()
 
-        return f"data:image/png;base64,{image_base64}"
+        return _to_data_uri(_render_png(fig))
 
     @staticmethod
     def _format_number(value: float | int | None) -> str:
@@ -247,4 +282,6 @@ class ReportGenerator:
         text = text.strip()
         if len(text) <= max_length:
             return text
-        return text[:max_length].rsplit(" ", 1)[0] + "..."
+        # 마지막 공백 앞에서 자름 (공백이 없으면 글자 수 기준)
+        head, sep, _ = text[:max_length].rpartition(" ")
+        return (head if sep else text[:max_length]) + "..."
@@ -9,6 +9,10 @@ def pytest_configure(config):
         "markers",
         "integration: marks tests as integration tests (deselect with '-m \"not integration\"')",
     )
+    config.addinivalue_line(
+        "markers",
+        "slow: marks tests that render full PDF reports (deselect with '-m \"not slow\"')",
+    )
 
 
 @pytest.fixture
@@ -1,12 +1,23 @@
 """분석기 테스트"""
 
+import json
 from datetime import date, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from openai import APITimeoutError, RateLimitError
 
 from stock_analyzer.analyzers.ai_analyzer import AIAnalyzer
-from stock_analyzer.models import AIAnalysis, NewsArticle
+from stock_analyzer.analyzers.llm_pool import REQUEST_TIMEOUT, AsyncLLMPool
+from stock_analyzer.config import Settings
+from stock_analyzer.models import (
+    AIAnalysis,
+    Disclosure,
+    NewsArticle,
+    PriceData,
+    Signal,
+    SignalType,
+)
 
 
 class TestAIAnalyzer:
@@ -19,34 +30,258 @@ class TestAIAnalyzer:
             analyzer = AIAnalyzer()
             assert not analyzer.is_available
 
+    def test_client_shared_across_instances(self):
+        """여러 인스턴스가 클라이언트와 요청 풀을 공유"""
+        with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, openai_api_key="test-key", llm_cache_ttl=0
+            )
+            first = AIAnalyzer()
+            second = AIAnalyzer()
+
+        assert first._client is second._client
+        assert first._pool is second._pool
+
     def test_analyze_returns_none_without_client(self):
         """클라이언트 없을 때 None 반환"""
         with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
             mock_settings.return_value.openai_api_key = None
             analyzer = AIAnalyzer()
 
-            result = analyzer.analyze("삼성전자", [], {})
+            result = analyzer.analyze("삼성전자", [], [], {})
             assert result is None
 
-    def test_summarize_news_empty_list(self):
-        """빈 뉴스 리스트 요약"""
+    def test_analyze_with_mock_client(self):
+        """모의 클라이언트로 전체 분석 (통합 분석 + 종합 의견)"""
+        with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, openai_api_key="test-key", llm_cache_ttl=0
+            )
+            analyzer = AIAnalyzer()
+
+        combined_json = json.dumps({
+            "news_summary": "반도체 호황",
+            "news_analysis": "뉴스 분석",
+            "disclosure_analysis": "",
+            "sentiment": "POSITIVE",
+            "score": 0.5,
+            "key_issues": ["반도체"],
+        }, ensure_ascii=False)
+        opinion_prompts: list[str] = []
+
+        async def stream_chunks():
+            for i in range(0, len(combined_json), 7):
+                chunk = MagicMock()
+                chunk.choices[0].delta.content = combined_json[i:i + 7]
+                yield chunk
+
+        async def fake_create(**kwargs):
+            if kwargs.get("stream"):
+                return stream_chunks()
+            opinion_prompts.append(kwargs["messages"][-1]["content"])
+            response = MagicMock()
+            response.choices[0].message.content = "종합 의견"
+            return response
+
+        analyzer._client = MagicMock()
+        analyzer._client.chat.completions.create = AsyncMock(side_effect=fake_create)
+
+        articles = [
+            NewsArticle(
+                title="삼성전자 반도체 호황",
+                link="https://example.com/1",
+                source="테스트",
+                published_at=datetime.now(),
+            ),
+        ]
+
+        result = analyzer.analyze("삼성전자", articles, [], {})
+
+        assert result is not None
+        assert result.sentiment == "POSITIVE"
+        assert result.key_issues == ["반도체"]
+        assert result.news_summary == "반도체 호황"
+        assert result.overall_opinion == "종합 의견"
+        # 스트리밍 통합 분석 1회 + 종합 의견 1회 (스트리밍 중 완성된 요약 사용)
+        assert analyzer._client.chat.completions.create.await_count == 2
+        assert "반도체 호황" in opinion_prompts[0]
+
+    def test_combined_request_skips_analysis_for_tiny_inputs(self):
+        """헤드라인 1건뿐이면 상세 분석 없이 요약/감성만 요청"""
+        from stock_analyzer.analyzers.ai_analyzer import (
+            COMBINED_BRIEF_MAX_TOKENS,
+            COMBINED_MAX_TOKENS,
+        )
+
         with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
             mock_settings.return_value.openai_api_key = None
             analyzer = AIAnalyzer()
 
-            result = analyzer.summarize_news("삼성전자", [])
-            assert result == "뉴스 요약 없음"
+        articles = [
+            NewsArticle(
+                title=f"삼성전자 반도체 호황 {i}",
+                link=f"https://example.com/{i}",
+                source="테스트",
+                published_at=datetime.now(),
+            )
+            for i in range(2)
+        ]
+
+        brief = analyzer._combined_request("삼성전자", articles[:1], [])
+        prompt = brief["messages"][-1]["content"]
+        assert brief["max_tokens"] == COMBINED_BRIEF_MAX_TOKENS
+        assert "- news_analysis: 빈 문자열" in prompt
+        assert "- disclosure_analysis: 빈 문자열" in prompt
+
+        full = analyzer._combined_request("삼성전자", articles, [])
+        assert full["max_tokens"] == COMBINED_MAX_TOKENS
+        assert "- news_analysis: 빈 문자열" not in full["messages"][-1]["content"]
+
+        parsed = analyzer._parse_combined('{"news_analysis": "분석"}', articles[:1], [])
+        assert parsed["news_analysis"] == ""
+
+    def test_render_articles_truncates_titles(self):
+        """프롬프트용 뉴스 목록 - 공백 정리, 제목 길이 및 개수 제한"""
+        from stock_analyzer.analyzers.ai_analyzer import _render_articles
+
+        articles = [
+            NewsArticle(
+                title=f"삼성전자   반도체\n호황 {i} " + "가" * 200,
+                link=f"https://example.com/{i}",
+                source="테스트",
+                published_at=datetime.now(),
+            )
+            for i in range(12)
+        ]
+
+        lines = _render_articles(articles, max_chars=20).splitlines()
 
-    def test_analyze_sentiment_empty_list(self):
-        """빈 뉴스 리스트 감성 분석"""
+        assert len(lines) == 10
+        assert lines[0] == "- [테스트] 삼성전자 반도체 호황 0 가가가가가가"
+
+    def test_opinion_request_reads_model_attributes(self):
+        """종합 의견 프롬프트 - PriceData / Signal 객체 필드를 직접 사용"""
         with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
             mock_settings.return_value.openai_api_key = None
             analyzer = AIAnalyzer()
 
-            sentiment, score, issues = analyzer.analyze_sentiment("삼성전자", [])
-            assert sentiment == "NEUTRAL"
-            assert score == 0.0
-            assert issues == []
+        report_data = {
+            "latest_price": PriceData(
+                date=date.today(),
+                open=84000.0,
+                high=86000.0,
+                low=83000.0,
+                close=85000.0,
+                volume=1000,
+                trading_value=85000000.0,
+                change_rate=2.5,
+            ),
+            "signals": [
+                Signal(indicator="RSI", signal=SignalType.BUY, reason="과매도", strength=3)
+            ],
+        }
+
+        request = analyzer._opinion_request("삼성전자", report_data, "요약")
+        prompt = request["messages"][-1]["content"]
+        assert "- 현재가: 85000.0원 (2.5%)" in prompt
+        assert "- 기술적 시그널: RSI: BUY" in prompt
+
+        empty = analyzer._opinion_request("삼성전자", {}, "요약")["messages"][-1]["content"]
+        assert "- 현재가: N/A" in empty
+        assert "시그널 없음" in empty
+
+    def test_extract_json_string(self):
+        """스트리밍 중인 JSON에서 완성된 문자열 필드만 추출"""
+        from stock_analyzer.analyzers.ai_analyzer import _extract_json_string
+
+        assert _extract_json_string('{"news_summary": "반도체', "news_summary") is None
+        partial = '{"news_summary": "반도체 \\"호황\\"", "ne'
+        assert _extract_json_string(partial, "news_summary") == '반도체 "호황"'
+        assert _extract_json_string('{"news_sum', "news_summary") is None
+
+    def test_normalize_sentiment(self):
+        """허용되지 않은 감성 값은 NEUTRAL로 정규화"""
+        from stock_analyzer.analyzers.ai_analyzer import _normalize_sentiment
+
+        assert _normalize_sentiment(" positive ") == "POSITIVE"
+        assert _normalize_sentiment("BULLISH") == "NEUTRAL"
+        assert _normalize_sentiment(None) == "NEUTRAL"
+
+    @pytest.mark.asyncio
+    async def test_complete_uses_cache(self, tmp_path):
+        """동일 프롬프트 재요청 시 캐시 응답 반환"""
+        with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, openai_api_key="test-key", cache_dir=tmp_path, llm_cache_ttl=60
+            )
+            analyzer = AIAnalyzer()
+
+        response = MagicMock()
+        response.choices[0].message.content = "요약 결과"
+        analyzer._client = MagicMock()
+        analyzer._client.chat.completions.create = AsyncMock(return_value=response)
+
+        messages = [{"role": "user", "content": "삼성전자 뉴스 요약"}]
+        first = await analyzer._complete(messages=messages, max_tokens=100)
+        second = await analyzer._complete(messages=messages, max_tokens=100)
+        other = await analyzer._complete(messages=messages, max_tokens=200)
+
+        assert first == second == other == "요약 결과"
+        # 파라미터가 다른 요청만 API 호출
+        assert analyzer._client.chat.completions.create.await_count == 2
+
+    def test_analyze_batch_with_mock_client(self):
+        """Batch API 2단계 제출 후 종목별 분석 결과 조립"""
+        with patch("stock_analyzer.analyzers.ai_analyzer.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, openai_api_key="test-key", llm_cache_ttl=0
+            )
+            analyzer = AIAnalyzer()
+
+        def output_line(custom_id: str, content: str) -> bytes:
+            return json.dumps({
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": content}}]},
+                },
+            }).encode()
+
+        phase1 = MagicMock(content=output_line("0-combined", json.dumps({
+            "news_summary": "반도체 호황",
+            "news_analysis": "뉴스 분석",
+            "sentiment": "POSITIVE",
+            "score": 0.5,
+            "key_issues": ["반도체"],
+        })))
+        phase2 = MagicMock(content=output_line("0-opinion", "종합 의견"))
+
+        analyzer._client = MagicMock()
+        analyzer._client.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+        analyzer._client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1"))
+        analyzer._client.batches.retrieve = AsyncMock(
+            return_value=MagicMock(status="completed", output_file_id="out-1")
+        )
+        analyzer._client.files.content = AsyncMock(side_effect=[phase1, phase2])
+
+        articles = [
+            NewsArticle(
+                title="삼성전자 반도체 호황",
+                link="https://example.com/1",
+                source="테스트",
+                published_at=datetime.now(),
+            ),
+        ]
+
+        results = analyzer.analyze_batch([("삼성전자", articles, [], {})])
+
+        assert len(results) == 1
+        result = results[0]
+        assert result.news_summary == "반도체 호황"
+        assert result.sentiment == "POSITIVE"
+        assert result.disclosure_analysis == ""
+        assert result.overall_opinion == "종합 의견"
+        assert analyzer._client.batches.create.await_count == 2
 
     @pytest.mark.integration
     def test_full_analysis(self):
@@ -72,12 +307,22 @@ class TestAIAnalyzer:
         ]
 
         report_data = {
-            "latest_price": {"close": 85000, "change_rate": 2.5},
-            "signals": [{"indicator": "RSI", "signal": "HOLD", "reason": "중립"}],
-            "financials": [{"year": 2024, "revenue": 300000000000000}],
+            "latest_price": PriceData(
+                date=date.today(),
+                open=84000.0,
+                high=86000.0,
+                low=83000.0,
+                close=85000.0,
+                volume=1000,
+                trading_value=85000000.0,
+                change_rate=2.5,
+            ),
+            "signals": [
+                Signal(indicator="RSI", signal=SignalType.HOLD, reason="중립", strength=1)
+            ],
         }
 
-        result = analyzer.analyze("삼성전자", articles, report_data)
+        result = analyzer.analyze("삼성전자", articles, [], report_data)
 
         assert result is not None
         assert isinstance(result, AIAnalysis)
@@ -87,9 +332,228 @@ class TestAIAnalyzer:
         assert result.overall_opinion
 
 
+class TestAsyncLLMPool:
+    """AsyncLLMPool 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retries_on_rate_limit(self):
+        """429 응답 시 백오프 후 재시도"""
+        response = MagicMock()
+        response.choices[0].message.content = "응답"
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[
+                RateLimitError("rate limited", response=MagicMock(status_code=429), body=None),
+                response,
+            ]
+        )
+
+        pool = AsyncLLMPool(rpm=10, tpm=10_000, max_concurrency=2)
+        with patch("stock_analyzer.analyzers.llm_pool.asyncio.sleep", new=AsyncMock()) as sleep:
+            content = await pool.complete(client, messages=[{"role": "user", "content": "질문"}])
+
+        assert content == "응답"
+        assert client.chat.completions.create.await_count == 2
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retries_on_timeout_with_request_timeout(self):
+        """타임아웃 시 재시도하고 모든 요청에 timeout 지정"""
+        response = MagicMock()
+        response.choices[0].message.content = "응답"
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(
+            side_effect=[APITimeoutError(request=MagicMock()), response]
+        )
+
+        pool = AsyncLLMPool(rpm=10, tpm=10_000, max_concurrency=2)
+        with patch("stock_analyzer.analyzers.llm_pool.asyncio.sleep", new=AsyncMock()):
+            content = await pool.complete(client, messages=[{"role": "user", "content": "질문"}])
+
+        assert content == "응답"
+        assert client.chat.completions.create.await_count == 2
+        assert client.chat.completions.create.await_args.kwargs["timeout"] == REQUEST_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_waits_when_rpm_exhausted(self):
+        """RPM 한도 초과 시 구간이 지날 때까지 대기"""
+        pool = AsyncLLMPool(rpm=1, tpm=10_000, max_concurrency=2)
+        await pool._acquire(10)
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            # 대기 중 구간 경과 시뮬레이션
+            pool._expire(float("inf"))
+
+        with patch("stock_analyzer.analyzers.llm_pool.asyncio.sleep", new=fake_sleep):
+            await pool._acquire(10)
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 60
+
+
 class TestStockAnalyzer:
     """종합 분석기 테스트"""
 
+    def test_analyze_with_mock_collectors(self):
+        """모의 수집기로 종합 분석 (데이터 수집 병렬화)"""
+        from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
+        from stock_analyzer.models import StockInfo
+
+        analyzer = StockAnalyzer(use_ai=False)
+
+        end = date.today()
+        start = end - timedelta(days=10)
+        price_data = [
+            PriceData(
+                date=end - timedelta(days=40 - i),
+                open=100.0,
+                high=110.0,
+                low=90.0,
+                close=100.0 + i,
+                volume=1000,
+                trading_value=100000.0,
+                change_rate=1.0,
+            )
+            for i in range(41)
+        ]
+
+        analyzer.price_collector = MagicMock()
+        analyzer.price_collector.get_stock_info.return_value = StockInfo(
+            code="005930", name="삼성전자", market="KOSPI"
+        )
+        analyzer.price_collector.get_ohlcv.return_value = price_data
+        analyzer.dart_collector = MagicMock()
+        analyzer.dart_collector.is_available = True
+        analyzer.dart_collector.get_financial_statements.return_value = []
+        analyzer.dart_collector.get_recent_disclosures.return_value = [
+            Disclosure(
+                title="사업보고서",
+                date="2025-01-01",
+                link="https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20250101000001",
+                filer="삼성전자",
+            )
+        ]
+        analyzer.news_collector = MagicMock()
+        analyzer.news_collector.search_news.return_value = []
+        analyzer.news_collector.deduplicate_news.return_value = []
+
+        report = analyzer.analyze("005930", start, end)
+
+        assert report.stock_info.name == "삼성전자"
+        assert all(p.date >= start for p in report.price_data)
+        assert len(report.indicators) == len(report.price_data)
+        assert report.disclosures[0].title == "사업보고서"
+        assert report.disclosures[0].link.endswith("rcpNo=20250101000001")
+        analyzer.news_collector.search_news.assert_called_once_with("삼성전자", months=6)
+
+    def test_ai_analysis_resolved_when_report_emitted(self):
+        """AI 분석은 백그라운드로 진행되고 리포트 출력 시점에 반영"""
+        from concurrent.futures import Future
+
+        from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
+        from stock_analyzer.models import StockInfo
+
+        analyzer = StockAnalyzer(use_ai=False)
+        end = date.today()
+        analyzer.price_collector = MagicMock()
+        analyzer.price_collector.get_stock_info.return_value = StockInfo(
+            code="005930", name="삼성전자", market="KOSPI"
+        )
+        analyzer.price_collector.get_ohlcv.return_value = [
+            PriceData(
+                date=end,
+                open=100.0,
+                high=110.0,
+                low=90.0,
+                close=100.0,
+                volume=1000,
+                trading_value=100000.0,
+                change_rate=1.0,
+            )
+        ]
+        analyzer.dart_collector = MagicMock()
+        analyzer.dart_collector.is_available = False
+        analyzer.news_collector = MagicMock()
+        analyzer.news_collector.search_news.return_value = []
+        analyzer.news_collector.deduplicate_news.return_value = []
+
+        future: Future = Future()
+        analyzer.ai_analyzer = MagicMock()
+        analyzer.ai_analyzer.is_available = True
+        analyzer.ai_analyzer.analyze_background.return_value = future
+
+        report = analyzer.analyze("005930", end, end)
+
+        # 분석 완료 전에 리포트가 먼저 반환됨
+        assert not future.done()
+        assert report.ai_analysis is None
+
+        ai_analysis = AIAnalysis(
+            news_summary="요약",
+            sentiment="positive",
+            sentiment_score=0.5,
+            overall_opinion="의견",
+        )
+        future.set_result(ai_analysis)
+
+        assert report.resolve_ai_analysis() == ai_analysis
+        assert report.ai_analysis == ai_analysis
+
+    def test_analyze_many_keeps_order_and_failures(self):
+        """여러 종목 동시 분석 - 입력 순서 유지, 실패 종목은 None"""
+        from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
+        from stock_analyzer.collectors.stock_price import StockNotFoundError
+
+        analyzer = StockAnalyzer(use_ai=False)
+        reports = {"005930": MagicMock(), "000660": MagicMock()}
+
+        def fake_analyze(code, start, end):
+            if code not in reports:
+                raise StockNotFoundError(f"종목을 찾을 수 없습니다: {code}")
+            return reports[code]
+
+        end = date.today()
+        with patch.object(analyzer, "analyze", side_effect=fake_analyze):
+            results = analyzer.analyze_many(["005930", "999999", "000660"], end, end)
+
+        assert results == [reports["005930"], None, reports["000660"]]
+
+    def test_analyze_many_groups_output_per_stock(self):
+        """여러 종목 동시 분석 - 종목별 진행 출력이 섞이지 않고 묶여서 출력"""
+        import io
+        import time
+
+        from rich.console import Console
+
+        from stock_analyzer.analyzers import stock_analyzer
+        from stock_analyzer.analyzers.stock_analyzer import StockAnalyzer
+
+        analyzer = StockAnalyzer(use_ai=False)
+        output = io.StringIO()
+
+        def fake_analyze(code, start, end):
+            for step in range(3):
+                stock_analyzer.console.print(f"{code} 단계 {step}")
+                time.sleep(0.01)
+            return code
+
+        end = date.today()
+        with (
+            patch.object(stock_analyzer, "console", Console(file=output, width=80)),
+            patch.object(analyzer, "analyze", side_effect=fake_analyze),
+        ):
+            results = analyzer.analyze_many(["A", "B", "C"], end, end)
+
+        assert results == ["A", "B", "C"]
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 9
+        for i in range(0, 9, 3):
+            code = lines[i].split()[0]
+            assert lines[i : i + 3] == [f"{code} 단계 {step}" for step in range(3)]
+
     @pytest.mark.integration
     def test_analyze_samsung(self):
         """삼성전자 분석 (통합 테스트)"""
@@ -1,6 +1,7 @@
 """데이터 수집기 테스트"""
 
 from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -20,6 +21,190 @@ class TestStockPriceCollector:
         assert collector.validate_code("abcdef") is False  # 문자
         assert collector.validate_code("12345a") is False  # 혼합
 
+    def test_krx_lookups_cached_per_day(self):
+        """같은 날 같은 종목 조회는 pykrx를 다시 호출하지 않음"""
+        import pandas as pd
+
+        from stock_analyzer.collectors import stock_price
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        stock_price._has_recent_ohlcv.cache_clear()
+        collector = StockPriceCollector()
+        df = pd.DataFrame({"종가": [100]})
+        with patch("pykrx.stock.get_market_ohlcv", return_value=df) as mock_ohlcv:
+            assert collector.validate_code("005930") is True
+            assert collector.validate_code("005930") is True
+
+        assert mock_ohlcv.call_count == 1
+        stock_price._has_recent_ohlcv.cache_clear()
+
+    def test_get_market_uses_ticker_sets(self):
+        """시장 구분은 시장별 종목코드 목록을 한 번만 조회해 판별"""
+        from stock_analyzer.collectors import stock_price
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        tickers = {"KOSPI": ["005930", "000660"], "KOSDAQ": ["035720", "247540"]}
+
+        stock_price._market_tickers.cache_clear()
+        collector = StockPriceCollector()
+        with patch(
+            "pykrx.stock.get_market_ticker_list",
+            side_effect=lambda date_str, market: tickers[market],
+        ) as mock_list:
+            assert collector._get_market("005930") == "KOSPI"
+            assert collector._get_market("247540") == "KOSDAQ"
+            assert collector._get_market("999999") == "KOSPI"
+
+        assert mock_list.call_count == 2
+        # 날짜는 pykrx가 가장 가까운 영업일로 정하도록 None 전달
+        assert all(call.args[0] is None for call in mock_list.call_args_list)
+        stock_price._market_tickers.cache_clear()
+
+    def test_get_market_does_not_cache_empty_tickers(self):
+        """빈 종목 목록은 캐시하지 않고 다음 호출에서 다시 조회"""
+        from stock_analyzer.collectors import stock_price
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        responses = {"KOSPI": [[], ["005930"]], "KOSDAQ": [[], ["247540"]]}
+
+        stock_price._market_tickers.cache_clear()
+        collector = StockPriceCollector()
+        with patch(
+            "pykrx.stock.get_market_ticker_list",
+            side_effect=lambda date_str, market: responses[market].pop(0),
+        ):
+            assert collector._get_market("247540") == "KOSPI"
+            assert collector._get_market("247540") == "KOSDAQ"
+
+        stock_price._market_tickers.cache_clear()
+
+    def test_market_summary_fetches_listing_once(self):
+        """시장 요약은 종목 목록을 한 번만 조회해 세 가지 순위 계산"""
+        import pandas as pd
+
+        from stock_analyzer.collectors import stock_price
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        listing = pd.DataFrame(
+            {
+                "Code": ["000001", "000002", "000003"],
+                "Name": ["가", "나", "다"],
+                "Amount": [5_000_000_000, 3_000_000_000, 500_000_000],
+                "Close": [1000, 2000, 3000],
+                "ChagesRatio": [1.5, -2.0, 10.0],
+                "Volume": [10, 20, 30],
+            }
+        )
+
+        stock_price._stock_listing.cache_clear()
+        collector = StockPriceCollector()
+        with patch("FinanceDataReader.StockListing", return_value=listing) as mock_listing:
+            summary = collector.get_market_summary(top_n=2)
+
+        assert mock_listing.call_count == 1
+        assert [s["code"] for s in summary["top_trading_value"]] == ["000001", "000002"]
+        # 거래대금 10억 미만 종목은 등락률 순위에서 제외
+        assert [s["code"] for s in summary["top_gainers"]] == ["000001", "000002"]
+        assert [s["code"] for s in summary["top_losers"]] == ["000002", "000001"]
+        stock_price._stock_listing.cache_clear()
+
+    def test_get_fundamental_batch(self):
+        """날짜별 전 종목 지표를 한 번만 조회해 여러 종목에 사용, 없는 종목은 이전 날짜로"""
+        import pandas as pd
+
+        from stock_analyzer.collectors import stock_price
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        tables = {
+            "20250103": pd.DataFrame(
+                {
+                    "PER": [12.5, 0.0],
+                    "PBR": [1.2, 0.8],
+                    "EPS": [4950, 100],
+                    "BPS": [52000, 900],
+                    "DIV": [2.3, 0.0],
+                },
+                index=["005930", "000660"],
+            ),
+            "20250102": pd.DataFrame(
+                {"PER": [30.0], "PBR": [3.0], "EPS": [1000], "BPS": [10000], "DIV": [0.5]},
+                index=["035720"],
+            ),
+        }
+
+        stock_price._market_fundamental.cache_clear()
+        collector = StockPriceCollector()
+        with patch(
+            "pykrx.stock.get_market_fundamental",
+            side_effect=lambda date_str, market: tables.get(date_str, pd.DataFrame()),
+        ) as mock_fundamental:
+            result = collector.get_fundamental_batch(
+                ["005930", "000660", "035720", "999999"], date(2025, 1, 3)
+            )
+
+        assert result["005930"]["per"] == 12.5
+        assert result["000660"]["per"] is None  # 0은 None
+        assert result["035720"]["pbr"] == 3.0
+        assert result["999999"] == {
+            "per": None, "pbr": None, "eps": None, "bps": None, "div_yield": None
+        }
+        assert mock_fundamental.call_count == 5
+        stock_price._market_fundamental.cache_clear()
+
+    def test_get_ohlcv_converts_columns(self):
+        """pykrx OHLCV 데이터프레임을 PriceData로 변환"""
+        import pandas as pd
+
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        df = pd.DataFrame(
+            {
+                "시가": [100, 105],
+                "고가": [110, 112],
+                "저가": [95, 101],
+                "종가": [105, 110],
+                "거래량": [1000, 2000],
+                "등락률": [5.0, 4.76],
+            },
+            index=pd.DatetimeIndex(["2025-01-02", "2025-01-03"], name="날짜"),
+        )
+
+        collector = StockPriceCollector()
+        with patch("pykrx.stock.get_market_ohlcv", return_value=df):
+            result = collector.get_ohlcv("005930", date(2025, 1, 1), date(2025, 1, 3))
+
+        assert [p.date for p in result] == [date(2025, 1, 2), date(2025, 1, 3)]
+        assert result[1].close == 110.0
+        assert result[1].volume == 2000
+        assert result[1].trading_value == 220000.0
+        assert result[0].change_rate == 5.0
+
+    def test_get_naver_finance_data(self):
+        """네이버 금융 페이지에서 업종 및 PER/PBR 파싱"""
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        html = """
+        <div><a href="#" class="sub_tit">반도체와반도체장비</a></div>
+        <table class="per_table">
+            <tr><th>PER l EPS</th><td><em>12.50</em>배 l <em>4,950</em>원</td></tr>
+            <tr><th>추정PER l EPS</th><td><em>9.80</em>배 l <em>6,300</em>원</td></tr>
+            <tr><th>PBR l BPS</th><td><em>1.20</em>배 l <em>52,000</em>원</td></tr>
+        </table>
+        <table><tr><th>배당수익률</th><td>2.30%</td></tr></table>
+        """
+
+        collector = StockPriceCollector()
+        response = MagicMock(status_code=200, text=html)
+        with patch.object(collector._session, "get", return_value=response):
+            result = collector._get_naver_finance_data("005930")
+
+        assert result["sectors"] == ["반도체와반도체장비"]
+        assert result["per"] == 12.5
+        assert result["eps"] == 4950.0
+        assert result["pbr"] == 1.2
+        assert result["bps"] == 52000.0
+        assert result["dividend_yield"] == 2.3
+
     @pytest.mark.integration
     def test_get_stock_info_samsung(self):
         """삼성전자 정보 조회 (통합 테스트)"""
@@ -58,6 +243,91 @@ class TestStockPriceCollector:
         assert all(p.volume >= 0 for p in price_data)
 
 
+class TestDartCollector:
+    """DART 수집기 테스트"""
+
+    @staticmethod
+    def _make_collector(response_list: list[dict]):
+        """API 키 없이 생성 후 기업코드 조회와 DART 응답을 모의 객체로 대체"""
+        import json
+
+        from stock_analyzer.collectors.dart import DartCollector
+
+        with patch("stock_analyzer.collectors.dart.get_settings") as mock_settings:
+            mock_settings.return_value.dart_api_key = ""
+            collector = DartCollector()
+
+        collector._dart = MagicMock()
+        collector._dart.find_corp_code.return_value = "00126380"
+        response = MagicMock()
+        response.content = json.dumps({"status": "000", "list": response_list}).encode()
+        collector._session = MagicMock()
+        collector._session.get.return_value = response
+        return collector
+
+    def test_parse_financial_statement(self):
+        """재무제표 계정 추출 (연결 우선, 우선순위, 숫자 변환)"""
+        rows = [
+            {"fs_div": "CFS", "account_nm": "영업수익", "thstrm_amount": "1,000"},
+            {"fs_div": "CFS", "account_nm": "매출액", "thstrm_amount": "2,000"},
+            {"fs_div": "CFS", "account_nm": "영업이익(손실)", "thstrm_amount": "300"},
+            {"fs_div": "CFS", "account_nm": "당기순이익", "thstrm_amount": "-"},
+            {"fs_div": "OFS", "account_nm": "매출액", "thstrm_amount": "9,999"},
+        ]
+        collector = self._make_collector([])
+
+        financial = collector._parse_financial_statement(rows, 2024)
+
+        assert financial.year == 2024
+        assert financial.revenue == 2000.0  # 매출액이 영업수익보다 우선
+        assert financial.operating_income == 300.0
+        assert financial.net_income is None  # "-" 는 값 없음
+
+    def test_financial_statements_cached(self):
+        """같은 종목/연도 재무제표는 한 번만 조회"""
+        collector = self._make_collector(
+            [{"fs_div": "CFS", "account_nm": "매출액", "thstrm_amount": "1,000"}]
+        )
+
+        first = collector.get_financial_statements("005930", years=[2024])
+        second = collector.get_financial_statements("005930", years=[2024])
+
+        assert first == second
+        assert first[0].revenue == 1000.0
+        assert collector._session.get.call_count == 1
+        params = collector._session.get.call_args.kwargs["params"]
+        assert params["corp_code"] == "00126380"
+        assert params["reprt_code"] == "11011"
+
+    def test_get_recent_disclosures(self):
+        """최근 공시 목록 (날짜 형식 변환, 링크 생성, 결측값은 빈 문자열)"""
+        collector = self._make_collector([
+            {
+                "rcept_no": "20250102000001",
+                "rcept_dt": "20250102",
+                "report_nm": "주요사항보고서",
+                "flr_nm": "삼성전자",
+            },
+            {
+                "rcept_no": "20250101000001",
+                "rcept_dt": "20250101",
+                "report_nm": "사업보고서",
+                "flr_nm": None,
+            },
+        ])
+
+        result = collector.get_recent_disclosures("005930", count=2)
+
+        assert [d.title for d in result] == ["주요사항보고서", "사업보고서"]
+        assert result[0].date == "2025-01-02"
+        assert result[0].link == (
+            "https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20250102000001"
+        )
+        assert result[1].filer == ""
+        # 필요한 개수만 첫 페이지로 요청
+        assert collector._session.get.call_args.kwargs["params"]["page_count"] == 2
+
+
 class TestNewsCollector:
     """뉴스 수집기 테스트"""
 
@@ -94,6 +364,76 @@ class TestNewsCollector:
         # 첫 번째와 두 번째는 유사하므로 하나만 남아야 함
         assert len(unique) == 2
 
+    def test_deduplicate_keeps_titles_of_different_length(self):
+        """길이 차이가 큰 제목은 내용이 겹쳐도 중복으로 보지 않음"""
+        from stock_analyzer.collectors.news import NewsCollector
+        from stock_analyzer.models import NewsArticle
+
+        collector = NewsCollector()
+
+        articles = [
+            NewsArticle(
+                title=title,
+                link=f"https://example.com/{i}",
+                source="테스트",
+                published_at=datetime.now(),
+            )
+            for i, title in enumerate([
+                "삼성전자 주가",
+                "삼성전자 주가 급등, 반도체 호황에 외국인 순매수 이어져",
+                "삼성전자 주가!",
+            ])
+        ]
+
+        unique = collector.deduplicate_news(articles, similarity_threshold=0.7)
+
+        assert [a.link for a in unique] == [
+            "https://example.com/0",
+            "https://example.com/1",
+        ]
+
+    def test_deduplicate_matches_all_pairs_comparison(self):
+        """bigram 색인을 써도 모든 쌍 비교와 같은 결과 (어순이 바뀐 제목 포함)"""
+        from stock_analyzer.collectors.news import NewsCollector
+        from stock_analyzer.models import NewsArticle
+
+        collector = NewsCollector()
+
+        titles = [
+            "삼성전자 반도체 실적 호조",
+            "반도체 실적 호조 삼성전자",
+            "삼성전자 실적 호조 반도체",
+            # 공통 bigram은 없지만 유사도 75%인 제목
+            "가나다라",
+            "가다나라",
+            "SK하이닉스 실적 발표",
+            "실적 발표 SK하이닉스",
+        ]
+        articles = [
+            NewsArticle(
+                title=title,
+                link=f"https://example.com/{i}",
+                source="테스트",
+                published_at=datetime.now(),
+            )
+            for i, title in enumerate(titles)
+        ]
+
+        for threshold in (0.6, 0.7, 0.8):
+            expected: list[NewsArticle] = []
+            for article in articles:
+                if all(
+                    collector._title_similarity(article.title, kept.title) < threshold
+                    for kept in expected
+                ):
+                    expected.append(article)
+
+            unique = collector.deduplicate_news(articles, similarity_threshold=threshold)
+            assert unique == expected
+
+        unique = collector.deduplicate_news(articles, similarity_threshold=0.7)
+        assert "가다나라" not in [a.title for a in unique]
+
     def test_deduplicate_max_results(self):
         """최대 결과 수 제한"""
         from stock_analyzer.collectors.news import NewsCollector
@@ -134,6 +474,52 @@ class TestNewsCollector:
 
         assert len(unique) == 10
 
+    def test_deduplicate_large_batch(self):
+        """많은 기사도 bigram 후보만 비교해 중복 제거"""
+        from stock_analyzer.collectors.news import NewsCollector
+        from stock_analyzer.models import NewsArticle
+
+        collector = NewsCollector()
+
+        titles = [f"{i}번 종목 실적 발표 {chr(0xAC00 + i)}{chr(0xAD00 + i)}" for i in range(200)]
+        articles = [
+            NewsArticle(
+                title=title + suffix,
+                link=f"https://example.com/{i}{suffix}",
+                source="테스트",
+                published_at=datetime.now(),
+            )
+            for i, title in enumerate(titles)
+            for suffix in ("", "!")
+        ]
+
+        unique = collector.deduplicate_news(articles, similarity_threshold=0.95, max_results=500)
+
+        assert [a.title for a in unique] == titles
+
+    def test_extract_source(self):
+        """URL 도메인으로 언론사 추출 (하위 도메인 포함)"""
+        from stock_analyzer.collectors.news import NewsCollector
+
+        collector = NewsCollector()
+
+        assert collector._extract_source("https://www.hankyung.com/article/1") == "한국경제"
+        assert collector._extract_source("https://n.news.naver.com/mnews/article/1") == "네이버뉴스"
+        assert collector._extract_source("https://news.kbs.co.kr/news/view.do?ncd=1") == "KBS"
+        assert collector._extract_source("https://www.example.co.kr/news/1") == "example"
+        assert collector._extract_source("") == ""
+
+    def test_clean_html(self):
+        """HTML 태그/엔티티 제거 및 공백 정리"""
+        from stock_analyzer.collectors.news import NewsCollector
+
+        collector = NewsCollector()
+
+        raw = "<b>삼성전자</b>  주가\n&quot;급등&quot;"
+        assert collector._clean_html(raw) == '삼성전자 주가 "급등"'
+        assert collector._clean_html("&lt;속보&gt; <b>삼성전자</b>") == "<속보> 삼성전자"
+        assert collector._clean_html("닫히지 않은 <b 태그") == "닫히지 않은 <b 태그"
+
     def test_title_similarity(self):
         """제목 유사도 계산"""
         from stock_analyzer.collectors.news import NewsCollector
@@ -158,6 +544,53 @@ class TestNewsCollector:
         )
         assert sim3 < 0.5
 
+    def test_search_news_pages(self):
+        """첫 페이지로 충분하면 1회만 조회, 부족하면 이후 페이지를 순서대로 병합"""
+        import json
+
+        from stock_analyzer.collectors.news import NewsCollector
+        from stock_analyzer.config import Settings
+
+        pub_date = datetime.now().strftime("%a, %d %b %Y %H:%M:%S +0900")
+
+        def fake_get(url, params, headers, timeout):
+            assert headers["X-Naver-Client-Id"] == "id"
+            start = params["start"]
+            count = 100 if start < 201 else 50
+            items = [
+                {
+                    "title": f"기사 {start + i}",
+                    "link": f"https://example.com/{start + i}",
+                    "pubDate": pub_date,
+                }
+                for i in range(count)
+            ]
+            return MagicMock(content=json.dumps({"items": items}).encode())
+
+        with patch("stock_analyzer.collectors.news.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, naver_client_id="id", naver_client_secret="secret"
+            )
+            collector = NewsCollector()
+        collector._session = MagicMock()
+        collector._session.get.side_effect = fake_get
+
+        articles = collector.search_news("삼성전자", max_results=30)
+        assert len(articles) == 30
+        assert collector._session.get.call_count == 1
+
+        articles = collector.search_news("삼성전자", max_results=1000)
+        assert len(articles) == 250
+        assert [a.title for a in articles[:2]] == ["기사 1", "기사 2"]
+        assert articles[-1].title == "기사 250"
+
+        # 기간 밖 기사가 나오면 이후 기사와 페이지는 처리하지 않음
+        pub_date = (datetime.now() - timedelta(days=400)).strftime("%a, %d %b %Y %H:%M:%S +0900")
+        collector._session.get.reset_mock()
+        articles = collector.search_news("삼성전자", months=6, max_results=1000)
+        assert articles == []
+        assert collector._session.get.call_count == 1
+
     @pytest.mark.integration
     def test_search_news(self):
         """뉴스 검색 (통합 테스트)"""
@@ -169,3 +602,84 @@ class TestNewsCollector:
         assert len(articles) > 0
         assert all(a.title for a in articles)
         assert all(a.link for a in articles)
+
+
+class TestCreateSession:
+    """수집기 HTTP 세션 테스트"""
+
+    def test_cached_session(self, tmp_path):
+        """캐시 유지 시간이 있으면 SQLite 캐시 세션, 0이면 일반 세션"""
+        from requests_cache import CachedSession
+
+        from stock_analyzer.collectors.session import POOL_MAXSIZE, create_session
+        from stock_analyzer.config import Settings
+
+        with patch("stock_analyzer.collectors.session.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, cache_dir=tmp_path, http_cache_ttl=60
+            )
+            assert isinstance(create_session(), CachedSession)
+            assert (tmp_path / "http.sqlite").exists()
+
+            mock_settings.return_value = Settings(_env_file=None, http_cache_ttl=0)
+            session = create_session()
+            assert not isinstance(session, CachedSession)
+            assert session.get_adapter("https://finance.naver.com")._pool_maxsize == POOL_MAXSIZE
+
+    def test_naver_credentials_not_cached(self, tmp_path):
+        """캐시에 저장된 요청에 네이버 인증 헤더가 남지 않음"""
+        from requests.adapters import BaseAdapter
+        from requests.models import Response
+        from urllib3 import HTTPResponse
+
+        from stock_analyzer.collectors.session import create_session
+        from stock_analyzer.config import Settings
+
+        class FakeAdapter(BaseAdapter):
+            def send(self, request, **kwargs):
+                response = Response()
+                response.status_code = 200
+                response._content = b'{"items": []}'
+                response.headers["Content-Type"] = "application/json"
+                response.raw = HTTPResponse(body=response._content, status=200)
+                response.url = request.url
+                response.request = request
+                return response
+
+            def close(self):
+                pass
+
+        with patch("stock_analyzer.collectors.session.get_settings") as mock_settings:
+            mock_settings.return_value = Settings(
+                _env_file=None, cache_dir=tmp_path, http_cache_ttl=60
+            )
+            session = create_session()
+
+        session.mount("https://", FakeAdapter())
+        session.get(
+            "https://openapi.naver.com/v1/search/news.json",
+            headers={
+                "X-Naver-Client-Id": "naver-test-id",
+                "X-Naver-Client-Secret": "naver-test-secret",
+            },
+        )
+
+        # 저장된 요청을 다시 읽어 인증 헤더 값이 남아 있지 않은지 확인
+        cached = list(session.cache.responses.values())
+        assert len(cached) == 1
+        stored_headers = cached[0].request.headers
+        assert stored_headers.get("X-Naver-Client-Id") in (None, "REDACTED")
+        assert stored_headers.get("X-Naver-Client-Secret") in (None, "REDACTED")
+
+        # SQLite 파일에도 평문이 없어야 함
+        session.close()
+        raw = (tmp_path / "http.sqlite").read_bytes()
+        assert b"naver-test-id" not in raw
+        assert b"naver-test-secret" not in raw
+
+    def test_shared_across_collectors(self):
+        """뉴스/주가 수집기가 같은 세션(커넥션 풀)을 공유"""
+        from stock_analyzer.collectors.news import NewsCollector
+        from stock_analyzer.collectors.stock_price import StockPriceCollector
+
+        assert NewsCollector()._session is StockPriceCollector()._session
@@ -1,44 +1,54 @@
 """기술적 지표 테스트"""
 
 from datetime import date, timedelta
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from stock_analyzer.indicators import technical
 from stock_analyzer.indicators.technical import TechnicalIndicatorCalculator
 from stock_analyzer.models import PriceData, SignalType, TechnicalIndicators
 
 
 def generate_price_data(count: int = 50, base_price: float = 50000) -> list[PriceData]:
     """테스트용 가격 데이터 생성"""
-    import random
-
-    random.seed(42)
-    data = []
-    price = base_price
-
-    for i in range(count):
-        change = random.uniform(-0.03, 0.03)
-        price = price * (1 + change)
-
-        high = price * random.uniform(1.0, 1.02)
-        low = price * random.uniform(0.98, 1.0)
-        open_price = random.uniform(low, high)
-
-        data.append(
-            PriceData(
-                date=date.today() - timedelta(days=count - i),
-                open=open_price,
-                high=high,
-                low=low,
-                close=price,
-                volume=random.randint(1000000, 10000000),
-                trading_value=random.uniform(1e10, 1e11),
-                change_rate=change * 100,
+    rng = np.random.default_rng(42)
+
+    changes = rng.uniform(-0.03, 0.03, count)
+    closes = base_price * np.cumprod(1 + changes)
+    highs = closes * rng.uniform(1.0, 1.02, count)
+    lows = closes * rng.uniform(0.98, 1.0, count)
+    opens = rng.uniform(lows, highs)
+    volumes = rng.integers(1000000, 10000000, count, endpoint=True)
+    trading_values = rng.uniform(1e10, 1e11, count)
+
+    start = date.today() - timedelta(days=count)
+    return [
+        PriceData(
+            date=start + timedelta(days=i),
+            open=open_price,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            trading_value=trading_value,
+            change_rate=change * 100,
+        )
+        for i, (open_price, high, low, close, volume, trading_value, change) in enumerate(
+            zip(
+                opens.tolist(),
+                highs.tolist(),
+                lows.tolist(),
+                closes.tolist(),
+                volumes.tolist(),
+                trading_values.tolist(),
+                changes.tolist(),
+                strict=True,
             )
         )
-
-    return data
+    ]
 
 
 class TestTechnicalIndicatorCalculator:
@@ -91,6 +101,64 @@ class TestTechnicalIndicatorCalculator:
         assert len(indicators) == len(price_data)
         assert all(isinstance(ind, TechnicalIndicators) for ind in indicators)
 
+    @pytest.mark.parametrize("count", [5, 30, 120])
+    def test_calculate_all_matches_talib(self, count):
+        """단일 순회 커널 결과가 개별 TA-Lib 계산과 일치"""
+        calculator = TechnicalIndicatorCalculator()
+        price_data = generate_price_data(count)
+        close = pd.Series([p.close for p in price_data])
+
+        expected = [
+            calculator.calculate_rsi(close),
+            *calculator.calculate_trix(close),
+            *calculator.calculate_macd(close),
+        ]
+        indicators = calculator.calculate_all(price_data)
+        fields = ["rsi", "trix", "trix_signal", "macd", "macd_signal", "macd_histogram"]
+
+        for field, series in zip(fields, expected, strict=True):
+            actual = [getattr(ind, field) for ind in indicators]
+            np.testing.assert_allclose(
+                np.array(actual, dtype=np.float64),
+                series.to_numpy(dtype=np.float64),
+                rtol=1e-9,
+                equal_nan=True,
+            )
+
+    def test_calculate_all_from_start(self):
+        """start 이후 지표만 생성하되 값은 전체 데이터 기준"""
+        calculator = TechnicalIndicatorCalculator()
+        price_data = generate_price_data(80)
+        start = price_data[50].date
+
+        full = calculator.calculate_all(price_data)
+        partial = calculator.calculate_all(price_data, start=start)
+
+        assert partial == full[50:]
+
+    def test_calculate_last_two(self):
+        """시그널용 마지막 2일 지표"""
+        calculator = TechnicalIndicatorCalculator()
+        price_data = generate_price_data(80)
+
+        last_two = calculator.calculate_last_two(price_data)
+
+        assert last_two == calculator.calculate_all(price_data)[-2:]
+        assert calculator.calculate_last_two([]) == []
+
+    def test_same_close_computed_once(self):
+        """같은 종가 배열은 지표 커널을 한 번만 실행"""
+        calculator = TechnicalIndicatorCalculator()
+        price_data = generate_price_data(60)
+        technical._cached_columns.cache_clear()
+
+        with patch.object(technical, "compute_all", wraps=technical.compute_all) as kernel:
+            calculator.calculate_all(price_data)
+            calculator.calculate_last_two(price_data)
+
+        assert kernel.call_count == 1
+        technical._cached_columns.cache_clear()
+
     def test_generate_rsi_buy_signal(self):
         """RSI 매수 시그널 생성 (과매도)"""
         calculator = TechnicalIndicatorCalculator()
@@ -171,6 +239,23 @@ class TestTechnicalIndicatorCalculator:
         assert len(macd_signals) == 1
         assert macd_signals[0].signal == SignalType.SELL
 
+    def test_generate_signals_all_matches_pairwise(self):
+        """전체 기간 시그널이 날짜별 generate_signals 결과와 일치"""
+        calculator = TechnicalIndicatorCalculator()
+        price_data = generate_price_data(250)
+        indicators = calculator.calculate_all(price_data)
+
+        expected = [
+            (indicators[i].date, signal)
+            for i in range(1, len(indicators))
+            for signal in calculator.generate_signals(indicators[i - 1 : i + 1])
+        ]
+        actual = calculator.generate_signals_all(price_data)
+
+        assert expected
+        assert actual == expected
+        assert calculator.generate_signals_all(price_data[:1]) == []
+
     def test_empty_price_data(self):
         """빈 데이터 처리"""
         calculator = TechnicalIndicatorCalculator()
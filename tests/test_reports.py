@@ -2,7 +2,6 @@
 
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -19,42 +18,44 @@ from stock_analyzer.models import (
 )
 from stock_analyzer.reports.generator import ReportGenerator
 
+# 샘플 리포트 기준 시각 (실행 시점과 무관하게 같은 리포트를 만들기 위해 고정)
+_FIXED_NOW = datetime(2024, 12, 25, 9, 0, 0)
+_FIXED_TODAY = _FIXED_NOW.date()
+
 
 def create_sample_report() -> StockReport:
     """테스트용 샘플 리포트 생성"""
-    end_date = date.today()
+    end_date = _FIXED_TODAY
     start_date = end_date - timedelta(days=30)
 
     # 가격 데이터
-    price_data = []
-    for i in range(30):
-        price_data.append(
-            PriceData(
-                date=start_date + timedelta(days=i),
-                open=50000 + i * 100,
-                high=51000 + i * 100,
-                low=49000 + i * 100,
-                close=50500 + i * 100,
-                volume=1000000 + i * 10000,
-                trading_value=5e10 + i * 1e9,
-                change_rate=0.5,
-            )
+    price_data = [
+        PriceData(
+            date=start_date + timedelta(days=i),
+            open=50000 + i * 100,
+            high=51000 + i * 100,
+            low=49000 + i * 100,
+            close=50500 + i * 100,
+            volume=1000000 + i * 10000,
+            trading_value=5e10 + i * 1e9,
+            change_rate=0.5,
         )
+        for i in range(30)
+    ]
 
     # 기술적 지표
-    indicators = []
-    for i, p in enumerate(price_data):
-        indicators.append(
-            TechnicalIndicators(
-                date=p.date,
-                rsi=50 + i * 0.5 if i >= 14 else None,
-                trix=0.01 * (i - 15) if i >= 15 else None,
-                trix_signal=0.005 * (i - 15) if i >= 15 else None,
-                macd=100 * (i - 26) if i >= 26 else None,
-                macd_signal=50 * (i - 26) if i >= 26 else None,
-                macd_histogram=50 * (i - 26) if i >= 26 else None,
-            )
+    indicators = [
+        TechnicalIndicators(
+            date=p.date,
+            rsi=50 + i * 0.5 if i >= 14 else None,
+            trix=0.01 * (i - 15) if i >= 15 else None,
+            trix_signal=0.005 * (i - 15) if i >= 15 else None,
+            macd=100 * (i - 26) if i >= 26 else None,
+            macd_signal=50 * (i - 26) if i >= 26 else None,
+            macd_histogram=50 * (i - 26) if i >= 26 else None,
         )
+        for i, p in enumerate(price_data)
+    ]
 
     # 시그널
     signals = [
@@ -96,14 +97,14 @@ def create_sample_report() -> StockReport:
             title="삼성전자 반도체 호황 전망",
             link="https://example.com/1",
             source="테스트뉴스",
-            published_at=datetime.now(),
+            published_at=_FIXED_NOW,
             summary="반도체 시장 호황이 예상됩니다.",
         ),
         NewsArticle(
             title="삼성전자 AI 반도체 수요 급증",
             link="https://example.com/2",
             source="테스트뉴스",
-            published_at=datetime.now() - timedelta(days=1),
+            published_at=_FIXED_NOW - timedelta(days=1),
         ),
     ]
 
@@ -124,12 +125,52 @@ def create_sample_report() -> StockReport:
         financials=financials,
         news=news,
         ai_analysis=ai_analysis,
-        generated_at=datetime.now(),
+        generated_at=_FIXED_NOW,
         period_start=start_date,
         period_end=end_date,
     )
 
 
+def assert_valid_pdf(pdf_path: Path) -> None:
+    """생성된 PDF 확인 (stat 한 번으로 존재 여부와 크기를 함께 검사)"""
+    assert pdf_path.suffix == ".pdf"
+    assert pdf_path.stat().st_size > 0
+
+
+@pytest.fixture(scope="module")
+def sample_report_base() -> StockReport:
+    """모듈 전체에서 한 번만 만드는 샘플 리포트 (직접 수정하지 말 것)"""
+    return create_sample_report()
+
+
+@pytest.fixture
+def sample_report(sample_report_base: StockReport) -> StockReport:
+    """테스트별 샘플 리포트 (얕은 복사본이라 필드를 바꿔도 원본은 그대로)"""
+    return sample_report_base.model_copy()
+
+
+@pytest.fixture(scope="module")
+def generator() -> ReportGenerator:
+    """모듈 전체에서 공유하는 리포트 생성기 (호출 간 상태 없음)"""
+    return ReportGenerator()
+
+
+@pytest.fixture(scope="module")
+def cached_price_chart(generator: ReportGenerator, sample_report_base: StockReport) -> str:
+    """실제 렌더러로 한 번만 그린 가격 차트"""
+    return generator._create_price_chart(sample_report_base.price_data)
+
+
+@pytest.fixture
+def cached_charts(monkeypatch: pytest.MonkeyPatch, cached_price_chart: str) -> None:
+    """PDF 테스트에서 차트를 매번 다시 그리지 않고 캐시된 결과 사용"""
+    monkeypatch.setattr(
+        ReportGenerator,
+        "_create_price_chart",
+        lambda self, price_data: cached_price_chart if price_data else "",
+    )
+
+
 class TestReportGenerator:
     """리포트 생성기 테스트"""
 
@@ -153,91 +194,59 @@ class TestReportGenerator:
         test_date = date(2024, 12, 25)
         assert ReportGenerator._format_date(test_date) == "2024-12-25"
 
-    def test_create_price_chart(self):
+    def test_create_price_chart(self, generator, sample_report_base):
         """가격 차트 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-
-        chart = generator._create_price_chart(report.price_data)
+        chart = generator._create_price_chart(sample_report_base.price_data)
 
         assert chart.startswith("data:image/png;base64,")
         assert len(chart) > 100
 
-    def test_create_price_chart_empty(self):
+    def test_create_price_chart_empty(self, generator):
         """빈 데이터 차트"""
-        generator = ReportGenerator()
-
         chart = generator._create_price_chart([])
         assert chart == ""
 
-    def test_create_indicator_chart(self):
+    def test_create_indicator_chart(self, generator, sample_report_base):
         """지표 차트 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-
-        chart = generator._create_indicator_chart(report.indicators)
+        chart = generator._create_indicator_chart(sample_report_base.indicators)
 
         assert chart.startswith("data:image/png;base64,")
         assert len(chart) > 100
 
-    def test_create_indicator_chart_empty(self):
+    def test_create_indicator_chart_empty(self, generator):
         """빈 지표 차트"""
-        generator = ReportGenerator()
-
         chart = generator._create_indicator_chart([])
         assert chart == ""
 
-    def test_generate_pdf(self, tmp_path):
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("cached_charts")
+    def test_generate_pdf(self, generator, sample_report, tmp_path):
         """PDF 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-
-        pdf_path = generator.generate_pdf(report, tmp_path)
+        pdf_path = generator.generate_pdf(sample_report, tmp_path)
 
-        assert pdf_path.exists()
-        assert pdf_path.suffix == ".pdf"
-        assert pdf_path.stat().st_size > 0
+        assert_valid_pdf(pdf_path)
 
-    def test_generate_pdf_filename_format(self, tmp_path):
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("cached_charts")
+    def test_generate_pdf_filename_format(self, generator, sample_report, tmp_path):
         """PDF 파일명 형식"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-
-        pdf_path = generator.generate_pdf(report, tmp_path)
+        pdf_path = generator.generate_pdf(sample_report, tmp_path)
 
         # 파일명 형식: {종목코드}_{기간}_{날짜}.pdf
-        assert report.stock_info.code in pdf_path.stem
+        assert sample_report.stock_info.code in pdf_path.stem
         assert pdf_path.suffix == ".pdf"
 
-    def test_generate_pdf_without_ai(self, tmp_path):
-        """AI 분석 없는 PDF 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-        report.ai_analysis = None
-
-        pdf_path = generator.generate_pdf(report, tmp_path)
-
-        assert pdf_path.exists()
-        assert pdf_path.stat().st_size > 0
-
-    def test_generate_pdf_without_financials(self, tmp_path):
-        """재무 데이터 없는 PDF 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-        report.financials = []
-
-        pdf_path = generator.generate_pdf(report, tmp_path)
-
-        assert pdf_path.exists()
-        assert pdf_path.stat().st_size > 0
-
-    def test_generate_pdf_without_signals(self, tmp_path):
-        """시그널 없는 PDF 생성"""
-        generator = ReportGenerator()
-        report = create_sample_report()
-        report.signals = []
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("cached_charts")
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("ai_analysis", None), ("financials", []), ("signals", [])],
+        ids=["without_ai", "without_financials", "without_signals"],
+    )
+    def test_generate_pdf_missing_section(self, generator, sample_report, tmp_path, field, value):
+        """일부 섹션이 비어 있는 PDF 생성"""
+        setattr(sample_report, field, value)
 
-        pdf_path = generator.generate_pdf(report, tmp_path)
+        pdf_path = generator.generate_pdf(sample_report, tmp_path)
 
-        assert pdf_path.exists()
-        assert pdf_path.stat().st_size > 0
+        assert_valid_pdf(pdf_path)